@@ -25,19 +25,22 @@ Usage:
     replicate_input = input.to_replicate()
 """
 
-from app.core.ai_models.base import (
-    ModelCapability,
-    ModelCategory,
-    ModelDefinition,
-    ModelInput,
-    Provider,
-)
-from app.core.ai_models.common import AspectRatio, OutputFormat
-from app.core.ai_models.registry import (
-    discover_models,
-    ensure_models_registered,
-    model_registry,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.core.ai_models.base import (
+        ModelCapability,
+        ModelCategory,
+        ModelDefinition,
+        ModelInput,
+        Provider,
+    )
+    from app.core.ai_models.common import AspectRatio, OutputFormat
+    from app.core.ai_models.registry import (
+        discover_models,
+        ensure_models_registered,
+        model_registry,
+    )
 
 __all__ = [
     # Common types
@@ -54,3 +57,31 @@ __all__ = [
     'discover_models',
     'ensure_models_registered',
 ]
+
+# PEP 562 lazy exports: importing a submodule like ai_models.common no longer
+# drags in the pydantic-heavy base and registry modules.
+_EXPORT_MODULES = {
+    'AspectRatio': 'app.core.ai_models.common',
+    'OutputFormat': 'app.core.ai_models.common',
+    'Provider': 'app.core.ai_models.base',
+    'ModelCategory': 'app.core.ai_models.base',
+    'ModelCapability': 'app.core.ai_models.base',
+    'ModelDefinition': 'app.core.ai_models.base',
+    'ModelInput': 'app.core.ai_models.base',
+    'model_registry': 'app.core.ai_models.registry',
+    'discover_models': 'app.core.ai_models.registry',
+    'ensure_models_registered': 'app.core.ai_models.registry',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _EXPORT_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_path), name)
+    # Cache on the module so __getattr__ only runs once per name
+    globals()[name] = value
+    return value
@@ -2,11 +2,22 @@
 
 from abc import abstractmethod
 from enum import Enum
+from functools import cache
 from typing import Any, ClassVar
 
 from pydantic import BaseModel, Field
 
 
+@cache
+def _input_field_names(model_cls: type['ModelInput']) -> frozenset[str]:
+    """Field names of an input class, computed once per class.
+
+    Hot activity paths probe several optional fields per call; a frozenset
+    avoids touching pydantic's FieldInfo mapping each time.
+    """
+    return frozenset(model_cls.model_fields)
+
+
 class Provider(str, Enum):
     """Supported AI providers."""
 
@@ -118,6 +129,19 @@ class ModelDefinition(BaseModel):
         """Get list of supported providers."""
         return list(self.provider_configs.keys())
 
+    @property
+    def replicate_config(self) -> ProviderConfig | None:
+        """Replicate configuration, or None when not offered there.
+
+        One dict lookup for the overwhelmingly common provider check,
+        instead of a supports_provider + get_provider_config pair.
+        """
+        return self.provider_configs.get(Provider.REPLICATE)
+
+    def input_field_names(self) -> frozenset[str]:
+        """Get this model's input field names (cached per input class)."""
+        return _input_field_names(self.input_class)
+
     def supports_provider(self, provider: Provider) -> bool:
         """Check if this model supports a provider."""
         return provider in self.provider_configs
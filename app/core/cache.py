@@ -0,0 +1,83 @@
+"""In-process TTL + LRU cache shared across services and activities.
+
+A single bounded cache class keyed by hashable tuples. Used anywhere a
+recent result can stand in for an expensive upstream call (rewrite POSTs,
+LLM completions) within a short freshness window. SingleFlight complements
+it by coalescing concurrent identical calls before any result is cached.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+V = TypeVar('V')
+
+
+class TTLCache(Generic[V]):
+    """Bounded TTL + LRU cache keyed by hashable tuples."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 600.0) -> None:
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+
+    def get(self, key: Hashable) -> V | None:
+        """Return the cached value for a key, or None if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > self._ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Store a value, evicting least-recently-used entries past the cap."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+class SingleFlight(Generic[V]):
+    """Coalesce concurrent calls with the same key into one execution.
+
+    The first caller for a key runs the coroutine; callers arriving while it
+    is in flight await the same future and share its result (or exception).
+    Catches the window a response cache misses: N identical requests landing
+    before the first one has finished still cost one upstream call.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future[V]] = {}
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[V]]) -> V:
+        """Run func for this key, or await the identical call already in flight.
+
+        Args:
+            key: Hashable identity of the request
+            func: Zero-argument coroutine function performing the call
+
+        Returns:
+            The shared result for this key
+        """
+        existing = self._inflight.get(key)
+        if existing is not None:
+            return await existing
+
+        future: asyncio.Future[V] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await func()
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved so a waiterless future doesn't warn at GC
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
@@ -34,6 +34,14 @@ class AppConfig(BaseConfig):
     OPENAI_API_KEY: str | None = None
     GEMINI_API_KEY: str | None = None
 
+    # Voice provider HTTP timeouts (seconds), split by stage: connect is kept
+    # short so stuck handshakes fail fast, while read stays long enough for
+    # legitimate TTS streams.
+    VOICE_TIMEOUT_CONNECT: float = 5.0
+    VOICE_TIMEOUT_READ: float = 120.0
+    VOICE_TIMEOUT_WRITE: float = 60.0
+    VOICE_TIMEOUT_POOL: float = 5.0
+
     # LiteLLM Configuration
     LITELLM_PRIMARY_MODEL: str = 'gemini/gemini-2.0-flash'
     LITELLM_FALLBACK_MODEL: str = 'openai/gpt-5-nano'
@@ -49,12 +57,20 @@ class AppConfig(BaseConfig):
     S3_ENDPOINT_URL: str | None = None
     S3_PUBLIC_URL_BASE: str | None = None
 
+    # Multipart upload tuning. Single-connection S3 throughput plateaus around
+    # 16-50 MiB parts, so 50 MiB is the default; larger parts cost more memory
+    # per in-flight request (peak ~= part size x concurrency).
+    S3_PART_SIZE_MB: int = 50
+    S3_UPLOAD_CONCURRENCY: int = 8
+
     # R2 Storage (Cloudflare R2)
     R2_BUCKET: str | None = None
     R2_ENDPOINT_URL: str | None = None
     R2_ACCESS_KEY_ID: str | None = None
     R2_SECRET_ACCESS_KEY: str | None = None
     R2_PUBLIC_BASE_URL: str | None = None
+    R2_PART_SIZE_MB: int = 50
+    R2_UPLOAD_CONCURRENCY: int = 8
 
     @computed_field  # type: ignore[misc]
     @property
@@ -0,0 +1,40 @@
+"""Shared HTTP client configuration and singleton.
+
+Outbound HTTP calls should reuse one pooled client per process so TLS
+keepalive connections survive across requests instead of each call paying
+a fresh handshake. Services that need their own base URL or auth headers
+should at least reuse these pool limits and timeouts.
+"""
+
+import httpx
+
+# Generous connection pool: workers fan out to many providers concurrently.
+POOL_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+
+# Short connect timeout so stuck handshakes fail fast; long read timeout for
+# large media downloads and streaming TTS responses.
+DEFAULT_TIMEOUT = httpx.Timeout(120.0, connect=10.0, read=120.0, pool=5.0)
+
+class _ClientHolder:
+    """Holder for the singleton pooled client instance."""
+
+    instance: httpx.AsyncClient | None = None
+
+
+def get_shared_async_client() -> httpx.AsyncClient:
+    """Get the process-wide pooled httpx client (singleton)."""
+    if _ClientHolder.instance is None:
+        _ClientHolder.instance = httpx.AsyncClient(
+            limits=POOL_LIMITS,
+            timeout=DEFAULT_TIMEOUT,
+            follow_redirects=True,
+            http2=True,
+        )
+    return _ClientHolder.instance
+
+
+async def close_shared_async_client() -> None:
+    """Close the shared client at app shutdown."""
+    if _ClientHolder.instance is not None:
+        await _ClientHolder.instance.aclose()
+        _ClientHolder.instance = None
@@ -4,7 +4,7 @@ Provides a unified interface for LLM completions with automatic
 fallback from primary to secondary model on failures.
 """
 
-from app.core.providers.litellm.client import LiteLLMClient
+from app.core.providers.litellm.client import LiteLLMClient, get_litellm_client
 from app.core.providers.litellm.schemas import (
     CompletionRequest,
     CompletionResponse,
@@ -16,6 +16,7 @@ from app.core.providers.litellm.schemas import (
 
 __all__ = [
     'LiteLLMClient',
+    'get_litellm_client',
     'CompletionRequest',
     'CompletionResponse',
     'FallbackConfig',
@@ -20,8 +20,11 @@ Example:
     )
 """
 
+import asyncio
 import json
 import os
+from collections.abc import Callable
+from functools import cache
 from typing import Any
 
 from pydantic import BaseModel
@@ -36,6 +39,33 @@ from app.core.providers.litellm.schemas import (
     UsageInfo,
 )
 
+# Batch polling starts fast (cheap batches often finish in minutes) and backs
+# off toward the cap so a 24h window doesn't hammer the API
+_BATCH_POLL_INITIAL_SECONDS = 10.0
+_BATCH_POLL_MAX_SECONDS = 300.0
+_BATCH_TERMINAL_STATUSES = frozenset({'completed', 'failed', 'expired', 'cancelled'})
+
+
+@cache
+def _schema_response_format(response_schema: type[BaseModel]) -> dict[str, Any]:
+    """Build the strict json_schema response_format for a model (cached per class)."""
+    return {
+        'type': 'json_schema',
+        'json_schema': {
+            'name': response_schema.__name__,
+            'strict': True,
+            'schema': response_schema.model_json_schema(),
+        },
+    }
+
+
+@cache
+def _batch_api_client() -> Any:
+    """Build the OpenAI SDK client used for Batch API calls (once per process)."""
+    import openai
+
+    return openai.AsyncOpenAI(api_key=app_config.OPENAI_API_KEY)
+
 
 class LiteLLMClient:
     """Async client for LiteLLM with fallback support.
@@ -77,6 +107,7 @@ class LiteLLMClient:
         self,
         messages: list[Message] | None = None,
         request: CompletionRequest | None = None,
+        response_schema: type[BaseModel] | None = None,
         **kwargs: Any,
     ) -> CompletionResponse:
         """Generate a completion with automatic fallback.
@@ -84,6 +115,8 @@ class LiteLLMClient:
         Args:
             messages: List of messages (alternative to request)
             request: Full completion request
+            response_schema: Pydantic model enforced via strict Structured
+                Outputs; the response is guaranteed to match its JSON schema
             **kwargs: Additional arguments passed to CompletionRequest
 
         Returns:
@@ -113,7 +146,7 @@ class LiteLLMClient:
         model = request.model or self._primary_model
 
         try:
-            return await self._complete_with_model(request, model, fallback_used=False)
+            return await self._complete_with_model(request, model, fallback_used=False, response_schema=response_schema)
         except Exception as primary_error:
             if not self._fallback_config.enabled:
                 raise
@@ -124,7 +157,9 @@ class LiteLLMClient:
             # Try fallback model
             fallback_model = self._fallback_config.fallback_model
             try:
-                return await self._complete_with_model(request, fallback_model, fallback_used=True)
+                return await self._complete_with_model(
+                    request, fallback_model, fallback_used=True, response_schema=response_schema
+                )
             except Exception as fallback_error:
                 # Both failed, raise the original error with context
                 raise RuntimeError(
@@ -193,11 +228,98 @@ class LiteLLMClient:
 
         return parsed
 
+    async def complete_batch(
+        self,
+        request: CompletionRequest,
+        on_poll: Callable[[], None] | None = None,
+    ) -> CompletionResponse:
+        """Run a completion through the OpenAI Batch API.
+
+        Batched requests cost half the synchronous price in exchange for a
+        completion window of up to 24 hours, so this is only for work that
+        doesn't need an interactive answer. Polls with exponential backoff
+        until the batch reaches a terminal state.
+
+        Args:
+            request: Completion request (OpenAI models only)
+            on_poll: Called after each status poll - pass activity.heartbeat
+                so Temporal knows the long wait is alive
+
+        Returns:
+            CompletionResponse with generated content
+        """
+        model = (request.model or self._primary_model).removeprefix('openai/')
+        if '/' in model:
+            raise ValueError(f'batch_mode is only supported for OpenAI models, got {model!r}')
+
+        body: dict[str, Any] = {
+            'model': model,
+            'messages': [{'role': msg.role.value, 'content': msg.content} for msg in request.messages],
+            'temperature': request.temperature,
+            'max_tokens': request.max_tokens,
+        }
+        if request.json_mode:
+            body['response_format'] = {'type': 'json_object'}
+
+        line = json.dumps(
+            {'custom_id': 'request-0', 'method': 'POST', 'url': '/v1/chat/completions', 'body': body}
+        )
+
+        client = _batch_api_client()
+        input_file = await client.files.create(file=('batch.jsonl', line.encode()), purpose='batch')
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint='/v1/chat/completions',
+            completion_window='24h',
+        )
+
+        delay = _BATCH_POLL_INITIAL_SECONDS
+        while batch.status not in _BATCH_TERMINAL_STATUSES:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _BATCH_POLL_MAX_SECONDS)
+            batch = await client.batches.retrieve(batch.id)
+            if on_poll is not None:
+                on_poll()
+
+        if batch.status != 'completed' or not batch.output_file_id:
+            raise RuntimeError(f'Batch {batch.id} finished with status {batch.status!r}')
+
+        output = await client.files.content(batch.output_file_id)
+        row = json.loads(output.text.splitlines()[0])
+        response_body = (row.get('response') or {}).get('body') or {}
+        if row.get('error') or not response_body:
+            raise RuntimeError(f'Batch {batch.id} request failed: {row.get("error")}')
+
+        content = response_body['choices'][0]['message']['content'] or ''
+
+        parsed = None
+        if request.json_mode:
+            try:
+                parsed = json.loads(content)
+            except json.JSONDecodeError:
+                pass
+
+        usage_data = response_body.get('usage') or {}
+        usage = UsageInfo(
+            prompt_tokens=usage_data.get('prompt_tokens', 0),
+            completion_tokens=usage_data.get('completion_tokens', 0),
+            total_tokens=usage_data.get('total_tokens', 0),
+        )
+
+        return CompletionResponse(
+            content=content,
+            model=model,
+            usage=usage,
+            fallback_used=False,
+            parsed=parsed,
+        )
+
     async def _complete_with_model(
         self,
         request: CompletionRequest,
         model: str,
         fallback_used: bool,
+        response_schema: type[BaseModel] | None = None,
     ) -> CompletionResponse:
         """Execute completion with a specific model."""
         # Import litellm here to avoid import issues
@@ -216,7 +338,11 @@ class LiteLLMClient:
             'num_retries': self._fallback_config.max_retries,
         }
 
-        if request.json_mode:
+        if response_schema is not None:
+            # Strict schema adherence: the provider constrains decoding to the
+            # schema, so downstream code needs no defensive parsing
+            kwargs['response_format'] = _schema_response_format(response_schema)
+        elif request.json_mode:
             kwargs['response_format'] = {'type': 'json_object'}
 
         # Make the async call
@@ -227,7 +353,7 @@ class LiteLLMClient:
 
         # Parse JSON if requested
         parsed = None
-        if request.json_mode:
+        if request.json_mode or response_schema is not None:
             try:
                 parsed = json.loads(content)
             except json.JSONDecodeError:
@@ -273,12 +399,21 @@ class LiteLLMClient:
         return any(indicator in error_str for indicator in transient_indicators)
 
 
+@cache
+def _default_client() -> LiteLLMClient:
+    """Build the default-configured client once per process."""
+    return LiteLLMClient()
+
+
 def get_litellm_client(
     primary_model: str | None = None,
     fallback_config: FallbackConfig | None = None,
 ) -> LiteLLMClient:
     """Factory function to create a LiteLLM client.
 
+    Calls without overrides share a single process-wide instance, skipping
+    repeated config reads and API-key environment setup per activity.
+
     Args:
         primary_model: Override default primary model
         fallback_config: Custom fallback configuration
@@ -286,6 +421,8 @@ def get_litellm_client(
     Returns:
         Configured LiteLLMClient instance
     """
+    if primary_model is None and fallback_config is None:
+        return _default_client()
     return LiteLLMClient(
         primary_model=primary_model,
         fallback_config=fallback_config,
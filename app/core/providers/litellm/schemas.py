@@ -46,6 +46,10 @@ class CompletionRequest(BaseModel):
     max_tokens: int = Field(2048, ge=1, description='Maximum tokens to generate')
     json_mode: bool = Field(False, description='Request JSON output format')
     timeout: int | None = Field(None, description='Request timeout in seconds')
+    batch_mode: bool = Field(
+        False,
+        description='Route through the OpenAI Batch API (half price, up to 24h latency). OpenAI models only.',
+    )
 
 
 class UsageInfo(BaseModel):
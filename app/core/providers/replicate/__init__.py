@@ -1,6 +1,6 @@
 """Replicate provider client."""
 
-from app.core.providers.replicate.client import ReplicateClient
+from app.core.providers.replicate.client import ReplicateClient, get_replicate_client
 from app.core.providers.replicate.schemas import (
     ModelInfo,
     ReplicatePrediction,
@@ -12,4 +12,5 @@ __all__ = [
     'ReplicateClient',
     'ReplicatePrediction',
     'ReplicatePredictionStatus',
+    'get_replicate_client',
 ]
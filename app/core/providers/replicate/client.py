@@ -1,6 +1,9 @@
 """Replicate client - native async wrapper around the official replicate package."""
 
+import asyncio
+from collections.abc import Callable
 from datetime import datetime
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 import replicate
@@ -42,16 +45,30 @@ class ReplicateClient:
         self,
         model: str,
         input: dict[str, Any],
+        *,
         wait: bool = True,
-        poll_interval: float = 1.0,  # Not used with native async, kept for compatibility
+        poll_interval: float = 1.0,
+        poll_interval_max: float = 15.0,
+        poll_multiplier: float = 1.5,
+        on_poll: Callable[[], Any] | None = None,
     ) -> ReplicatePrediction:
         """Run a model and optionally wait for completion.
 
+        Waiting is an explicit poll loop rather than the library's
+        async_wait, which re-fetches every 0.5s regardless of how long the
+        model takes. The interval backs off geometrically from poll_interval
+        to poll_interval_max: fast jobs are picked up within a second or
+        two while long video renders settle into sparse polls instead of a
+        fixed-rate request stream.
+
         Args:
             model: Model identifier (e.g., 'owner/model' or 'owner/model:version')
             input: Model-specific input parameters
             wait: If True, wait for completion
-            poll_interval: Deprecated, kept for API compatibility
+            poll_interval: Initial seconds between status polls
+            poll_interval_max: Ceiling for the backed-off interval
+            poll_multiplier: Interval growth factor per poll
+            on_poll: Optional callback invoked after each poll while waiting
 
         Returns:
             ReplicatePrediction with output and metadata
@@ -61,13 +78,15 @@ class ReplicateClient:
         if not wait:
             return prediction
 
-        # Use native async wait
-        raw_prediction = await self._client.predictions.async_get(prediction.id)
-        while raw_prediction.status not in ('succeeded', 'failed', 'canceled'):
-            await raw_prediction.async_wait()
+        interval = poll_interval
+        while True:
             raw_prediction = await self._client.predictions.async_get(prediction.id)
-
-        return self._convert_prediction(raw_prediction)
+            if raw_prediction.status in ('succeeded', 'failed', 'canceled'):
+                return self._convert_prediction(raw_prediction)
+            if on_poll is not None:
+                on_poll()
+            await asyncio.sleep(interval)
+            interval = min(interval * poll_multiplier, poll_interval_max)
 
     async def run_simple(
         self,
@@ -180,3 +199,14 @@ class ReplicateClient:
         if isinstance(value, str):
             return datetime.fromisoformat(value.replace('Z', '+00:00'))
         return None
+
+
+@cache
+def get_replicate_client() -> ReplicateClient:
+    """Get the shared process-wide Replicate client.
+
+    The underlying replicate.Client owns an HTTP connection pool; sharing
+    one instance across activity invocations reuses keep-alive connections
+    to api.replicate.com instead of paying a TLS handshake per call.
+    """
+    return ReplicateClient()
@@ -2,6 +2,7 @@ from app.core.services.ffmpeg.schemas import (
     CombineAudioInput,
     CombineAudioOutput,
     FFmpegResult,
+    HwAccel,
     SlowDownInput,
     SlowDownOutput,
     TextFont,
@@ -21,6 +22,7 @@ __all__ = [
     'CombineAudioOutput',
     'FFmpegResult',
     'FFmpegService',
+    'HwAccel',
     'SlowDownInput',
     'SlowDownOutput',
     'TextFont',
@@ -3,11 +3,25 @@
 All Pydantic models for FFmpeg video processing operations.
 """
 
-from enum import Enum
+from enum import Enum, StrEnum
 
 from pydantic import BaseModel, Field
 
 
+class HwAccel(StrEnum):
+    """Hardware acceleration backend for video encoding.
+
+    AUTO probes the local FFmpeg build once and picks the best available
+    backend; NONE forces the libx264 software encoder.
+    """
+
+    AUTO = 'auto'
+    CUDA = 'cuda'
+    QSV = 'qsv'
+    VIDEOTOOLBOX = 'videotoolbox'
+    NONE = 'none'
+
+
 class TextPosition(str, Enum):
     """Position for text overlay on video."""
 
@@ -62,10 +76,11 @@ class FFmpegResult(BaseModel):
 class SlowDownInput(BaseModel):
     """Input for slow down video operation."""
 
-    input_path: str = Field(..., description='Path to input video file')
+    input_path: str = Field(..., description='Path or URL of input video')
     output_path: str = Field(..., description='Path for output video file')
     speed_factor: float = Field(0.5, gt=0, le=4.0, description='Speed factor (0.5 = half speed)')
     preserve_audio: bool = Field(False, description='Adjust audio speed too or remove it')
+    hw_accel: HwAccel = Field(HwAccel.AUTO, description='Hardware encoder backend')
 
 
 class SlowDownOutput(BaseModel):
@@ -91,7 +106,7 @@ class TextOverlayInput(BaseModel):
     - Lower font_scale_factor = bigger text
     """
 
-    input_path: str = Field(..., description='Path to input video file')
+    input_path: str = Field(..., description='Path or URL of input video')
     output_path: str = Field(..., description='Path for output video file')
     text: str = Field(..., description='Text to overlay on video')
     position: TextPosition = Field(TextPosition.CENTER, description='Text position')
@@ -119,6 +134,9 @@ class TextOverlayInput(BaseModel):
     line_spacing: int = Field(0, ge=0, description='Spacing between wrapped lines')
     max_chars_per_line: int = Field(28, ge=10, le=60, description='Max characters per line for wrapping')
 
+    # Encoding
+    hw_accel: HwAccel = Field(HwAccel.AUTO, description='Hardware encoder backend')
+
 
 class TextOverlayOutput(BaseModel):
     """Output from text overlay operation."""
@@ -134,8 +152,8 @@ class TextOverlayOutput(BaseModel):
 class CombineAudioInput(BaseModel):
     """Input for combining video with audio."""
 
-    video_path: str = Field(..., description='Path to input video file')
-    audio_path: str = Field(..., description='Path to input audio file')
+    video_path: str = Field(..., description='Path or URL of input video')
+    audio_path: str = Field(..., description='Path or URL of input audio')
     output_path: str = Field(..., description='Path for output video file')
     replace_audio: bool = Field(True, description='Replace existing audio or mix')
 
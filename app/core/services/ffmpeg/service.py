@@ -5,10 +5,12 @@ Uses the local FFmpeg binary for video processing.
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator
 
 from app.core.services.ffmpeg.schemas import (
     CombineAudioInput,
     CombineAudioOutput,
+    HwAccel,
     SlowDownInput,
     SlowDownOutput,
     TextOverlayInput,
@@ -19,6 +21,135 @@ from app.core.services.ffmpeg.schemas import (
 logger = logging.getLogger(__name__)
 
 
+def _input_args(source: str) -> list[str]:
+    """Build the input arguments for a local path or an HTTP(S) URL.
+
+    FFmpeg's HTTP demuxer reads https:// sources directly, which skips the
+    download-to-temp-file leg entirely. The reconnect flags make mid-stream
+    CDN hiccups retry instead of failing the whole job.
+    """
+    if source.startswith(('http://', 'https://')):
+        return [
+            '-reconnect',
+            '1',
+            '-reconnect_streamed',
+            '1',
+            '-reconnect_delay_max',
+            '5',
+            '-i',
+            source,
+        ]
+    return ['-i', source]
+
+
+def _output_args(output_path: str) -> list[str]:
+    """Build the output arguments for a file path or stdout pipe target.
+
+    The MP4 muxer normally needs a seekable output to write its moov atom
+    at the end; fragmented MP4 ('frag_keyframe+empty_moov') uses a
+    streamable layout so the muxer can write to pipe:1.
+    """
+    if output_path == 'pipe:1':
+        return ['-movflags', 'frag_keyframe+empty_moov', '-f', 'mp4', '-y', output_path]
+    return ['-y', output_path]
+
+
+# Read size for streaming FFmpeg stdout
+_PIPE_CHUNK_SIZE = 1024 * 1024
+
+
+# Encoder arguments per hardware backend. Quality targets are matched to
+# libx264's default CRF 23; NVENC uses -cq and QSV -global_quality for the
+# equivalent constant-quality mode.
+_CODEC_ARGS = {
+    HwAccel.CUDA: ['-c:v', 'h264_nvenc', '-preset', 'p4', '-cq', '23'],
+    HwAccel.QSV: ['-c:v', 'h264_qsv', '-global_quality', '23'],
+    HwAccel.VIDEOTOOLBOX: ['-c:v', 'h264_videotoolbox', '-q:v', '60'],
+}
+_SOFTWARE_CODEC_ARGS = ['-c:v', 'libx264', '-preset', 'fast', '-crf', '23']
+
+# AUTO probes are answered from this cache after the first call; the lock
+# collapses concurrent first probes into one detection run.
+class _HwAccelCache:
+    """Holder for the probed hardware encoder backend."""
+
+    resolved: HwAccel | None = None
+
+
+_detect_lock = asyncio.Lock()
+
+
+def _video_codec_args(hw_accel: HwAccel) -> list[str]:
+    """Encoder arguments for a resolved backend (AUTO/NONE -> software)."""
+    return _CODEC_ARGS.get(hw_accel, _SOFTWARE_CODEC_ARGS)
+
+
+async def _probe_encoder(hw_accel: HwAccel) -> bool:
+    """Check that an encoder actually works with a tiny throwaway encode.
+
+    `ffmpeg -hwaccels` only lists methods compiled into the build; stock
+    builds print `cuda` on hosts with no GPU, where h264_nvenc then fails
+    at runtime ('Cannot load libcuda'). A nullsrc micro-encode proves the
+    encoder can initialize on this machine before it is cached.
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            'ffmpeg',
+            '-hide_banner',
+            '-v',
+            'error',
+            '-f',
+            'lavfi',
+            '-i',
+            'nullsrc=s=64x64:d=0.1',
+            *_CODEC_ARGS[hw_accel],
+            '-f',
+            'null',
+            '-',
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        return await process.wait() == 0
+    except OSError:
+        return False
+
+
+async def _detect_hw_accel() -> HwAccel:
+    """Probe the FFmpeg build once for the best working hardware encoder.
+
+    `ffmpeg -hwaccels` narrows the candidates to backends compiled into
+    the build, then each is validated with a micro-encode (_probe_encoder)
+    so a compiled-in-but-unusable backend is never selected. Prefers
+    CUDA > QSV > VideoToolbox and falls back to NONE (libx264). Hardware
+    encodes are typically 5-10x real-time vs libx264 and free the worker's
+    CPU cores for concurrent activities.
+    """
+    if _HwAccelCache.resolved is None:
+        async with _detect_lock:
+            if _HwAccelCache.resolved is None:
+                resolved = HwAccel.NONE
+                try:
+                    process = await asyncio.create_subprocess_exec(
+                        'ffmpeg',
+                        '-hide_banner',
+                        '-hwaccels',
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                    )
+                    stdout, _stderr = await process.communicate()
+                except OSError:
+                    logger.warning('FFmpeg hwaccel probe failed, using software encoding')
+                else:
+                    available = {line.strip() for line in stdout.decode().splitlines()}
+                    for candidate in (HwAccel.CUDA, HwAccel.QSV, HwAccel.VIDEOTOOLBOX):
+                        if candidate.value in available and await _probe_encoder(candidate):
+                            resolved = candidate
+                            break
+                logger.info(f'Hardware acceleration: {resolved.value}')
+                _HwAccelCache.resolved = resolved
+    return _HwAccelCache.resolved
+
+
 # FFmpeg filter expressions for text position
 # Using percentage-based positioning for better responsiveness
 POSITION_MAP = {
@@ -266,6 +397,48 @@ class FFmpegService:
         stdout, stderr = await process.communicate()
         return process.returncode or 0, stdout.decode(), stderr.decode()
 
+    async def stream_ffmpeg(self, args: list[str]) -> AsyncIterator[bytes]:
+        """Run FFmpeg and yield its stdout in fixed-size chunks.
+
+        Pair with an output_path of 'pipe:1' so encoded bytes can be fed
+        straight into a streaming consumer (e.g. a multipart upload) without
+        touching disk. stderr is drained concurrently so FFmpeg's progress
+        logging can never fill the pipe and stall the encode.
+
+        Args:
+            args: FFmpeg arguments (without 'ffmpeg' command)
+
+        Yields:
+            Chunks of encoded output as they are produced
+
+        Raises:
+            RuntimeError: If FFmpeg exits non-zero
+        """
+        logger.debug(f'Streaming FFmpeg: ffmpeg {" ".join(args)}')
+
+        process = await asyncio.create_subprocess_exec(
+            'ffmpeg',
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        assert process.stdout is not None
+        assert process.stderr is not None
+        stderr_task = asyncio.ensure_future(process.stderr.read())
+        try:
+            while chunk := await process.stdout.read(_PIPE_CHUNK_SIZE):
+                yield chunk
+        except BaseException:
+            process.kill()
+            raise
+        finally:
+            stderr = await stderr_task
+            returncode = await process.wait()
+
+        if returncode != 0:
+            logger.error(f'FFmpeg streaming run failed: {stderr.decode()}')
+            raise RuntimeError(f'FFmpeg failed with code {returncode}: {stderr.decode()}')
+
     async def get_video_dimensions(self, video_path: str) -> tuple[int, int]:
         """Get video dimensions using ffprobe.
 
@@ -299,6 +472,44 @@ class FFmpegService:
         width, height = map(int, dimensions.split('x'))
         return width, height
 
+    async def resolve_hw_accel(self, requested: HwAccel) -> HwAccel:
+        """Resolve AUTO to the probed backend; explicit choices pass through."""
+        if requested is not HwAccel.AUTO:
+            return requested
+        return await _detect_hw_accel()
+
+    async def get_duration(self, video_path: str) -> float:
+        """Get media duration in seconds using ffprobe.
+
+        Args:
+            video_path: Path or URL of the media
+
+        Returns:
+            Duration in seconds (0.0 if the container does not report one)
+        """
+        process = await asyncio.create_subprocess_exec(
+            'ffprobe',
+            '-v',
+            'error',
+            '-show_entries',
+            'format=duration',
+            '-of',
+            'default=nw=1:nk=1',
+            video_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+
+        if process.returncode != 0:
+            logger.error(f'ffprobe failed: {stderr.decode()}')
+            raise RuntimeError(f'ffprobe failed: {stderr.decode()}')
+
+        try:
+            return float(stdout.decode().strip())
+        except ValueError:
+            return 0.0
+
     def build_slow_down_command(self, input: SlowDownInput) -> list[str]:
         """Build FFmpeg command for slow down operation.
 
@@ -315,36 +526,26 @@ class FFmpegService:
             # atempo only works in range 0.5-2.0
             filter_complex = f'[0:v]setpts={pts_factor}*PTS[v];[0:a]atempo={input.speed_factor}[a]'
             return [
-                '-i',
-                input.input_path,
+                *_input_args(input.input_path),
                 '-filter_complex',
                 filter_complex,
                 '-map',
                 '[v]',
                 '-map',
                 '[a]',
-                '-c:v',
-                'libx264',
-                '-preset',
-                'fast',
+                *_video_codec_args(input.hw_accel),
                 '-c:a',
                 'aac',
-                '-y',
-                input.output_path,
+                *_output_args(input.output_path),
             ]
         # Video only, remove audio
         return [
-            '-i',
-            input.input_path,
+            *_input_args(input.input_path),
             '-vf',
             f'setpts={pts_factor}*PTS',
             '-an',
-            '-c:v',
-            'libx264',
-            '-preset',
-            'fast',
-            '-y',
-            input.output_path,
+            *_video_codec_args(input.hw_accel),
+            *_output_args(input.output_path),
         ]
 
     async def slow_down(self, input: SlowDownInput) -> SlowDownOutput:
@@ -356,7 +557,8 @@ class FFmpegService:
         Returns:
             SlowDownOutput with result
         """
-        command = self.build_slow_down_command(input)
+        effective_input = input.model_copy(update={'hw_accel': await self.resolve_hw_accel(input.hw_accel)})
+        command = self.build_slow_down_command(effective_input)
 
         returncode, _stdout, stderr = await self._run_ffmpeg(command)
 
@@ -370,6 +572,18 @@ class FFmpegService:
             command=['ffmpeg', *command],
         )
 
+    async def slow_down_stream(self, input: SlowDownInput) -> AsyncIterator[bytes]:
+        """Slow down a video, streaming the encoded output from stdout.
+
+        Args:
+            input: SlowDownInput with output_path='pipe:1'
+
+        Returns:
+            Async iterator of encoded output chunks
+        """
+        effective_input = input.model_copy(update={'hw_accel': await self.resolve_hw_accel(input.hw_accel)})
+        return self.stream_ffmpeg(self.build_slow_down_command(effective_input))
+
     def build_text_overlay_command(self, input: TextOverlayInput) -> list[str]:
         """Build FFmpeg command for text overlay operation.
 
@@ -421,20 +635,13 @@ class FFmpegService:
         filter_chain = ','.join(filters)
 
         return [
-            '-i',
-            input.input_path,
+            *_input_args(input.input_path),
             '-vf',
             filter_chain,
-            '-c:v',
-            'libx264',
-            '-preset',
-            'fast',
-            '-crf',
-            '23',
+            *_video_codec_args(input.hw_accel),
             '-c:a',
             'copy',
-            '-y',
-            input.output_path,
+            *_output_args(input.output_path),
         ]
 
     async def add_text_overlay(self, input: TextOverlayInput) -> TextOverlayOutput:
@@ -458,8 +665,10 @@ class FFmpegService:
 
         logger.info(f'Auto-scale: {width}x{height} -> font_size={calculated_font_size}')
 
-        # Create new input with calculated font size
-        effective_input = input.model_copy(update={'font_size': calculated_font_size})
+        # Create new input with calculated font size and resolved encoder
+        effective_input = input.model_copy(
+            update={'font_size': calculated_font_size, 'hw_accel': await self.resolve_hw_accel(input.hw_accel)}
+        )
 
         command = self.build_text_overlay_command(effective_input)
 
@@ -477,6 +686,25 @@ class FFmpegService:
             command=['ffmpeg', *command],
         )
 
+    async def add_text_overlay_stream(self, input: TextOverlayInput) -> AsyncIterator[bytes]:
+        """Add a text overlay, streaming the encoded output from stdout.
+
+        Probes the input for dimensions to auto-scale the font size, exactly
+        like add_text_overlay.
+
+        Args:
+            input: TextOverlayInput with output_path='pipe:1'
+
+        Returns:
+            Async iterator of encoded output chunks
+        """
+        _width, height = await self.get_video_dimensions(input.input_path)
+        calculated_font_size = max(24, min(int(height / input.font_scale_factor), 200))
+        effective_input = input.model_copy(
+            update={'font_size': calculated_font_size, 'hw_accel': await self.resolve_hw_accel(input.hw_accel)}
+        )
+        return self.stream_ffmpeg(self.build_text_overlay_command(effective_input))
+
     def build_combine_audio_command(self, input: CombineAudioInput) -> list[str]:
         """Build FFmpeg command for combine audio operation.
 
@@ -487,10 +715,8 @@ class FFmpegService:
             FFmpeg command arguments
         """
         return [
-            '-i',
-            input.video_path,
-            '-i',
-            input.audio_path,
+            *_input_args(input.video_path),
+            *_input_args(input.audio_path),
             '-c:v',
             'copy',
             '-c:a',
@@ -500,8 +726,7 @@ class FFmpegService:
             '-map',
             '1:a:0',
             '-shortest',
-            '-y',
-            input.output_path,
+            *_output_args(input.output_path),
         ]
 
     async def combine_audio(self, input: CombineAudioInput) -> CombineAudioOutput:
@@ -527,6 +752,17 @@ class FFmpegService:
             command=['ffmpeg', *command],
         )
 
+    async def combine_audio_stream(self, input: CombineAudioInput) -> AsyncIterator[bytes]:
+        """Combine video with audio, streaming the encoded output from stdout.
+
+        Args:
+            input: CombineAudioInput with output_path='pipe:1'
+
+        Returns:
+            Async iterator of encoded output chunks
+        """
+        return self.stream_ffmpeg(self.build_combine_audio_command(input))
+
 
 def get_ffmpeg_service() -> FFmpegService:
     """Get an FFmpeg service instance.
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
@@ -51,7 +51,7 @@ class GenerationResult(BaseModel):
     duration_seconds: float | None = Field(None, description='Duration of generated content (for audio/video)')
 
     # Timing
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     started_at: datetime | None = None
     completed_at: datetime | None = None
 
@@ -71,13 +71,13 @@ class GenerationResult(BaseModel):
     def mark_processing(self) -> 'GenerationResult':
         """Mark the task as processing."""
         self.status = GenerationStatus.PROCESSING
-        self.started_at = datetime.utcnow()
+        self.started_at = datetime.now(UTC)
         return self
 
     def mark_completed(self, output_url: str | None = None, output_urls: list[str] | None = None) -> 'GenerationResult':
         """Mark the task as completed with outputs."""
         self.status = GenerationStatus.COMPLETED
-        self.completed_at = datetime.utcnow()
+        self.completed_at = datetime.now(UTC)
         if output_url:
             self.output_url = output_url
         if output_urls:
@@ -87,7 +87,7 @@ class GenerationResult(BaseModel):
     def mark_failed(self, error: GenerationError) -> 'GenerationResult':
         """Mark the task as failed with error details."""
         self.status = GenerationStatus.FAILED
-        self.completed_at = datetime.utcnow()
+        self.completed_at = datetime.now(UTC)
         self.error = error
         return self
 
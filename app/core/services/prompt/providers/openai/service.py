@@ -1,4 +1,6 @@
+import asyncio
 import json
+import random
 
 import httpx
 
@@ -11,6 +13,25 @@ from app.core.services.prompt.schemas import (
     PromptTemplate,
 )
 
+# Transient failures (rate limits, gateway errors, timeouts) retry with
+# exponential backoff plus jitter so a single hiccup doesn't fail the whole
+# workflow activity; real request errors surface immediately
+_MAX_RETRIES = 3
+_RETRY_BASE_SECONDS = 2.0
+_RETRY_MAX_SLEEP_SECONDS = 30.0
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _retry_sleep_seconds(attempt: int, retry_after: str | None) -> float:
+    """Backoff for a retry attempt, honoring a Retry-After header if sane."""
+    delay = _RETRY_BASE_SECONDS**attempt + random.uniform(0, 1)  # noqa: S311
+    if retry_after:
+        try:
+            delay = max(delay, float(retry_after))
+        except ValueError:
+            pass
+    return min(delay, _RETRY_MAX_SLEEP_SECONDS)
+
 
 class OpenAIPromptService(PromptServiceInterface):
     """OpenAI prompt generation service implementation."""
@@ -24,13 +45,18 @@ class OpenAIPromptService(PromptServiceInterface):
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
+            from app.core.http import DEFAULT_TIMEOUT, POOL_LIMITS
+
+            # Needs its own auth headers, so it can't share the process-wide
+            # client - but it reuses the shared pool limits and timeouts
             self._client = httpx.AsyncClient(
                 base_url=self.BASE_URL,
                 headers={
                     'Authorization': f'Bearer {app_config.OPENAI_API_KEY}',
                     'Content-Type': 'application/json',
                 },
-                timeout=120.0,
+                limits=POOL_LIMITS,
+                timeout=DEFAULT_TIMEOUT,
             )
         return self._client
 
@@ -99,7 +125,18 @@ class OpenAIPromptService(PromptServiceInterface):
         if json_mode:
             payload['response_format'] = {'type': 'json_object'}
 
-        response = await client.post('/chat/completions', json=payload)
+        for attempt in range(1, _MAX_RETRIES + 1):
+            try:
+                response = await client.post('/chat/completions', json=payload)
+            except httpx.TimeoutException:
+                if attempt == _MAX_RETRIES:
+                    raise
+                await asyncio.sleep(_retry_sleep_seconds(attempt, None))
+                continue
+            if response.status_code in _RETRYABLE_STATUS_CODES and attempt < _MAX_RETRIES:
+                await asyncio.sleep(_retry_sleep_seconds(attempt, response.headers.get('retry-after')))
+                continue
+            break
 
         if response.status_code != 200:
             raise Exception(f'OpenAI API error: {response.text}')
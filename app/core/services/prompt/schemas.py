@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -6,6 +7,18 @@ from pydantic import BaseModel, Field
 from app.core.services.generation.schemas import GenerationRequest
 
 
+@lru_cache(maxsize=512)
+def _render_template(user_prompt_template: str, items: tuple[tuple[str, Any], ...]) -> str:
+    """Render a template body against sorted variable items (memoized).
+
+    Template bodies are constants and high-throughput workflows re-render
+    them with a small set of recurring variables, so the formatted string is
+    worth keeping. Keyed on the body itself, not the template name, so an
+    edited template never serves stale renders.
+    """
+    return user_prompt_template.format(**dict(items))
+
+
 class PromptProvider(str, Enum):
     """Supported prompt generation providers."""
 
@@ -40,7 +53,11 @@ class PromptTemplate(BaseModel):
 
     def render(self, **kwargs) -> str:
         """Render the user prompt with provided variables."""
-        return self.user_prompt_template.format(**kwargs)
+        try:
+            return _render_template(self.user_prompt_template, tuple(sorted(kwargs.items())))
+        except TypeError:
+            # Unhashable variable values (lists, dicts) can't key the cache
+            return self.user_prompt_template.format(**kwargs)
 
 
 class PromptGenerationRequest(GenerationRequest):
@@ -1,9 +1,20 @@
+import threading
+
 from app.core.services.prompt.base_service import PromptServiceInterface
 from app.core.services.prompt.schemas import PromptProvider
 
+# One service per provider for the life of the process. Rebuilding the
+# service per call would tear down and recreate its pooled HTTP client,
+# paying TLS handshake + DNS on every activity invocation.
+_services: dict[PromptProvider, PromptServiceInterface] = {}
+_services_lock = threading.Lock()
+
 
 def get_prompt_service(provider: PromptProvider = PromptProvider.OPENAI) -> PromptServiceInterface:
-    """Factory function to get a prompt service instance.
+    """Get the shared prompt service for a provider.
+
+    Double-checked locking keeps concurrent first calls from constructing
+    two services, each holding its own client pool.
 
     Args:
         provider: LLM provider to use (default: OpenAI)
@@ -11,8 +22,23 @@ def get_prompt_service(provider: PromptProvider = PromptProvider.OPENAI) -> Prom
     Returns:
         PromptServiceInterface implementation
     """
-    if provider == PromptProvider.OPENAI:
-        from app.core.services.prompt.providers.openai.service import OpenAIPromptService
+    service = _services.get(provider)
+    if service is None:
+        with _services_lock:
+            service = _services.get(provider)
+            if service is None:
+                if provider == PromptProvider.OPENAI:
+                    from app.core.services.prompt.providers.openai.service import OpenAIPromptService
+
+                    service = OpenAIPromptService()
+                else:
+                    raise ValueError(f'Unsupported prompt provider: {provider}')
+                _services[provider] = service
+    return service
+
 
-        return OpenAIPromptService()
-    raise ValueError(f'Unsupported prompt provider: {provider}')
+async def close_prompt_services() -> None:
+    """Close any prompt services created during this process's lifetime."""
+    while _services:
+        _, service = _services.popitem()
+        await service.close()
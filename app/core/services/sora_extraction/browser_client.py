@@ -9,6 +9,44 @@ from playwright.async_api import Browser, async_playwright
 
 logger = structlog.get_logger(__name__)
 
+# Known CDN host serving Sora MP4s; the JS extractor is specialized for it below
+CDN_HOST = "videos.openai.com"
+
+# JS extraction specialized at import time for the known CDN host. A single
+# regex over the serialized DOM replaces the old O(elements x attributes)
+# querySelectorAll('*') walk.
+_JS_EXTRACTOR_TEMPLATE = """
+    () => {{
+        // 1. Direct video tags
+        const videoElems = document.querySelectorAll('video');
+        for (let v of videoElems) {{
+            if (v.src && v.src.includes('.mp4')) return v.src;
+            const source = v.querySelector('source');
+            if (source && source.src && source.src.includes('.mp4')) return source.src;
+        }}
+
+        // 2. One regex over the serialized DOM catches script payloads,
+        //    data attributes, and React props in a single pass
+        const cdnMatch = document.documentElement.outerHTML.match(
+            new RegExp('https://{cdn_host}[^"\\'\\\\s<>]+\\\\.mp4[^"\\'\\\\s<>]*')
+        );
+        if (cdnMatch) return cdnMatch[0];
+
+        // 3. Fallback: any MP4 URL in script tags
+        const scripts = document.querySelectorAll('script');
+        for (let s of scripts) {{
+            if (s.textContent) {{
+                const match = s.textContent.match(/https?:[^\\s"'<>]*\\.mp4[^\\s"'<>]*/g);
+                if (match && match[0]) return match[0];
+            }}
+        }}
+
+        return null;
+    }}
+"""
+
+_JS_EXTRACTOR = _JS_EXTRACTOR_TEMPLATE.format(cdn_host=CDN_HOST)
+
 
 class SoraBrowserClient:
     """Extract MP4 URLs from Sora share links using browser automation."""
@@ -80,23 +118,18 @@ class SoraBrowserClient:
         # Intercept network requests to find MP4 URLs
         mp4_urls = []
 
-        async def handle_request(request):
-            """Capture all requests including media."""
-            url = request.url
-            if ".mp4" in url.lower():
-                logger.debug("Intercepted MP4 request", url=url)
-                mp4_urls.append(url)
-
         async def handle_response(response):
             """Capture responses that contain MP4 URLs."""
+            # CDN URLs are lowercase in practice; skip the per-URL .lower() copy
             url = response.url
 
-            if ".mp4" in url.lower():
+            if ".mp4" in url:
                 logger.debug("Found MP4 in response", url=url, status=response.status)
                 if url not in mp4_urls:
                     mp4_urls.append(url)
 
-        page.on("request", handle_request)
+        # The response handler fires for every request anyway and carries more
+        # information (status, headers) — no need for a separate request handler.
         page.on("response", handle_response)
 
         try:
@@ -114,7 +147,7 @@ class SoraBrowserClient:
 
                 # Try to get src from video tag - accept any video URL
                 src = await video_element.get_attribute("src")
-                if src and ("videos.openai.com" in src or "blob:" not in src):
+                if src and (CDN_HOST in src or "blob:" not in src):
                     logger.info("Extracted video from video src", url=src[:100])
                     return src
 
@@ -122,7 +155,7 @@ class SoraBrowserClient:
                 sources = await video_element.query_selector_all("source")
                 for source in sources:
                     src = await source.get_attribute("src")
-                    if src and ("videos.openai.com" in src or "blob:" not in src):
+                    if src and (CDN_HOST in src or "blob:" not in src):
                         logger.info("Extracted video from source tag", url=src[:100])
                         return src
 
@@ -138,37 +171,7 @@ class SoraBrowserClient:
 
             # Strategy 3: Execute JavaScript to search for video URLs
             logger.debug("Trying JavaScript extraction")
-            js_mp4_url = await page.evaluate("""
-                () => {
-                    // Try to find video src in various places
-                    // 1. Direct video tags
-                    const videoElems = document.querySelectorAll('video');
-                    for (let v of videoElems) {
-                        if (v.src && v.src.includes('.mp4')) return v.src;
-                        const source = v.querySelector('source');
-                        if (source && source.src && source.src.includes('.mp4')) return source.src;
-                    }
-
-                    // 2. Check all script tags for video URLs
-                    const scripts = document.querySelectorAll('script');
-                    for (let s of scripts) {
-                        if (s.textContent) {
-                            const match = s.textContent.match(/https?:[^\\s"'<>]*\\.mp4[^\\s"'<>]*/g);
-                            if (match && match[0]) return match[0];
-                        }
-                    }
-
-                    // 3. Check data attributes and React props
-                    const allElements = document.querySelectorAll('*');
-                    for (let el of allElements) {
-                        for (let attr of el.attributes || []) {
-                            if (attr.value && attr.value.includes('.mp4')) return attr.value;
-                        }
-                    }
-
-                    return null;
-                }
-            """)
+            js_mp4_url = await page.evaluate(_JS_EXTRACTOR)
 
             if js_mp4_url:
                 logger.info("Extracted MP4 via JavaScript", url=js_mp4_url)
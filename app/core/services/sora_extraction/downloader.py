@@ -1,6 +1,8 @@
 """Video downloader for streaming MP4 from CDN to local storage."""
 
 import asyncio
+import os
+from collections.abc import Callable
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +14,55 @@ logger = structlog.get_logger(__name__)
 # Chunk size for streaming downloads (10 MB)
 CHUNK_SIZE = 10 * 1024 * 1024
 
+# Directories already created via mkdir, to skip the syscall on repeat downloads
+_created_dirs: set[Path] = set()
+
+
+def _noop_progress(downloaded: int, total: int) -> None:
+    """Default progress callback; a no-op so the hot loop needs no branch."""
+
+
+def _open_preallocated(path: Path, size: int):
+    """Open a file for writing, preallocating its full extent when possible.
+
+    Preallocating avoids incremental extent allocations during streaming and
+    reduces fragmentation and close latency on ext4/xfs. Falls back to a
+    plain open when the size is unknown or the filesystem doesn't support it.
+    """
+    if size > 0 and hasattr(os, 'posix_fallocate'):
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            pass  # Filesystem doesn't support fallocate; write normally
+        return os.fdopen(fd, 'wb')
+    return open(path, 'wb')
+
+
+def _drop_page_cache(path: Path) -> None:
+    """Hint the kernel to evict the file from the page cache.
+
+    Downloaded videos are write-once and read at most once, so keeping them
+    cached only evicts genuinely hot pages from other processes.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # Best-effort hint only
+
+
+def _ensure_dir(directory: Path) -> None:
+    """Create a directory once per process, skipping the mkdir syscall on repeats."""
+    if directory not in _created_dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(directory)
+
 
 class VideoDownloader:
     """Async downloader for streaming videos to local storage."""
@@ -44,24 +95,23 @@ class VideoDownloader:
         self,
         url: str,
         output_path: Path,
-        progress_callback: Optional[callable] = None,
-    ) -> Path:
+        progress_callback: Callable[[int, int], None] = _noop_progress,
+    ) -> tuple[Path, int]:
         """Download video from URL to local file.
 
         Args:
             url: Direct MP4 URL to download
             output_path: Path to save the video file
-            progress_callback: Optional callback for progress updates (bytes_downloaded, total_bytes)
+            progress_callback: Callback for progress updates (bytes_downloaded, total_bytes)
 
         Returns:
-            Path to the downloaded file
+            Tuple of (path to the downloaded file, bytes written)
 
         Raises:
             aiohttp.ClientError: If download fails
             IOError: If file write fails
         """
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(output_path.parent)
 
         session = self.session or aiohttp.ClientSession(timeout=self.TIMEOUT)
 
@@ -78,14 +128,15 @@ class VideoDownloader:
 
                 logger.info('Starting video download', url=url, size_bytes=total_size)
 
-                with open(output_path, 'wb') as f:
+                with _open_preallocated(output_path, total_size) as f:
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
                     async for chunk in response.content.iter_chunked(CHUNK_SIZE):
                         if chunk:
                             f.write(chunk)
                             downloaded += len(chunk)
 
-                            if progress_callback:
-                                progress_callback(downloaded, total_size)
+                            progress_callback(downloaded, total_size)
 
                             logger.debug(
                                 'Download progress',
@@ -94,13 +145,16 @@ class VideoDownloader:
                                 percent=int((downloaded / total_size * 100) if total_size else 0),
                             )
 
+                _drop_page_cache(output_path)
+
                 logger.info('Download complete', output_path=str(output_path), size_bytes=downloaded)
-                return output_path
+                # The streaming counter already equals the on-disk size, so
+                # callers don't need a follow-up stat()
+                return output_path, downloaded
 
         except Exception as e:
-            # Clean up partial file on error
-            if output_path.exists():
-                output_path.unlink()
+            # Clean up partial file on error (in a thread; blocking unlink)
+            await asyncio.to_thread(output_path.unlink, missing_ok=True)
             logger.error('Download failed', url=url, error=str(e))
             raise
         finally:
@@ -112,23 +166,24 @@ class VideoDownloader:
         url: str,
         temp_dir: Optional[Path] = None,
         filename: str = 'video.mp4',
-    ) -> Path:
+        progress_callback: Callable[[int, int], None] = _noop_progress,
+    ) -> tuple[Path, int]:
         """Download video to temp directory.
 
         Args:
             url: Direct MP4 URL to download
             temp_dir: Temp directory to use (defaults to /tmp)
             filename: Filename for the video
+            progress_callback: Callback for progress updates (bytes_downloaded, total_bytes)
 
         Returns:
-            Path to the downloaded file in temp directory
+            Tuple of (path to the downloaded file in temp directory, bytes written)
         """
         if temp_dir is None:
             temp_dir = Path('/tmp/sora_videos')
 
-        temp_dir = Path(temp_dir)
-        temp_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(temp_dir)
 
         output_path = temp_dir / filename
 
-        return await self.download(url, output_path)
+        return await self.download(url, output_path, progress_callback)
@@ -1,5 +1,7 @@
 """Sora extraction service - main service interface."""
 
+import asyncio
+from collections.abc import Callable
 from pathlib import Path
 from typing import Optional
 
@@ -7,7 +9,7 @@ import aiohttp
 import structlog
 
 from app.core.services.sora_extraction.browser_client import SoraBrowserClient
-from app.core.services.sora_extraction.downloader import VideoDownloader
+from app.core.services.sora_extraction.downloader import VideoDownloader, _noop_progress
 
 logger = structlog.get_logger(__name__)
 
@@ -29,6 +31,7 @@ class SoraExtractionService:
         self._owns_session = session is None
         self.browser_client = SoraBrowserClient(headless=headless)
         self.downloader = VideoDownloader(session)
+        self._launch_task: asyncio.Task | None = None
 
     async def __aenter__(self):
         """Context manager entry."""
@@ -38,17 +41,59 @@ class SoraExtractionService:
         """Context manager exit."""
         await self.close()
 
+    def warmup(self) -> asyncio.Task:
+        """Start launching the browser in the background.
+
+        Call at app startup so the first extraction does not pay the 1-3s
+        Chromium startup cost. Extraction calls await the pending launch,
+        so this is safe to call concurrently with requests.
+
+        Returns:
+            The background launch task
+        """
+        if self._launch_task is None:
+            self._launch_task = asyncio.create_task(self.browser_client.launch())
+        return self._launch_task
+
     async def close(self):
         """Close all resources."""
+        if self._launch_task is not None and not self._launch_task.done():
+            self._launch_task.cancel()
         await self.browser_client.close()
         await self.downloader.close()
 
+    async def extract_mp4_url(self, sora_share_url: str) -> str:
+        """Extract the underlying MP4 CDN URL from a Sora share page.
+
+        Args:
+            sora_share_url: The Sora share URL (e.g., https://sora.chatgpt.com/share/xxxx)
+
+        Returns:
+            Direct MP4 URL on the CDN
+
+        Raises:
+            ValueError: If the URL is invalid or MP4 cannot be extracted
+        """
+        # Wait for a warmup launch if one is pending, else launch lazily
+        if self._launch_task is not None:
+            try:
+                await self._launch_task
+            except Exception:
+                self._launch_task = None  # Fall through to lazy launch below
+        if not self.browser_client.browser:
+            await self.browser_client.launch()
+
+        mp4_url = await self.browser_client.get_mp4_url(sora_share_url)
+        logger.info('Extracted MP4 URL', mp4_url=mp4_url)
+        return mp4_url
+
     async def extract_and_download(
         self,
         sora_share_url: str,
         output_path: Optional[Path] = None,
         temp_dir: Optional[Path] = None,
-    ) -> Path:
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> tuple[Path, int]:
         """Extract MP4 from Sora share link and download it.
 
         Complete flow:
@@ -60,9 +105,10 @@ class SoraExtractionService:
             sora_share_url: The Sora share URL (e.g., https://sora.chatgpt.com/share/xxxx)
             output_path: Explicit output path. If provided, uses this instead of temp_dir
             temp_dir: Temp directory for downloads (defaults to /tmp/sora_videos)
+            progress_callback: Optional per-chunk callback (bytes_downloaded, total_bytes)
 
         Returns:
-            Path to the downloaded MP4 file
+            Tuple of (path to the downloaded MP4 file, bytes written)
 
         Raises:
             ValueError: If the URL is invalid or MP4 cannot be extracted
@@ -72,22 +118,21 @@ class SoraExtractionService:
         logger.info('Starting Sora extraction', url=sora_share_url)
 
         try:
-            # Step 1: Launch browser if needed
-            if not self.browser_client.browser:
-                await self.browser_client.launch()
-
-            # Step 2: Extract MP4 URL from Sora share page using browser
-            mp4_url = await self.browser_client.get_mp4_url(sora_share_url)
-            logger.info('Extracted MP4 URL', mp4_url=mp4_url)
+            # Steps 1-2: Launch the browser (or await warmup) and extract the MP4 URL
+            mp4_url = await self.extract_mp4_url(sora_share_url)
 
-            # Step 3: Download the video
+            # Step 3: Download the video. The downloader returns its streaming
+            # byte counter so callers get the file size without a stat()
+            callback = progress_callback if progress_callback is not None else _noop_progress
             if output_path:
-                result_path = await self.downloader.download(mp4_url, output_path)
+                result_path, size_bytes = await self.downloader.download(mp4_url, output_path, callback)
             else:
-                result_path = await self.downloader.download_to_temp(mp4_url, temp_dir=temp_dir)
+                result_path, size_bytes = await self.downloader.download_to_temp(
+                    mp4_url, temp_dir=temp_dir, progress_callback=callback
+                )
 
-            logger.info('Extraction and download complete', output_path=str(result_path))
-            return result_path
+            logger.info('Extraction and download complete', output_path=str(result_path), size_bytes=size_bytes)
+            return result_path, size_bytes
 
         except Exception as e:
             logger.error('Extraction failed', url=sora_share_url, error=str(e))
@@ -4,13 +4,14 @@ from app.core.services.storage.schemas import (
     StorageProvider,
     UploadRequest,
 )
-from app.core.services.storage.service import get_storage, get_storage_service
+from app.core.services.storage.service import close_storage, get_storage, get_storage_service
 
 __all__ = [
     'StorageFile',
     'StorageProvider',
     'StorageServiceInterface',
     'UploadRequest',
+    'close_storage',
     'get_storage',
     'get_storage_service',
 ]
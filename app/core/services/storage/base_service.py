@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from app.core.services.storage.schemas import StorageFile, UploadRequest
 
@@ -18,6 +19,27 @@ class StorageServiceInterface(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def upload_stream(
+        self, key: str, content_type: str, stream: AsyncIterator[bytes], public: bool = True
+    ) -> StorageFile:
+        """Upload a file from an async byte stream.
+
+        The stream is consumed exactly once and never buffered in full, so
+        producers like subprocess pipes can feed uploads of arbitrary size.
+
+        Args:
+            key: Destination key
+            content_type: MIME type of the content
+            stream: Async iterator yielding the file's bytes
+            public: Make the object publicly readable (same semantics as
+                UploadRequest.public)
+
+        Returns:
+            StorageFile with the uploaded file's URL and metadata
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def upload_from_url(self, url: str, key: str | None = None) -> StorageFile:
         """Download a file from a URL and upload it to storage.
@@ -32,14 +54,20 @@ class StorageServiceInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_url(self, key: str, expires_in_seconds: int | None = None) -> str:
+    async def get_url(
+        self, key: str, expires_in_seconds: int | None = None, force_presigned: bool = False
+    ) -> str:
         """Get the URL for a file.
 
         Args:
             key: File key in storage
             expires_in_seconds: Generate a signed URL with this expiration
+            force_presigned: Presign even when a public base URL is configured
 
         Returns:
             Public or signed URL to the file
         """
         raise NotImplementedError
+
+    async def close(self) -> None:  # noqa: B027
+        """Close any long-lived connections held by the service."""
@@ -1,19 +1,176 @@
 """AWS S3 storage service."""
 
+import asyncio
 import mimetypes
-import uuid
-from datetime import datetime
+import random
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
-import httpx
+from aiobotocore.config import AioConfig
 from aiobotocore.session import get_session
+from botocore.exceptions import ClientError
 
 from app.core.configs import app_config
+from app.core.http import get_shared_async_client
 from app.core.services.storage.base_service import StorageServiceInterface
 from app.core.services.storage.schemas import StorageFile, StorageProvider, UploadRequest
 
 
+async def _iter_file_chunks(file_path: str, chunk_size: int) -> AsyncIterator[bytes]:
+    """Yield a file's contents in fixed-size chunks.
+
+    Reads run in a worker thread so large-file disk I/O never stalls the
+    event loop.
+    """
+    with open(file_path, 'rb') as f:
+        while chunk := await asyncio.to_thread(f.read, chunk_size):
+            yield chunk
+
+
+async def _iter_bytes_chunks(data: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    """Yield an in-memory buffer in fixed-size chunks."""
+    for offset in range(0, len(data), chunk_size):
+        yield data[offset : offset + chunk_size]
+
+
+async def _rechunk(source: AsyncIterator[bytes], chunk_size: int) -> AsyncIterator[bytes]:
+    """Re-chunk an async byte stream into full-size parts.
+
+    Sources like httpx responses or subprocess pipes may yield arbitrarily
+    small chunks, but multipart parts (except the last) must meet the
+    5 MiB S3 minimum.
+    """
+    buf = bytearray()
+    async for chunk in source:
+        buf += chunk
+        while len(buf) >= chunk_size:
+            yield bytes(buf[:chunk_size])
+            del buf[:chunk_size]
+    if buf:
+        yield bytes(buf)
+
+
+# Transient S3 error codes worth retrying at the upload layer
+_RETRYABLE_CODES = frozenset({'SlowDown', 'InternalError', 'ServiceUnavailable', 'RequestTimeout', 'ThrottlingException'})
+_RETRY_ATTEMPTS = 5
+_RETRY_BASE_DELAY = 0.1
+_RETRY_MAX_DELAY = 10.0
+
+
+async def _with_retries(op, /, *args, **kwargs):
+    """Retry transient storage errors with exponential backoff and full jitter.
+
+    Only throttling/availability errors are retried; everything else (auth,
+    missing bucket, validation) propagates immediately.
+    """
+    for attempt in range(_RETRY_ATTEMPTS):
+        try:
+            return await op(*args, **kwargs)
+        except TimeoutError:
+            if attempt == _RETRY_ATTEMPTS - 1:
+                raise
+        except ClientError as e:
+            code = e.response.get('Error', {}).get('Code')
+            if code not in _RETRYABLE_CODES or attempt == _RETRY_ATTEMPTS - 1:
+                raise
+        delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * (2**attempt))
+        await asyncio.sleep(random.uniform(0, delay))  # noqa: S311
+    raise RuntimeError('unreachable')
+
+
+# Precomputed MIME tables for the types this codebase actually uploads;
+# mimetypes is only consulted on a miss (its first call scans system files).
+_EXT_TO_MIME = {
+    '.mp3': 'audio/mpeg',
+    '.wav': 'audio/wav',
+    '.mp4': 'video/mp4',
+    '.webm': 'video/webm',
+    '.mov': 'video/quicktime',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.svg': 'image/svg+xml',
+    '.pdf': 'application/pdf',
+    '.json': 'application/json',
+    '.txt': 'text/plain',
+    '.html': 'text/html',
+    '.bin': 'application/octet-stream',
+}
+_MIME_TO_EXT = {
+    'audio/mpeg': '.mp3',
+    'audio/wav': '.wav',
+    'video/mp4': '.mp4',
+    'video/webm': '.webm',
+    'video/quicktime': '.mov',
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+    'image/svg+xml': '.svg',
+    'application/pdf': '.pdf',
+    'application/json': '.json',
+    'text/plain': '.txt',
+    'text/html': '.html',
+}
+
+
+def _guess_content_type(filename: str) -> str | None:
+    """Look up a MIME type from the precomputed table, falling back to mimetypes."""
+    dot = filename.rfind('.')
+    if dot != -1:
+        mime = _EXT_TO_MIME.get(filename[dot:].lower())
+        if mime:
+            return mime
+    return mimetypes.guess_type(filename)[0]
+
+
+def _guess_extension(content_type: str) -> str:
+    """Look up an extension from the precomputed table, falling back to mimetypes."""
+    return _MIME_TO_EXT.get(content_type) or mimetypes.guess_extension(content_type) or ''
+
+
+# Presigned URLs are cached while still comfortably inside their TTL so hot
+# keys skip repeated SigV4 signing and downstream caches see a stable URL.
+_PRESIGN_CACHE_MAX = 10_000
+_PRESIGN_SAFETY_MARGIN = 300.0
+
+
+# Client transport/signing config. Payload signing is disabled: the endpoint
+# is TLS-only, and SigV4 body signing SHA-256-hashes the full payload
+# synchronously on the event loop, which is noticeable above ~50 MB.
+_CLIENT_CONFIG = AioConfig(
+    signature_version='s3v4',
+    s3={'payload_signing_enabled': False},
+    tcp_keepalive=True,
+    max_pool_connections=50,
+)
+
+
+# Key-generation fast paths: a precomputed deletion table for filename
+# sanitization and a per-day cached UTC date prefix, so hot upload paths
+# skip strftime/uuid4 and the per-character comprehension.
+_KEY_TRANS = str.maketrans('', '', ''.join(chr(i) for i in range(256) if not (chr(i).isalnum() or chr(i) in '.-_')))
+_date_prefix_cache: dict[int, str] = {}
+
+
+def _date_prefix() -> str:
+    """Get today's 'YYYY/MM/DD' UTC prefix, formatted at most once per day."""
+    day = int(time.time()) // 86400
+    prefix = _date_prefix_cache.get(day)
+    if prefix is None:
+        _date_prefix_cache.clear()
+        prefix = time.strftime('%Y/%m/%d', time.gmtime())
+        _date_prefix_cache[day] = prefix
+    return prefix
+
+
 class S3StorageService(StorageServiceInterface):
     """S3 storage service implementation."""
 
@@ -22,54 +179,155 @@ class S3StorageService(StorageServiceInterface):
             raise ValueError('S3_BUCKET is not set. Please set it in your environment or .env file.')
         if not app_config.S3_ACCESS_KEY or not app_config.S3_SECRET_KEY:
             raise ValueError('S3_ACCESS_KEY and S3_SECRET_KEY are required.')
-        self._client = None
+        self._client: Any = None
+        self._client_cm: Any = None
+        self._client_lock = asyncio.Lock()
+        self._presign_cache: OrderedDict[tuple[str, str, int], tuple[str, float]] = OrderedDict()
+        self.part_size_bytes = app_config.S3_PART_SIZE_MB * 1024 * 1024
+        self.max_concurrency = app_config.S3_UPLOAD_CONCURRENCY
+
+    async def _ensure_client(self):
+        """Get the long-lived S3 client, creating and entering it on first use.
 
-    async def _get_client(self):
-        """Get or create the S3 client."""
+        The previous pattern cached the un-entered client but then used it as
+        `async with client`, whose __aexit__ closed the shared connection pool
+        after every call — no keepalive reuse at all.
+        """
         if self._client is None:
-            session = get_session()
-            config = {
-                'region_name': app_config.S3_REGION,
-                'aws_access_key_id': app_config.S3_ACCESS_KEY,
-                'aws_secret_access_key': app_config.S3_SECRET_KEY,
-            }
-            if app_config.S3_ENDPOINT_URL:
-                config['endpoint_url'] = app_config.S3_ENDPOINT_URL
+            async with self._client_lock:
+                if self._client is None:
+                    session = get_session()
+                    client_kwargs = {
+                        'region_name': app_config.S3_REGION,
+                        'aws_access_key_id': app_config.S3_ACCESS_KEY,
+                        'aws_secret_access_key': app_config.S3_SECRET_KEY,
+                    }
+                    if app_config.S3_ENDPOINT_URL:
+                        client_kwargs['endpoint_url'] = app_config.S3_ENDPOINT_URL
 
-            self._client = session.create_client('s3', **config)
+                    self._client_cm = session.create_client('s3', config=_CLIENT_CONFIG, **client_kwargs)
+                    self._client = await self._client_cm.__aenter__()
         return self._client
 
+    async def close(self) -> None:
+        """Close the underlying client and its connection pool."""
+        if self._client_cm is not None:
+            await self._client_cm.__aexit__(None, None, None)
+            self._client = None
+            self._client_cm = None
+
     @property
     def bucket(self) -> str:
         return app_config.storage_bucket or ''
 
     def _generate_key(self, filename: str | None = None, content_type: str | None = None) -> str:
         """Generate a unique key for a file."""
-        unique_id = uuid.uuid4().hex[:12]
-        timestamp = datetime.utcnow().strftime('%Y/%m/%d')
+        unique_id = secrets.token_hex(6)
+        timestamp = _date_prefix()
 
         if filename:
-            safe_name = ''.join(c for c in filename if c.isalnum() or c in '.-_')
+            safe_name = filename.translate(_KEY_TRANS)
             return f'{timestamp}/{unique_id}_{safe_name}'
 
-        ext = ''
-        if content_type:
-            ext = mimetypes.guess_extension(content_type) or ''
+        ext = _guess_extension(content_type) if content_type else ''
 
         return f'{timestamp}/{unique_id}{ext}'
 
+    async def _multipart_upload(
+        self,
+        s3: Any,
+        key: str,
+        source_iter: AsyncIterator[bytes],
+        upload_params: dict[str, Any],
+    ) -> int:
+        """Stream chunks into a concurrent multipart upload.
+
+        Memory is bounded to roughly part_size_bytes * max_concurrency since
+        the producer blocks on the semaphore before reading the next chunk.
+
+        Args:
+            s3: S3 client
+            key: Destination key
+            source_iter: Async iterator yielding chunks of at least 5 MiB
+                (except the last)
+            upload_params: put_object-style params (Bucket, ContentType, ...)
+
+        Returns:
+            Total number of bytes uploaded, counted as a side effect of
+            chunking so callers never need a second pass over the data
+        """
+        bucket = upload_params['Bucket']
+        create_resp = await s3.create_multipart_upload(**upload_params)
+        upload_id = create_resp['UploadId']
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        parts: list[dict[str, Any]] = []
+        tasks: list[asyncio.Task] = []
+        part_errors: list[BaseException] = []
+        total_bytes = 0
+
+        async def _upload_part(part_number: int, chunk: bytes) -> None:
+            try:
+                part = await _with_retries(
+                    s3.upload_part,
+                    Bucket=bucket,
+                    Key=key,
+                    PartNumber=part_number,
+                    UploadId=upload_id,
+                    Body=chunk,
+                )
+                parts.append({'ETag': part['ETag'], 'PartNumber': part_number})
+            except BaseException as e:
+                part_errors.append(e)
+                raise
+            finally:
+                semaphore.release()
+
+        try:
+            part_number = 0
+            async for chunk in source_iter:
+                # A failed part dooms the whole upload; surface it now rather
+                # than consuming (and discarding) the rest of the source first
+                if part_errors:
+                    raise part_errors[0]
+                part_number += 1
+                total_bytes += len(chunk)
+                await semaphore.acquire()
+                tasks.append(asyncio.create_task(_upload_part(part_number, chunk)))
+
+            await asyncio.gather(*tasks)
+
+            parts.sort(key=lambda p: p['PartNumber'])
+            await s3.complete_multipart_upload(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts},
+            )
+        except Exception:
+            # Settle sibling part tasks before aborting: gather() raised on
+            # the first failure while others were still in flight, and an
+            # abort racing live upload_part calls can leave stray parts
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await s3.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+            raise
+
+        return total_bytes
+
     async def upload(self, request: UploadRequest) -> StorageFile:
         """Upload a file to S3."""
-        client = await self._get_client()
+        if request.url and not request.data and not request.file_path:
+            return await self.upload_from_url(request.url, request.key)
 
-        data: bytes
+        source_iter: AsyncIterator[bytes]
         if request.data:
-            data = request.data
+            size_bytes = len(request.data)
+            source_iter = _iter_bytes_chunks(request.data, self.part_size_bytes)
         elif request.file_path:
-            with open(request.file_path, 'rb') as f:
-                data = f.read()
-        elif request.url:
-            return await self.upload_from_url(request.url, request.key)
+            size_bytes = (await asyncio.to_thread(Path(request.file_path).stat)).st_size
+            source_iter = _iter_file_chunks(request.file_path, self.part_size_bytes)
         else:
             raise ValueError('No data source provided in upload request')
 
@@ -77,14 +335,13 @@ class S3StorageService(StorageServiceInterface):
 
         content_type = request.content_type
         if not content_type and request.filename:
-            content_type, _ = mimetypes.guess_type(request.filename)
+            content_type = _guess_content_type(request.filename)
         if not content_type:
             content_type = 'application/octet-stream'
 
         upload_params: dict[str, Any] = {
             'Bucket': self.bucket,
             'Key': key,
-            'Body': data,
             'ContentType': content_type,
         }
 
@@ -94,8 +351,14 @@ class S3StorageService(StorageServiceInterface):
         if request.metadata:
             upload_params['Metadata'] = request.metadata
 
-        async with client as s3:
-            await s3.put_object(**upload_params)
+        s3 = await self._ensure_client()
+        if size_bytes < self.part_size_bytes:
+            body = request.data
+            if body is None:
+                body = await asyncio.to_thread(Path(request.file_path).read_bytes)  # type: ignore[arg-type]
+            await _with_retries(s3.put_object, Body=body, **upload_params)
+        else:
+            size_bytes = await self._multipart_upload(s3, key, source_iter, upload_params)
 
         url = await self.get_url(key)
 
@@ -103,46 +366,171 @@ class S3StorageService(StorageServiceInterface):
             key=key,
             url=url,
             content_type=content_type,
-            size_bytes=len(data),
+            size_bytes=size_bytes,
             bucket=self.bucket,
             provider=StorageProvider.S3,
             metadata=request.metadata,
         )
 
+    async def upload_stream(
+        self, key: str, content_type: str, stream: AsyncIterator[bytes], public: bool = True
+    ) -> StorageFile:
+        """Upload from an async byte stream without buffering it in memory.
+
+        Chunks are re-batched to the multipart part size and fed straight
+        into concurrent part uploads, so peak memory stays near
+        part_size * concurrency regardless of total object size. The ACL
+        matches upload(): public by default, since get_url hands out
+        public URLs for these keys.
+        """
+        upload_params: dict[str, Any] = {
+            'Bucket': self.bucket,
+            'Key': key,
+            'ContentType': content_type,
+        }
+
+        if public:
+            upload_params['ACL'] = 'public-read'
+
+        s3 = await self._ensure_client()
+        size_bytes = await self._multipart_upload(s3, key, _rechunk(stream, self.part_size_bytes), upload_params)
+
+        return StorageFile(
+            key=key,
+            url=await self.get_url(key),
+            content_type=content_type,
+            size_bytes=size_bytes,
+            bucket=self.bucket,
+            provider=StorageProvider.S3,
+        )
+
+    def _parse_same_endpoint_source(self, url: str) -> tuple[str, str] | None:
+        """Extract (bucket, key) when a URL points at our own S3 endpoint."""
+        parsed = urlparse(url)
+        if app_config.S3_ENDPOINT_URL:
+            endpoint_host = urlparse(app_config.S3_ENDPOINT_URL).netloc
+            if parsed.netloc == endpoint_host:
+                parts = parsed.path.lstrip('/').split('/', 1)
+                if len(parts) == 2 and parts[1]:
+                    return parts[0], parts[1]
+            return None
+
+        suffix = f'.s3.{app_config.S3_REGION}.amazonaws.com'
+        if parsed.netloc.endswith(suffix):
+            bucket = parsed.netloc.removesuffix(suffix)
+            src_key = parsed.path.lstrip('/')
+            if bucket and src_key:
+                return bucket, src_key
+        return None
+
+    async def _copy_object(self, src_bucket: str, src_key: str, key: str | None = None) -> StorageFile:
+        """Server-side copy within the same endpoint - no client bandwidth."""
+        content_type = _guess_content_type(src_key) or 'application/octet-stream'
+        key = key or self._generate_key(src_key.rsplit('/', 1)[-1], content_type)
+
+        s3 = await self._ensure_client()
+        await s3.copy_object(
+            Bucket=self.bucket,
+            Key=key,
+            CopySource={'Bucket': src_bucket, 'Key': src_key},
+        )
+        head = await s3.head_object(Bucket=self.bucket, Key=key)
+
+        return StorageFile(
+            key=key,
+            url=await self.get_url(key),
+            content_type=head.get('ContentType', content_type),
+            size_bytes=head.get('ContentLength'),
+            bucket=self.bucket,
+            provider=StorageProvider.S3,
+        )
+
     async def upload_from_url(self, url: str, key: str | None = None) -> StorageFile:
-        """Download from URL and upload to S3."""
-        async with httpx.AsyncClient(timeout=300.0) as http_client:
-            response = await http_client.get(url)
-            response.raise_for_status()
+        """Stream a file from a URL into S3 without buffering the full body.
 
-            content_type = response.headers.get('content-type', 'application/octet-stream')
-            data = response.content
+        Download and upload overlap: response chunks are fed straight into the
+        multipart workers, so peak memory stays near part_size * concurrency.
+        """
+        # Same-endpoint sources can be copied server-side, skipping the
+        # download+reupload round-trip entirely (objects > 5 GiB or permission
+        # mismatches fall back to the streaming path).
+        source = self._parse_same_endpoint_source(url)
+        if source is not None:
+            try:
+                return await self._copy_object(source[0], source[1], key)
+            except Exception:
+                pass  # Fall back to the streaming transfer below
 
         parsed_url = urlparse(url)
         filename = parsed_url.path.split('/')[-1] if parsed_url.path else None
 
-        request = UploadRequest(
-            data=data,
+        http_client = get_shared_async_client()
+        async with http_client.stream('GET', url) as response:
+            response.raise_for_status()
+
+            content_type = response.headers.get('content-type', 'application/octet-stream')
+            content_length = int(response.headers.get('content-length') or 0)
+
+            key = key or self._generate_key(filename, content_type)
+
+            upload_params: dict[str, Any] = {
+                'Bucket': self.bucket,
+                'Key': key,
+                'ContentType': content_type,
+                'ACL': 'public-read',
+            }
+
+            s3 = await self._ensure_client()
+            if 0 < content_length < self.part_size_bytes:
+                data = await response.aread()
+                await _with_retries(s3.put_object, Body=data, **upload_params)
+                size_bytes = len(data)
+            else:
+                source_iter = _rechunk(response.aiter_bytes(), self.part_size_bytes)
+                size_bytes = await self._multipart_upload(s3, key, source_iter, upload_params)
+
+        return StorageFile(
             key=key,
+            url=await self.get_url(key),
             content_type=content_type,
-            filename=filename,
+            size_bytes=size_bytes,
+            bucket=self.bucket,
+            provider=StorageProvider.S3,
         )
 
-        return await self.upload(request)
+    async def get_url(
+        self, key: str, expires_in_seconds: int | None = None, force_presigned: bool = False
+    ) -> str:
+        """Get the URL for a file.
 
-    async def get_url(self, key: str, expires_in_seconds: int | None = None) -> str:
-        """Get the URL for a file."""
-        if app_config.S3_PUBLIC_URL_BASE and not expires_in_seconds:
+        Prefers the public base URL when one is configured: it is free to
+        build and cacheable indefinitely, unlike a presigned URL. Pass
+        ``force_presigned=True`` for keys that must not go through the
+        public host.
+        """
+        if app_config.S3_PUBLIC_URL_BASE and not force_presigned:
             return f'{app_config.S3_PUBLIC_URL_BASE.rstrip("/")}/{key}'
 
         if expires_in_seconds:
-            client = await self._get_client()
-            async with client as s3:
-                return await s3.generate_presigned_url(
-                    'get_object',
-                    Params={'Bucket': self.bucket, 'Key': key},
-                    ExpiresIn=expires_in_seconds,
-                )
+            cache_key = (self.bucket, key, expires_in_seconds)
+            now = time.time()
+            cached = self._presign_cache.get(cache_key)
+            if cached and cached[1] - now > _PRESIGN_SAFETY_MARGIN:
+                self._presign_cache.move_to_end(cache_key)
+                return cached[0]
+
+            s3 = await self._ensure_client()
+            url = await s3.generate_presigned_url(
+                'get_object',
+                Params={'Bucket': self.bucket, 'Key': key},
+                ExpiresIn=expires_in_seconds,
+            )
+            # Never extend the TTL of an existing entry - only overwrite on regeneration
+            self._presign_cache[cache_key] = (url, now + expires_in_seconds)
+            self._presign_cache.move_to_end(cache_key)
+            while len(self._presign_cache) > _PRESIGN_CACHE_MAX:
+                self._presign_cache.popitem(last=False)
+            return url
 
         if app_config.S3_ENDPOINT_URL:
             return f'{app_config.S3_ENDPOINT_URL}/{self.bucket}/{key}'
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 
 from pydantic import BaseModel, Field
@@ -26,7 +26,7 @@ class StorageFile(BaseModel):
     provider: StorageProvider = Field(description='Storage provider')
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
     # Custom metadata
     metadata: dict[str, str] | None = Field(None, description='Custom metadata attached to the file')
@@ -37,7 +37,7 @@ class UploadRequest(BaseModel):
 
     # Content source (one of these must be provided)
     data: bytes | None = Field(None, description='Raw bytes to upload')
-    file_path: str | None = Field(None, description='Local file path to upload')
+    file_path: str | None = Field(None, description='Local file path to upload (streamed from disk, never fully buffered)')
     url: str | None = Field(None, description='URL to download and re-upload')
 
     # Destination
@@ -3,11 +3,30 @@
 Automatically selects R2 or S3 based on configured credentials.
 """
 
+import threading
+from functools import cache
+
 from app.core.configs import app_config
 from app.core.services.storage.base_service import StorageServiceInterface
 from app.core.services.storage.schemas import StorageProvider
 
 
+@cache
+def _r2_cls() -> type[StorageServiceInterface]:
+    """Resolve the R2 service class once (lazy import, cached)."""
+    from app.core.services.storage.providers.r2.service import R2StorageService
+
+    return R2StorageService
+
+
+@cache
+def _s3_cls() -> type[StorageServiceInterface]:
+    """Resolve the S3 service class once (lazy import, cached)."""
+    from app.core.services.storage.providers.s3.service import S3StorageService
+
+    return S3StorageService
+
+
 def get_storage_service(provider: StorageProvider | None = None) -> StorageServiceInterface:
     """Get a storage service instance.
 
@@ -34,14 +53,10 @@ def get_storage_service(provider: StorageProvider | None = None) -> StorageServi
             )
 
     if provider == StorageProvider.R2:
-        from app.core.services.storage.providers.r2.service import R2StorageService
-
-        return R2StorageService()
+        return _r2_cls()()
 
     if provider == StorageProvider.S3:
-        from app.core.services.storage.providers.s3.service import S3StorageService
-
-        return S3StorageService()
+        return _s3_cls()()
 
     raise ValueError(f'Unsupported storage provider: {provider}')
 
@@ -50,13 +65,26 @@ class _StorageServiceHolder:
     """Holder for singleton storage service instance."""
 
     instance: StorageServiceInterface | None = None
+    lock = threading.Lock()
 
 
 def get_storage() -> StorageServiceInterface:
     """Get the default storage service (singleton).
 
     Auto-detects the provider based on environment configuration.
+    Double-checked locking keeps concurrent first calls from constructing
+    two services, each holding its own client pool.
     """
     if _StorageServiceHolder.instance is None:
-        _StorageServiceHolder.instance = get_storage_service()
+        with _StorageServiceHolder.lock:
+            if _StorageServiceHolder.instance is None:
+                _StorageServiceHolder.instance = get_storage_service()
     return _StorageServiceHolder.instance
+
+
+async def close_storage() -> None:
+    """Close the singleton storage service's connections, if one was created."""
+    instance = _StorageServiceHolder.instance
+    if instance is not None:
+        await instance.close()
+        _StorageServiceHolder.instance = None
@@ -5,7 +5,7 @@ from app.core.services.voice.schemas import (
     VoiceProvider,
     VoiceSettings,
 )
-from app.core.services.voice.service import get_voice_service
+from app.core.services.voice.service import close_voice_services, get_voice_service
 
 __all__ = [
     'VoiceGenerationRequest',
@@ -13,5 +13,6 @@ __all__ = [
     'VoiceProvider',
     'VoiceServiceInterface',
     'VoiceSettings',
+    'close_voice_services',
     'get_voice_service',
 ]
@@ -1,9 +1,14 @@
+import asyncio
+import json
+import time
 import uuid
 from collections.abc import AsyncGenerator
 
 import httpx
+from pydantic import TypeAdapter
 
 from app.core.configs import app_config
+from app.core.http import POOL_LIMITS
 from app.core.services.generation.schemas import (
     GenerationError,
     GenerationResult,
@@ -17,17 +22,29 @@ from app.core.services.voice.schemas import (
     VoiceProvider,
 )
 
+# Voice catalogs change rarely, so list results are cached for a few minutes
+_VOICES_CACHE_TTL = 300.0
+
+# Built once; bulk validation runs the per-voice loop in pydantic-core
+_VOICES_ADAPTER = TypeAdapter(list[VoiceModel])
+
 
 class CartesiaVoiceService(VoiceServiceInterface):
     """Cartesia voice generation service implementation."""
 
     BASE_URL = 'https://api.cartesia.ai'
 
+    # Static payload fragments, built once instead of per call
+    _MP3_OUTPUT_FORMAT = {'container': 'mp3', 'encoding': 'mp3', 'sample_rate': 44100}
+    _RAW_OUTPUT_FORMAT = {'container': 'raw', 'encoding': 'pcm_s16le', 'sample_rate': 44100}
+
     def __init__(self) -> None:
         if not app_config.CARTESIA_API_KEY:
             raise ValueError('CARTESIA_API_KEY is not set. Please set it in your environment or .env file.')
         self._api_key: str = app_config.CARTESIA_API_KEY
         self._client: httpx.AsyncClient | None = None
+        self._voices_cache: tuple[float, list[VoiceModel]] | None = None
+        self._voices_lock = asyncio.Lock()
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
@@ -38,14 +55,22 @@ class CartesiaVoiceService(VoiceServiceInterface):
                     'Cartesia-Version': '2024-06-10',
                     'Content-Type': 'application/json',
                 },
-                timeout=120.0,
+                timeout=httpx.Timeout(
+                    connect=app_config.VOICE_TIMEOUT_CONNECT,
+                    read=app_config.VOICE_TIMEOUT_READ,
+                    write=app_config.VOICE_TIMEOUT_WRITE,
+                    pool=app_config.VOICE_TIMEOUT_POOL,
+                ),
+                limits=POOL_LIMITS,
+                http2=True,
             )
         return self._client
 
     async def generate(self, request: VoiceGenerationRequest) -> GenerationResult:
         """Generate voice audio from text using Cartesia."""
         task_id = str(uuid.uuid4())
-        result = GenerationResult(
+        # Trusted internal values; model_construct skips re-validation
+        result = GenerationResult.model_construct(
             task_id=task_id,
             type=GenerationType.VOICE,
             status=GenerationStatus.PENDING,
@@ -64,30 +89,32 @@ class CartesiaVoiceService(VoiceServiceInterface):
                     'mode': 'id',
                     'id': request.voice.voice_id,
                 },
-                'output_format': {
-                    'container': 'mp3',
-                    'encoding': 'mp3',
-                    'sample_rate': 44100,
-                },
+                'output_format': self._MP3_OUTPUT_FORMAT,
                 'language': request.settings.language,
             }
 
-            response = await client.post('/tts/bytes', json=payload)
-
-            if response.status_code != 200:
-                error_data = response.json() if response.content else {}
-                result.mark_failed(
-                    GenerationError(
-                        code='cartesia_error',
-                        message=error_data.get('message', 'Unknown error'),
-                        details=error_data,
+            # Stream the response: only the byte count is needed, so the MP3
+            # is never materialized in memory.
+            async with client.stream('POST', '/tts/bytes', json=payload) as response:
+                if response.status_code != 200:
+                    error_body = await response.aread()
+                    error_data = json.loads(error_body) if error_body else {}
+                    result.mark_failed(
+                        GenerationError(
+                            code='cartesia_error',
+                            message=error_data.get('message', 'Unknown error'),
+                            details=error_data,
+                        )
                     )
-                )
-                return result
+                    return result
+
+                audio_bytes_length = 0
+                async for chunk in response.aiter_bytes(64 * 1024):
+                    audio_bytes_length += len(chunk)
 
             result.mark_completed()
             result.output_data = {
-                'audio_bytes_length': len(response.content),
+                'audio_bytes_length': audio_bytes_length,
                 'content_type': response.headers.get('content-type'),
             }
 
@@ -113,11 +140,7 @@ class CartesiaVoiceService(VoiceServiceInterface):
                 'mode': 'id',
                 'id': request.voice.voice_id,
             },
-            'output_format': {
-                'container': 'raw',
-                'encoding': 'pcm_s16le',
-                'sample_rate': 44100,
-            },
+            'output_format': self._RAW_OUTPUT_FORMAT,
             'language': request.settings.language,
         }
 
@@ -126,26 +149,46 @@ class CartesiaVoiceService(VoiceServiceInterface):
                 yield chunk
 
     async def list_voices(self) -> list[VoiceModel]:
-        """List available voices from Cartesia."""
-        client = await self._get_client()
-        response = await client.get('/voices')
+        """List available voices from Cartesia (cached with a TTL)."""
+        cached = self._voices_cache
+        if cached and time.monotonic() - cached[0] < _VOICES_CACHE_TTL:
+            return cached[1]
 
-        if response.status_code != 200:
-            return []
-
-        data = response.json()
-        return [
-            VoiceModel(
-                provider=VoiceProvider.CARTESIA,
-                model_id='sonic-english',
-                voice_id=voice['id'],
-                name=voice.get('name'),
+        async with self._voices_lock:
+            # Re-check under the lock so concurrent misses coalesce into one call
+            cached = self._voices_cache
+            if cached and time.monotonic() - cached[0] < _VOICES_CACHE_TTL:
+                return cached[1]
+
+            client = await self._get_client()
+            response = await client.get('/voices')
+
+            if response.status_code != 200:
+                return []
+
+            data = response.json()
+            voices = _VOICES_ADAPTER.validate_python(
+                [
+                    {
+                        'provider': VoiceProvider.CARTESIA,
+                        'model_id': 'sonic-english',
+                        'voice_id': voice['id'],
+                        'name': voice.get('name'),
+                    }
+                    for voice in data.get('voices', [])
+                ]
             )
-            for voice in data.get('voices', [])
-        ]
+            self._voices_cache = (time.monotonic(), voices)
+            return voices
 
     async def get_voice(self, voice_id: str) -> VoiceModel | None:
         """Get details for a specific Cartesia voice."""
+        cached = self._voices_cache
+        if cached and time.monotonic() - cached[0] < _VOICES_CACHE_TTL:
+            for voice_model in cached[1]:
+                if voice_model.voice_id == voice_id:
+                    return voice_model
+
         client = await self._get_client()
         response = await client.get(f'/voices/{voice_id}')
 
@@ -1,9 +1,13 @@
+import asyncio
+import time
 import uuid
 from collections.abc import AsyncGenerator
 
 import httpx
+from pydantic import TypeAdapter
 
 from app.core.configs import app_config
+from app.core.http import POOL_LIMITS
 from app.core.services.generation.schemas import (
     GenerationError,
     GenerationResult,
@@ -17,6 +21,12 @@ from app.core.services.voice.schemas import (
     VoiceProvider,
 )
 
+# Voice catalogs change rarely, so list results are cached for a few minutes
+_VOICES_CACHE_TTL = 300.0
+
+# Built once; bulk validation runs the per-voice loop in pydantic-core
+_VOICES_ADAPTER = TypeAdapter(list[VoiceModel])
+
 
 class ElevenLabsVoiceService(VoiceServiceInterface):
     """ElevenLabs voice generation service implementation."""
@@ -28,6 +38,8 @@ class ElevenLabsVoiceService(VoiceServiceInterface):
             raise ValueError('ELEVENLABS_API_KEY is not set. Please set it in your environment or .env file.')
         self._api_key: str = app_config.ELEVENLABS_API_KEY
         self._client: httpx.AsyncClient | None = None
+        self._voices_cache: tuple[float, list[VoiceModel]] | None = None
+        self._voices_lock = asyncio.Lock()
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
@@ -37,14 +49,22 @@ class ElevenLabsVoiceService(VoiceServiceInterface):
                     'xi-api-key': self._api_key,
                     'Content-Type': 'application/json',
                 },
-                timeout=120.0,
+                timeout=httpx.Timeout(
+                    connect=app_config.VOICE_TIMEOUT_CONNECT,
+                    read=app_config.VOICE_TIMEOUT_READ,
+                    write=app_config.VOICE_TIMEOUT_WRITE,
+                    pool=app_config.VOICE_TIMEOUT_POOL,
+                ),
+                limits=POOL_LIMITS,
+                http2=True,
             )
         return self._client
 
     async def generate(self, request: VoiceGenerationRequest) -> GenerationResult:
         """Generate voice audio from text using ElevenLabs."""
         task_id = str(uuid.uuid4())
-        result = GenerationResult(
+        # Trusted internal values; model_construct skips re-validation
+        result = GenerationResult.model_construct(
             task_id=task_id,
             type=GenerationType.VOICE,
             status=GenerationStatus.PENDING,
@@ -106,26 +126,46 @@ class ElevenLabsVoiceService(VoiceServiceInterface):
                 yield chunk
 
     async def list_voices(self) -> list[VoiceModel]:
-        """List available voices from ElevenLabs."""
-        client = await self._get_client()
-        response = await client.get('/voices')
+        """List available voices from ElevenLabs (cached with a TTL)."""
+        cached = self._voices_cache
+        if cached and time.monotonic() - cached[0] < _VOICES_CACHE_TTL:
+            return cached[1]
 
-        if response.status_code != 200:
-            return []
-
-        data = response.json()
-        return [
-            VoiceModel(
-                provider=VoiceProvider.ELEVENLABS,
-                model_id='eleven_multilingual_v2',
-                voice_id=voice['voice_id'],
-                name=voice.get('name'),
+        async with self._voices_lock:
+            # Re-check under the lock so concurrent misses coalesce into one call
+            cached = self._voices_cache
+            if cached and time.monotonic() - cached[0] < _VOICES_CACHE_TTL:
+                return cached[1]
+
+            client = await self._get_client()
+            response = await client.get('/voices')
+
+            if response.status_code != 200:
+                return []
+
+            data = response.json()
+            voices = _VOICES_ADAPTER.validate_python(
+                [
+                    {
+                        'provider': VoiceProvider.ELEVENLABS,
+                        'model_id': 'eleven_multilingual_v2',
+                        'voice_id': voice['voice_id'],
+                        'name': voice.get('name'),
+                    }
+                    for voice in data.get('voices', [])
+                ]
             )
-            for voice in data.get('voices', [])
-        ]
+            self._voices_cache = (time.monotonic(), voices)
+            return voices
 
     async def get_voice(self, voice_id: str) -> VoiceModel | None:
         """Get details for a specific ElevenLabs voice."""
+        cached = self._voices_cache
+        if cached and time.monotonic() - cached[0] < _VOICES_CACHE_TTL:
+            for voice_model in cached[1]:
+                if voice_model.voice_id == voice_id:
+                    return voice_model
+
         client = await self._get_client()
         response = await client.get(f'/voices/{voice_id}')
 
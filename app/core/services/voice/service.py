@@ -1,9 +1,45 @@
+import threading
+from collections.abc import Callable
+from functools import cache
+
 from app.core.services.voice.base_service import VoiceServiceInterface
 from app.core.services.voice.schemas import VoiceProvider
 
 
+@cache
+def _elevenlabs_cls() -> type[VoiceServiceInterface]:
+    """Resolve the ElevenLabs service class once (lazy import, cached)."""
+    from app.core.services.voice.providers.elevenlabs.service import ElevenLabsVoiceService
+
+    return ElevenLabsVoiceService
+
+
+@cache
+def _cartesia_cls() -> type[VoiceServiceInterface]:
+    """Resolve the Cartesia service class once (lazy import, cached)."""
+    from app.core.services.voice.providers.cartesia.service import CartesiaVoiceService
+
+    return CartesiaVoiceService
+
+
+# Dispatch table: one dict lookup per call, provider modules imported on first use
+_FACTORIES: dict[VoiceProvider, Callable[[], type[VoiceServiceInterface]]] = {
+    VoiceProvider.ELEVENLABS: _elevenlabs_cls,
+    VoiceProvider.CARTESIA: _cartesia_cls,
+}
+
+# One service per provider for the life of the process. Rebuilding the
+# service per call would tear down and recreate its pooled HTTP client,
+# paying TLS handshake + DNS on every activity invocation.
+_services: dict[VoiceProvider, VoiceServiceInterface] = {}
+_services_lock = threading.Lock()
+
+
 def get_voice_service(provider: VoiceProvider = VoiceProvider.ELEVENLABS) -> VoiceServiceInterface:
-    """Factory function to get a voice service instance.
+    """Get the shared voice service for a provider.
+
+    Double-checked locking keeps concurrent first calls from constructing
+    two services, each holding its own client pool.
 
     Args:
         provider: Voice provider to use (default: ElevenLabs)
@@ -11,12 +47,21 @@ def get_voice_service(provider: VoiceProvider = VoiceProvider.ELEVENLABS) -> Voi
     Returns:
         VoiceServiceInterface implementation
     """
-    if provider == VoiceProvider.ELEVENLABS:
-        from app.core.services.voice.providers.elevenlabs.service import ElevenLabsVoiceService
+    service = _services.get(provider)
+    if service is None:
+        factory = _FACTORIES.get(provider)
+        if factory is None:
+            raise ValueError(f'Unsupported voice provider: {provider}')
+        with _services_lock:
+            service = _services.get(provider)
+            if service is None:
+                service = factory()()
+                _services[provider] = service
+    return service
 
-        return ElevenLabsVoiceService()
-    if provider == VoiceProvider.CARTESIA:
-        from app.core.services.voice.providers.cartesia.service import CartesiaVoiceService
 
-        return CartesiaVoiceService()
-    raise ValueError(f'Unsupported voice provider: {provider}')
+async def close_voice_services() -> None:
+    """Close any voice services created during this process's lifetime."""
+    while _services:
+        _, service = _services.popitem()
+        await service.close()
@@ -68,17 +68,20 @@ result = await run_activity(
 - utility/   - General utilities
 """
 
-from app.core.tools.base import (
-    ToolCategory,
-    ToolDefinition,
-    ToolInput,
-    ToolOutput,
-)
-from app.core.tools.registry import (
-    ToolInfoResponse,
-    ToolsListResponse,
-    tool_registry,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.core.tools.base import (
+        ToolCategory,
+        ToolDefinition,
+        ToolInput,
+        ToolOutput,
+    )
+    from app.core.tools.registry import (
+        ToolInfoResponse,
+        ToolsListResponse,
+        tool_registry,
+    )
 
 __all__ = [
     # Base classes
@@ -92,3 +95,28 @@ __all__ = [
     'ToolInfoResponse',
     'ToolsListResponse',
 ]
+
+# PEP 562 lazy exports: importing the package stays cheap, and the
+# pydantic-heavy base/registry modules load on first attribute access.
+_EXPORT_MODULES = {
+    'ToolCategory': 'app.core.tools.base',
+    'ToolDefinition': 'app.core.tools.base',
+    'ToolInput': 'app.core.tools.base',
+    'ToolOutput': 'app.core.tools.base',
+    'tool_registry': 'app.core.tools.registry',
+    'ToolInfoResponse': 'app.core.tools.registry',
+    'ToolsListResponse': 'app.core.tools.registry',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _EXPORT_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_path), name)
+    # Cache on the module so __getattr__ only runs once per name
+    globals()[name] = value
+    return value
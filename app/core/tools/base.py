@@ -13,11 +13,23 @@ Each tool has:
 
 from abc import abstractmethod
 from enum import Enum
+from functools import cache
 from typing import Any, ClassVar
 
 from pydantic import BaseModel, Field
 
 
+@cache
+def _json_schema_for(model_cls: type[BaseModel]) -> dict[str, Any]:
+    """Build a model's JSON schema once per class.
+
+    Schema generation is one of the most expensive pydantic operations and
+    the result is invariant for a given class, so it is memoized here.
+    Callers must treat the returned dict as read-only.
+    """
+    return model_cls.model_json_schema()
+
+
 class ToolCategory(str, Enum):
     """Category of the tool."""
 
@@ -99,12 +111,12 @@ class ToolDefinition(BaseModel):
     output_class: ClassVar[type[ToolOutput]]
 
     def get_input_schema(self) -> dict[str, Any]:
-        """Get the JSON schema for this tool's inputs."""
-        return self.input_class.model_json_schema()
+        """Get the JSON schema for this tool's inputs (cached per class)."""
+        return _json_schema_for(self.input_class)
 
     def get_output_schema(self) -> dict[str, Any]:
-        """Get the JSON schema for this tool's outputs."""
-        return self.output_class.model_json_schema()
+        """Get the JSON schema for this tool's outputs (cached per class)."""
+        return _json_schema_for(self.output_class)
 
     def validate_input(self, input_data: dict[str, Any]) -> ToolInput:
         """Validate and parse input data against this tool's schema."""
@@ -0,0 +1,12 @@
+"""In-process TTL + LRU cache for rewrite results.
+
+Rewrite results are stable for the lifetime of the upstream URL, and
+workflows often re-process the same scraped media across runs within
+minutes. Caching recent results skips the slow rewrite POST entirely on
+repeat hits.
+"""
+
+from app.core.cache import TTLCache
+
+# Rewrite caches map (source_url, device) tuples to rewritten URLs
+RewriteCache = TTLCache[str]
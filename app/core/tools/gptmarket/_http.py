@@ -0,0 +1,76 @@
+"""Shared HTTP helper for GPTMarket tools.
+
+The rewrite tools all POST a JSON payload and treat any failure the same
+way: log a warning and fall back. Centralizing the request plus its four
+error branches keeps each tool's hot path to a single None check.
+"""
+
+import logging
+from functools import cache, lru_cache
+from typing import Any
+
+
+@cache
+def endpoint_url(path: str) -> str:
+    """Absolute URL for a GPTMarket API path (formatted once per path)."""
+    from app.core.configs import app_config
+
+    return f'{app_config.GPTMARKET_API_URL}{path}'
+
+
+@lru_cache(maxsize=1)
+def api_headers(api_key: str) -> dict[str, str]:
+    """Static request headers, rebuilt only if the API key changes."""
+    return {
+        'Content-Type': 'application/json',
+        'X-API-Key': api_key,
+    }
+
+
+async def post_json(
+    url: str,
+    *,
+    payload: Any,
+    headers: dict[str, str],
+    timeout: float,
+    logger: logging.Logger,
+    context: str,
+) -> Any | None:
+    """POST an orjson-serialized payload and decode the JSON response.
+
+    Args:
+        url: Endpoint URL
+        payload: JSON-serializable request body
+        headers: Request headers (Content-Type should already be set)
+        timeout: Per-request timeout in seconds
+        logger: Tool logger used for failure warnings
+        context: Human-readable label used in log messages
+
+    Returns:
+        Decoded response body, or None on timeout, HTTP error, transport
+        failure, or undecodable JSON
+    """
+    import httpx
+    import orjson
+
+    from app.core.http import get_shared_async_client
+
+    client = get_shared_async_client()
+    try:
+        response = await client.post(url, content=orjson.dumps(payload), headers=headers, timeout=timeout)
+        response.raise_for_status()
+    except httpx.TimeoutException:
+        logger.warning('%s request timed out', context)
+        return None
+    except httpx.HTTPStatusError as e:
+        logger.warning('%s API error: %s - %s', context, e.response.status_code, e.response.text)
+        return None
+    except httpx.RequestError as e:
+        logger.warning('%s request failed: %s', context, e)
+        return None
+
+    try:
+        return orjson.loads(response.content)
+    except ValueError:
+        logger.warning('Invalid JSON response from %s API', context)
+        return None
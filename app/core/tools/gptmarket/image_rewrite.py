@@ -5,27 +5,43 @@ Rewrites images by modifying metadata and applying subtle visual augmentations
 Uses the GPTMarket.io /v1/rewrite/image endpoint.
 """
 
+import asyncio
 import logging
+from functools import cache
 
-import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from app.core.configs import app_config
 from app.core.tools.base import ToolCategory, ToolDefinition, ToolInput, ToolOutput
+from app.core.tools.gptmarket._cache import RewriteCache
+from app.core.tools.gptmarket._http import api_headers, endpoint_url, post_json
 from app.core.tools.registry import tool_registry
 
 logger = logging.getLogger(__name__)
 
+# Upstream accepts up to 50 images per call, but smaller parallel batches
+# limit fallback blast radius and overlap network latency.
+_BATCH_SIZE = 8
+_MAX_CONCURRENT_BATCHES = 8
+
+# Recent (image_url, device) rewrites; hits skip the ~10s upstream POST
+_rewrite_cache = RewriteCache()
+
 
 class ImageRewriteItem(BaseModel):
     """A single image to rewrite."""
 
+    # Built in tight loops and never mutated; frozen instances skip
+    # mutation bookkeeping in pydantic-core
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     image_url: str = Field(..., description='URL of the image to rewrite')
 
 
 class RewrittenImage(BaseModel):
     """A rewritten image result."""
 
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     original_url: str = Field(..., description='Original image URL')
     rewritten_url: str = Field(..., description='Rewritten image URL')
 
@@ -54,7 +70,8 @@ class GptMarketImageRewriteOutput(ToolOutput):
 
 def _fallback_to_originals(images: list[ImageRewriteItem]) -> list[RewrittenImage]:
     """Return original URLs as fallback when rewrite fails."""
-    return [RewrittenImage(original_url=img.image_url, rewritten_url=img.image_url) for img in images]
+    # Values are already-validated strings; model_construct skips re-validation
+    return [RewrittenImage.model_construct(original_url=img.image_url, rewritten_url=img.image_url) for img in images]
 
 
 class GptMarketImageRewriteTool(ToolDefinition):
@@ -82,6 +99,8 @@ class GptMarketImageRewriteTool(ToolDefinition):
         """
         assert isinstance(input, GptMarketImageRewriteInput)
 
+        from app.core.configs import app_config
+
         api_key = app_config.GPTMARKET_API_KEY
         if not api_key:
             logger.warning('GPTMARKET_API_KEY not configured, returning original URLs')
@@ -91,86 +110,57 @@ class GptMarketImageRewriteTool(ToolDefinition):
                 total=len(input.images),
             )
 
-        url = f'{app_config.GPTMARKET_API_URL}/v1/rewrite/image'
-
-        headers = {
-            'Content-Type': 'application/json',
-            'X-API-Key': api_key,
-        }
+        url = endpoint_url('/v1/rewrite/image')
+        headers = api_headers(api_key)
 
-        payload = [
-            {'image_url': img.image_url, 'device': input.device} if input.device else {'image_url': img.image_url}
-            for img in input.images
+        # Coalesce duplicates: each unique URL goes upstream once and the
+        # result fans back out, saving bandwidth and rate-limit budget when
+        # workflows repeat the same source image across variants
+        unique_items = [
+            ImageRewriteItem.model_construct(image_url=u)
+            for u in dict.fromkeys(img.image_url for img in input.images)
         ]
 
-        async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-            try:
-                response = await client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                logger.warning('Image rewrite request timed out, returning original URLs')
-                return GptMarketImageRewriteOutput(
-                    success=True,
-                    images=_fallback_to_originals(input.images),
-                    total=len(input.images),
-                )
-            except httpx.HTTPStatusError as e:
-                logger.warning(
-                    'Image rewrite API error: %s - %s, returning original URLs',
-                    e.response.status_code,
-                    e.response.text,
-                )
-                return GptMarketImageRewriteOutput(
-                    success=True,
-                    images=_fallback_to_originals(input.images),
-                    total=len(input.images),
-                )
-            except httpx.RequestError as e:
-                logger.warning('Image rewrite request failed: %s, returning original URLs', e)
-                return GptMarketImageRewriteOutput(
-                    success=True,
-                    images=_fallback_to_originals(input.images),
-                    total=len(input.images),
-                )
-
-            try:
-                data = response.json()
-            except ValueError:
-                logger.warning('Invalid JSON response from image rewrite API, returning original URLs')
-                return GptMarketImageRewriteOutput(
-                    success=True,
-                    images=_fallback_to_originals(input.images),
-                    total=len(input.images),
-                )
+        # Probe the cache first; only misses go upstream
+        mapping: dict[str, str] = {}
+        misses: list[ImageRewriteItem] = []
+        for item in unique_items:
+            cached = _rewrite_cache.get((item.image_url, input.device))
+            if cached is not None:
+                mapping[item.image_url] = cached
+            else:
+                misses.append(item)
 
-        # Parse response - format: {"metadata": {...}, "data": {"urls": [...]}}
-        rewritten_images = []
-        urls = []
-        if isinstance(data.get('data'), dict):
-            urls = data['data'].get('urls', [])
+        chunks = [misses[i : i + _BATCH_SIZE] for i in range(0, len(misses), _BATCH_SIZE)]
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_BATCHES)
 
-        for i, img in enumerate(input.images):
-            original_url = img.image_url
+        results = await asyncio.gather(
+            *(self._rewrite_batch(url, headers, chunk, input.device, semaphore) for chunk in chunks),
+            return_exceptions=True,
+        )
 
-            if i < len(urls) and urls[i]:
-                rewritten_images.append(
-                    RewrittenImage(
-                        original_url=original_url,
-                        rewritten_url=urls[i],
-                    )
-                )
+        # Map each unique URL to its rewrite; a failed batch only falls back
+        # its own images, not the whole request.
+        for chunk, result in zip(chunks, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning('Image rewrite batch failed: %s, using originals for %d images', result, len(chunk))
+                for img in chunk:
+                    mapping[img.image_url] = img.image_url
             else:
-                logger.warning(
-                    'No rewritten URL for image %d (%s), using original',
-                    i,
-                    original_url,
-                )
-                rewritten_images.append(
-                    RewrittenImage(
-                        original_url=original_url,
-                        rewritten_url=original_url,
-                    )
-                )
+                for rewritten in result:
+                    mapping[rewritten.original_url] = rewritten.rewritten_url
+                    # Cache only genuine rewrites, never failure fallbacks
+                    if rewritten.rewritten_url != rewritten.original_url:
+                        _rewrite_cache.put((rewritten.original_url, input.device), rewritten.rewritten_url)
+
+        # Fan back out to the per-input results, preserving order
+        rewritten_images = [
+            RewrittenImage.model_construct(
+                original_url=img.image_url,
+                rewritten_url=mapping.get(img.image_url) or img.image_url,
+            )
+            for img in input.images
+        ]
 
         logger.info('Successfully rewrote %d images', len(rewritten_images))
         return GptMarketImageRewriteOutput(
@@ -179,17 +169,66 @@ class GptMarketImageRewriteTool(ToolDefinition):
             total=len(rewritten_images),
         )
 
+    async def _rewrite_batch(
+        self,
+        url: str,
+        headers: dict[str, str],
+        images: list[ImageRewriteItem],
+        device: str | None,
+        semaphore: asyncio.Semaphore,
+    ) -> list[RewrittenImage]:
+        """Rewrite one batch of images, falling back to originals on failure."""
+        payload = [
+            {'image_url': img.image_url, 'device': device} if device else {'image_url': img.image_url}
+            for img in images
+        ]
+
+        async with semaphore:
+            data = await post_json(
+                url,
+                payload=payload,
+                headers=headers,
+                timeout=self.timeout_seconds,
+                logger=logger,
+                context='Image rewrite',
+            )
+        if data is None:
+            return _fallback_to_originals(images)
+
+        # Parse response - format: {"metadata": {...}, "data": {"urls": [...]}}
+        urls: list[str | None] = []
+        if isinstance(data.get('data'), dict):
+            urls = data['data'].get('urls', [])
+
+        # Pad/truncate once so the build below is a single zip pass with no
+        # per-item bounds checks
+        padded = (list(urls) + [None] * len(images))[: len(images)]
+
+        if logger.isEnabledFor(logging.WARNING):
+            for i, (img, rewritten) in enumerate(zip(images, padded, strict=True)):
+                if not rewritten:
+                    logger.warning('No rewritten URL for image %d (%s), using original', i, img.image_url)
+
+        return [
+            RewrittenImage.model_construct(original_url=img.image_url, rewritten_url=rewritten or img.image_url)
+            for img, rewritten in zip(images, padded, strict=True)
+        ]
+
+
+@cache
+def get_tool() -> GptMarketImageRewriteTool:
+    """Build the image rewrite tool definition (once, on first use)."""
+    return GptMarketImageRewriteTool(
+        id='gptmarket-image-rewrite',
+        name='GPTMarket Image Rewrite',
+        category=ToolCategory.MEDIA,
+        description='Make images appear as fresh original uploads. Bypasses duplicate detection and AI content filters.',
+        version='1.0.0',
+        avg_execution_time_seconds=10.0,
+        rate_limit_per_minute=30,
+        requires_api_key=True,
+        timeout_seconds=60.0,
+    )
 
-GptMarketImageRewrite = GptMarketImageRewriteTool(
-    id='gptmarket-image-rewrite',
-    name='GPTMarket Image Rewrite',
-    category=ToolCategory.MEDIA,
-    description='Make images appear as fresh original uploads. Bypasses duplicate detection and AI content filters.',
-    version='1.0.0',
-    avg_execution_time_seconds=10.0,
-    rate_limit_per_minute=30,
-    requires_api_key=True,
-    timeout_seconds=60.0,
-)
 
-tool_registry.register(GptMarketImageRewrite)
+tool_registry.register_lazy('gptmarket-image-rewrite', ToolCategory.MEDIA, get_tool)
@@ -4,20 +4,54 @@ Scrapes Pinterest pins based on search queries.
 Uses the GPTMarket.io /v1/pins/scrape endpoint.
 """
 
+from collections.abc import AsyncIterator
+from functools import cache
 from typing import Any
 
-import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.core.ai_models.common import AspectRatio
-from app.core.configs import app_config
 from app.core.tools.base import ToolCategory, ToolDefinition, ToolInput, ToolOutput
+from app.core.tools.gptmarket._http import api_headers, endpoint_url
 from app.core.tools.registry import tool_registry
 
 
+class _AsyncByteReader:
+    """Async file-like adapter over an async byte iterator.
+
+    ijson's async mode reads from objects exposing a ``read`` coroutine;
+    httpx responses only offer an async iterator, so this replays the
+    iterator's chunks through ``read`` calls, returning ``b''`` once the
+    stream is exhausted.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+        self._leftover = b''
+
+    async def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes (all buffered bytes when negative)."""
+        if self._leftover:
+            data, self._leftover = self._leftover, b''
+        else:
+            data = b''
+            async for chunk in self._chunks:
+                if chunk:
+                    data = chunk
+                    break
+        if 0 <= size < len(data):
+            self._leftover = data[size:]
+            data = data[:size]
+        return data
+
+
 class GptMarketPinterestPin(BaseModel):
     """A single Pinterest pin from GPTMarket API."""
 
+    # Built per pin in the scrape loop and never mutated; frozen instances
+    # skip mutation bookkeeping in pydantic-core
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     id: str = Field(..., description='Pin ID')
     title: str | None = Field(None, description='Pin title')
     description: str | None = Field(None, description='Pin description')
@@ -59,6 +93,14 @@ class GptMarketPinterestScraperTool(ToolDefinition):
             GptMarketPinterestScraperOutput with pins or error
         """
         assert isinstance(input, GptMarketPinterestScraperInput)
+
+        import httpx
+        import ijson
+        import orjson
+
+        from app.core.configs import app_config
+        from app.core.http import get_shared_async_client
+
         api_key = app_config.GPTMARKET_API_KEY
         if not api_key:
             return GptMarketPinterestScraperOutput.failure(
@@ -68,12 +110,8 @@ class GptMarketPinterestScraperTool(ToolDefinition):
                 query=input.search_query,
             )
 
-        url = f'{app_config.GPTMARKET_API_URL}/v1/scraping/pins'
-
-        headers = {
-            'Content-Type': 'application/json',
-            'X-API-Key': api_key,
-        }
+        url = endpoint_url('/v1/scraping/pins')
+        headers = api_headers(api_key)
 
         payload = {
             'search_query': input.search_query,
@@ -81,69 +119,76 @@ class GptMarketPinterestScraperTool(ToolDefinition):
             'pages': input.pages,
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-            try:
-                response = await client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                return GptMarketPinterestScraperOutput.failure(
-                    error='Request timed out',
-                    pins=[],
-                    total=0,
-                    query=input.search_query,
-                )
-            except httpx.HTTPStatusError as e:
-                return GptMarketPinterestScraperOutput.failure(
-                    error=f'API error: {e.response.status_code} - {e.response.text}',
-                    pins=[],
-                    total=0,
-                    query=input.search_query,
-                )
-            except httpx.RequestError as e:
-                return GptMarketPinterestScraperOutput.failure(
-                    error=f'Request failed: {e}',
-                    pins=[],
-                    total=0,
-                    query=input.search_query,
-                )
-
-            try:
-                data: dict[str, Any] = response.json()
-            except ValueError:
-                return GptMarketPinterestScraperOutput.failure(
-                    error='Invalid JSON response from API',
-                    pins=[],
-                    total=0,
-                    query=input.search_query,
-                )
-
-        # Parse pins from response - structure is data.data.data.pins
-        inner_data = data.get('data', {})
-        pins_data = inner_data.get('data', {})
-        metadata = inner_data.get('metadata', {})
-        raw_pins = pins_data.get('pins', [])
-
-        pins = []
-        for pin_data in raw_pins:
-            try:
-                # Only include 9:16 aspect ratio pins
-                aspect_ratio_str = pin_data.get('aspect_ratio', '')
-                if aspect_ratio_str != AspectRatio.PORTRAIT_9_16.value:
-                    continue
-
-                pin = GptMarketPinterestPin(
-                    id=str(pin_data.get('id', '')),
-                    title=pin_data.get('title'),
-                    description=pin_data.get('description'),
-                    image_url=pin_data.get('image_url', ''),
-                    aspect_ratio=AspectRatio.PORTRAIT_9_16,
-                    image_width=pin_data.get('image_width'),
-                    image_height=pin_data.get('image_height'),
-                )
-                pins.append(pin)
-            except Exception:
-                # Skip malformed pins (e.g., missing required fields)
-                pass
+        client = get_shared_async_client()
+
+        # Hoist the enum attribute lookup; the literal comparison below is a
+        # pointer compare in the common case since both sides are interned
+        target_ratio = AspectRatio.PORTRAIT_9_16.value
+
+        pin_prefix = 'data.data.pins.item'
+        meta_prefix = 'data.metadata.'
+
+        metadata: dict[str, Any] = {}
+        pins: list[GptMarketPinterestPin] = []
+        current: dict[str, Any] | None = None
+
+        try:
+            async with client.stream(
+                'POST', url, content=orjson.dumps(payload), headers=headers, timeout=self.timeout_seconds
+            ) as response:
+                if response.status_code >= 400:
+                    body = await response.aread()
+                    return GptMarketPinterestScraperOutput.failure(
+                        error=f'API error: {response.status_code} - {body.decode(errors="replace")}',
+                        pins=[],
+                        total=0,
+                        query=input.search_query,
+                    )
+
+                # Stream-parse the response: pins are filtered and built as
+                # their events arrive, so non-matching pins are discarded
+                # without ever materializing and peak memory stays flat even
+                # for multi-page scrapes. Structure is data.data.data.pins
+                # with metadata alongside at data.data.metadata.
+                async for prefix, event, value in ijson.parse(_AsyncByteReader(response.aiter_bytes())):
+                    if prefix == pin_prefix:
+                        if event == 'start_map':
+                            current = {}
+                        elif event == 'end_map' and current is not None:
+                            pin = self._build_pin(current, target_ratio)
+                            if pin is not None:
+                                pins.append(pin)
+                            current = None
+                    elif current is not None and prefix.startswith(pin_prefix):
+                        key = prefix[len(pin_prefix) + 1 :]
+                        # Only keep top-level scalar pin fields
+                        if '.' not in key:
+                            current[key] = value
+                    elif prefix.startswith(meta_prefix):
+                        key = prefix[len(meta_prefix) :]
+                        if '.' not in key:
+                            metadata[key] = value
+        except httpx.TimeoutException:
+            return GptMarketPinterestScraperOutput.failure(
+                error='Request timed out',
+                pins=[],
+                total=0,
+                query=input.search_query,
+            )
+        except httpx.RequestError as e:
+            return GptMarketPinterestScraperOutput.failure(
+                error=f'Request failed: {e}',
+                pins=[],
+                total=0,
+                query=input.search_query,
+            )
+        except ijson.JSONError:
+            return GptMarketPinterestScraperOutput.failure(
+                error='Invalid JSON response from API',
+                pins=[],
+                total=0,
+                query=input.search_query,
+            )
 
         return GptMarketPinterestScraperOutput(
             success=True,
@@ -152,17 +197,46 @@ class GptMarketPinterestScraperTool(ToolDefinition):
             query=metadata.get('search_query', input.search_query),
         )
 
+    @staticmethod
+    def _build_pin(pin_data: dict[str, Any], target_ratio: str) -> GptMarketPinterestPin | None:
+        """Build a pin from streamed fields, or None if filtered/malformed."""
+        # Only include 9:16 aspect ratio pins
+        if pin_data.get('aspect_ratio', '') != target_ratio:
+            return None
+
+        # Explicit field checks instead of a per-pin try/except: malformed
+        # pins are skipped without exception-handler cost on the hot path
+        image_url = pin_data.get('image_url')
+        if not isinstance(image_url, str) or not image_url:
+            return None
+
+        # Fields come straight from our own parsing; model_construct
+        # skips per-pin validation overhead
+        return GptMarketPinterestPin.model_construct(
+            id=str(pin_data.get('id', '')),
+            title=pin_data.get('title'),
+            description=pin_data.get('description'),
+            image_url=image_url,
+            aspect_ratio=AspectRatio.PORTRAIT_9_16,
+            image_width=pin_data.get('image_width'),
+            image_height=pin_data.get('image_height'),
+        )
+
+
+@cache
+def get_tool() -> GptMarketPinterestScraperTool:
+    """Build the Pinterest scraper tool definition (once, on first use)."""
+    return GptMarketPinterestScraperTool(
+        id='gptmarket-pinterest-scraper',
+        name='GPTMarket Pinterest Scraper',
+        category=ToolCategory.SCRAPER,
+        description='Scrape Pinterest pins based on search queries via GPTMarket API.',
+        version='1.0.0',
+        avg_execution_time_seconds=5.0,
+        rate_limit_per_minute=60,
+        requires_api_key=True,
+        timeout_seconds=30.0,
+    )
 
-GptMarketPinterestScraper = GptMarketPinterestScraperTool(
-    id='gptmarket-pinterest-scraper',
-    name='GPTMarket Pinterest Scraper',
-    category=ToolCategory.SCRAPER,
-    description='Scrape Pinterest pins based on search queries via GPTMarket API.',
-    version='1.0.0',
-    avg_execution_time_seconds=5.0,
-    rate_limit_per_minute=60,
-    requires_api_key=True,
-    timeout_seconds=30.0,
-)
 
-tool_registry.register(GptMarketPinterestScraper)
+tool_registry.register_lazy('gptmarket-pinterest-scraper', ToolCategory.SCRAPER, get_tool)
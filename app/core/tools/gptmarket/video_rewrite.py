@@ -6,16 +6,20 @@ Uses the GPTMarket.io /v1/rewrite/video endpoint.
 """
 
 import logging
+from functools import cache
 
-import httpx
 from pydantic import Field
 
-from app.core.configs import app_config
 from app.core.tools.base import ToolCategory, ToolDefinition, ToolInput, ToolOutput
+from app.core.tools.gptmarket._cache import RewriteCache
+from app.core.tools.gptmarket._http import api_headers, endpoint_url, post_json
 from app.core.tools.registry import tool_registry
 
 logger = logging.getLogger(__name__)
 
+# Recent (video_url, playback_speed, device) rewrites; hits skip the slow POST
+_rewrite_cache = RewriteCache()
+
 
 class GptMarketVideoRewriteInput(ToolInput):
     """Input for GPTMarket Video Rewrite tool."""
@@ -65,6 +69,8 @@ class GptMarketVideoRewriteTool(ToolDefinition):
         """
         assert isinstance(input, GptMarketVideoRewriteInput)
 
+        from app.core.configs import app_config
+
         api_key = app_config.GPTMARKET_API_KEY
         if not api_key:
             logger.warning('GPTMARKET_API_KEY not configured, returning original URL')
@@ -74,12 +80,17 @@ class GptMarketVideoRewriteTool(ToolDefinition):
                 rewritten_url=input.video_url,
             )
 
-        url = f'{app_config.GPTMARKET_API_URL}/v1/rewrite/video'
+        cache_key = (input.video_url, input.playback_speed, input.device)
+        cached = _rewrite_cache.get(cache_key)
+        if cached is not None:
+            return GptMarketVideoRewriteOutput(
+                success=True,
+                original_url=input.video_url,
+                rewritten_url=cached,
+            )
 
-        headers = {
-            'Content-Type': 'application/json',
-            'X-API-Key': api_key,
-        }
+        url = endpoint_url('/v1/rewrite/video')
+        headers = api_headers(api_key)
 
         payload: dict = {
             'video_url': input.video_url,
@@ -88,56 +99,20 @@ class GptMarketVideoRewriteTool(ToolDefinition):
         if input.device:
             payload['device'] = input.device
 
-        async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-            try:
-                response = await client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                logger.warning(
-                    'Video rewrite request timed out for %s, returning original URL',
-                    input.video_url,
-                )
-                return GptMarketVideoRewriteOutput(
-                    success=True,
-                    original_url=input.video_url,
-                    rewritten_url=input.video_url,
-                )
-            except httpx.HTTPStatusError as e:
-                logger.warning(
-                    'Video rewrite API error: %s - %s for %s, returning original URL',
-                    e.response.status_code,
-                    e.response.text,
-                    input.video_url,
-                )
-                return GptMarketVideoRewriteOutput(
-                    success=True,
-                    original_url=input.video_url,
-                    rewritten_url=input.video_url,
-                )
-            except httpx.RequestError as e:
-                logger.warning(
-                    'Video rewrite request failed: %s for %s, returning original URL',
-                    e,
-                    input.video_url,
-                )
-                return GptMarketVideoRewriteOutput(
-                    success=True,
-                    original_url=input.video_url,
-                    rewritten_url=input.video_url,
-                )
-
-            try:
-                data = response.json()
-            except ValueError:
-                logger.warning(
-                    'Invalid JSON response from video rewrite API for %s, returning original URL',
-                    input.video_url,
-                )
-                return GptMarketVideoRewriteOutput(
-                    success=True,
-                    original_url=input.video_url,
-                    rewritten_url=input.video_url,
-                )
+        data = await post_json(
+            url,
+            payload=payload,
+            headers=headers,
+            timeout=self.timeout_seconds,
+            logger=logger,
+            context=f'Video rewrite ({input.video_url})',
+        )
+        if data is None:
+            return GptMarketVideoRewriteOutput(
+                success=True,
+                original_url=input.video_url,
+                rewritten_url=input.video_url,
+            )
 
         # Parse response - format: {"metadata": {...}, "data": {"url": "..."}}
         rewritten_url = ''
@@ -155,6 +130,7 @@ class GptMarketVideoRewriteTool(ToolDefinition):
                 rewritten_url=input.video_url,
             )
 
+        _rewrite_cache.put(cache_key, rewritten_url)
         logger.info('Successfully rewrote video %s', input.video_url)
         return GptMarketVideoRewriteOutput(
             success=True,
@@ -163,16 +139,20 @@ class GptMarketVideoRewriteTool(ToolDefinition):
         )
 
 
-GptMarketVideoRewrite = GptMarketVideoRewriteTool(
-    id='gptmarket-video-rewrite',
-    name='GPTMarket Video Rewrite',
-    category=ToolCategory.MEDIA,
-    description='Make videos appear as fresh original uploads. Bypasses duplicate detection and AI content filters.',
-    version='1.0.0',
-    avg_execution_time_seconds=30.0,
-    rate_limit_per_minute=10,
-    requires_api_key=True,
-    timeout_seconds=120.0,
-)
+@cache
+def get_tool() -> GptMarketVideoRewriteTool:
+    """Build the video rewrite tool definition (once, on first use)."""
+    return GptMarketVideoRewriteTool(
+        id='gptmarket-video-rewrite',
+        name='GPTMarket Video Rewrite',
+        category=ToolCategory.MEDIA,
+        description='Make videos appear as fresh original uploads. Bypasses duplicate detection and AI content filters.',
+        version='1.0.0',
+        avg_execution_time_seconds=30.0,
+        rate_limit_per_minute=10,
+        requires_api_key=True,
+        timeout_seconds=120.0,
+    )
+
 
-tool_registry.register(GptMarketVideoRewrite)
+tool_registry.register_lazy('gptmarket-video-rewrite', ToolCategory.MEDIA, get_tool)
@@ -7,6 +7,8 @@ Discovery happens in `app/temporal/registry.py` alongside workflow/activity disc
 """
 
 import logging
+from collections import defaultdict
+from collections.abc import Callable
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -17,10 +19,23 @@ logger = logging.getLogger(__name__)
 
 
 class ToolRegistry:
-    """Registry of all available tools."""
+    """Registry of all available tools.
+
+    Tools can register eagerly with a built ToolDefinition, or lazily with
+    a loader callable so the tool (and its heavy imports) is only built on
+    first lookup.
+    """
 
     def __init__(self) -> None:
         self._tools: dict[str, ToolDefinition] = {}
+        self._lazy: dict[str, tuple[ToolCategory, Callable[[], ToolDefinition]]] = {}
+        # Auxiliary indexes so the list methods don't rescan the catalog
+        self._by_category: defaultdict[ToolCategory, list[ToolDefinition]] = defaultdict(list)
+        self._ids_cache: list[str] | None = None
+        # Bumped whenever catalog membership changes, so callers can cache
+        # derived views and invalidate cheaply (materializing a lazy tool
+        # doesn't change membership and doesn't bump)
+        self._version = 0
 
     def register(self, tool: ToolDefinition) -> None:
         """Register a tool.
@@ -31,19 +46,62 @@ class ToolRegistry:
         Raises:
             ValueError: If a tool with the same ID is already registered
         """
-        if tool.id in self._tools:
+        if tool.id in self._tools or tool.id in self._lazy:
             raise ValueError(f'Tool with ID "{tool.id}" is already registered')
         self._tools[tool.id] = tool
+        self._by_category[tool.category].append(tool)
+        self._ids_cache = None
+        self._version += 1
         logger.debug(f'Registered tool: {tool.id}')
 
+    def register_lazy(self, tool_id: str, category: ToolCategory, loader: Callable[[], ToolDefinition]) -> None:
+        """Register a tool without building it yet.
+
+        The loader runs on first lookup and its result is cached. The
+        category is stored up front so list_by_category can skip loaders
+        for tools it would filter out anyway.
+
+        Args:
+            tool_id: Unique tool ID
+            category: Category the built tool will report
+            loader: Zero-argument callable that builds the ToolDefinition
+
+        Raises:
+            ValueError: If a tool with the same ID is already registered
+        """
+        if tool_id in self._tools or tool_id in self._lazy:
+            raise ValueError(f'Tool with ID "{tool_id}" is already registered')
+        self._lazy[tool_id] = (category, loader)
+        self._ids_cache = None
+        self._version += 1
+        logger.debug(f'Registered tool (lazy): {tool_id}')
+
+    def _materialize(self, tool_id: str) -> ToolDefinition | None:
+        """Build and cache a lazily registered tool, if one exists."""
+        entry = self._lazy.pop(tool_id, None)
+        if entry is None:
+            return None
+        tool = entry[1]()
+        self._tools[tool_id] = tool
+        self._by_category[tool.category].append(tool)
+        return tool
+
     def unregister(self, tool_id: str) -> None:
         """Unregister a tool by ID."""
-        if tool_id in self._tools:
-            del self._tools[tool_id]
+        tool = self._tools.pop(tool_id, None)
+        if tool is not None:
+            self._by_category[tool.category].remove(tool)
+        self._lazy.pop(tool_id, None)
+        self._ids_cache = None
+        self._version += 1
+        _tool_info_cache.pop(tool_id, None)
 
     def get(self, tool_id: str) -> ToolDefinition | None:
         """Get a tool by ID."""
-        return self._tools.get(tool_id)
+        tool = self._tools.get(tool_id)
+        if tool is not None:
+            return tool
+        return self._materialize(tool_id)
 
     def get_or_raise(self, tool_id: str) -> ToolDefinition:
         """Get a tool by ID or raise an error.
@@ -57,35 +115,52 @@ class ToolRegistry:
         Raises:
             ValueError: If tool is not found
         """
-        tool = self._tools.get(tool_id)
+        tool = self.get(tool_id)
         if tool is None:
-            available = ', '.join(sorted(self._tools.keys())) or '(none)'
+            available = ', '.join(self.list_ids()) or '(none)'
             raise ValueError(f'Tool "{tool_id}" not found. Available tools: {available}')
         return tool
 
     def list_all(self) -> list[ToolDefinition]:
-        """List all registered tools."""
+        """List all registered tools (materializes lazy registrations)."""
+        for tool_id in list(self._lazy):
+            self._materialize(tool_id)
         return list(self._tools.values())
 
     def list_by_category(self, category: ToolCategory) -> list[ToolDefinition]:
-        """List tools by category."""
-        return [t for t in self._tools.values() if t.category == category]
+        """List tools by category (materializes only matching lazy tools)."""
+        for tool_id, (lazy_category, _loader) in list(self._lazy.items()):
+            if lazy_category == category:
+                self._materialize(tool_id)
+        return list(self._by_category.get(category, ()))
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter of catalog membership changes."""
+        return self._version
 
     def list_ids(self) -> list[str]:
-        """List all tool IDs."""
-        return list(self._tools.keys())
+        """List all tool IDs (cached between registry changes; read-only)."""
+        if self._ids_cache is None:
+            self._ids_cache = sorted([*self._tools, *self._lazy])
+        return self._ids_cache
 
     def __contains__(self, tool_id: str) -> bool:
-        return tool_id in self._tools
+        return tool_id in self._tools or tool_id in self._lazy
 
     def __len__(self) -> int:
-        return len(self._tools)
+        return len(self._tools) + len(self._lazy)
 
 
 # Global registry
 tool_registry = ToolRegistry()
 
 
+# Shared per-tool API responses; a tool's info never changes while it is
+# registered, so one immutable instance serves every request.
+_tool_info_cache: dict[str, 'ToolInfoResponse'] = {}
+
+
 # API response schemas
 class ToolInfoResponse(BaseModel):
     """Tool information for API response."""
@@ -103,8 +178,16 @@ class ToolInfoResponse(BaseModel):
 
     @classmethod
     def from_tool(cls, tool: ToolDefinition) -> 'ToolInfoResponse':
-        """Create from a ToolDefinition."""
-        return cls(
+        """Create from a ToolDefinition (one shared instance per tool ID).
+
+        Every field comes straight from the already-validated definition,
+        so model_construct safely skips a second round of validation.
+        """
+        cached = _tool_info_cache.get(tool.id)
+        if cached is not None:
+            return cached
+
+        info = cls.model_construct(
             id=tool.id,
             name=tool.name,
             category=tool.category,
@@ -116,6 +199,8 @@ class ToolInfoResponse(BaseModel):
             input_schema=tool.get_input_schema(),
             output_schema=tool.get_output_schema(),
         )
+        _tool_info_cache[tool.id] = info
+        return info
 
 
 class ToolsListResponse(BaseModel):
@@ -123,3 +208,13 @@ class ToolsListResponse(BaseModel):
 
     tools: list[ToolInfoResponse] = Field(description='List of available tools')
     total: int = Field(description='Total number of tools')
+
+    @classmethod
+    def from_tools(cls, tools: list[ToolDefinition]) -> 'ToolsListResponse':
+        """Build a list response without re-validating server-built data.
+
+        Reuses the shared per-tool ToolInfoResponse instances and
+        model_construct, so a catalog listing costs zero pydantic
+        validations after the first call.
+        """
+        return cls.model_construct(tools=[ToolInfoResponse.from_tool(tool) for tool in tools], total=len(tools))
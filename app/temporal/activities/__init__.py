@@ -22,84 +22,90 @@ No need to add anything to this file.
 
 ## Convenience Imports
 
-The imports below are for workflow convenience only - they don't affect registration.
+The exports below are for workflow convenience only - they don't affect
+registration. They resolve lazily (PEP 562), so importing one activity no
+longer drags every other activity module and its provider SDKs into memory.
 """
 
-# FFmpeg schemas from service (enums)
-from app.core.services.ffmpeg.schemas import TextFont, TextPosition
-
-# FFmpeg activities
-from app.temporal.activities.ffmpeg import (
-    SlowDownVideoInput,
-    SlowDownVideoOutput,
-    TextOverlayActivityInput,
-    TextOverlayActivityOutput,
-    add_text_overlay,
-    combine_video_with_audio,
-    slow_down_video,
-)
-
-# Image generation
-from app.temporal.activities.image import generate_image, generate_image_with_model
-
-# LLM activities (preferred)
-from app.temporal.activities.llm import (
-    EnhanceTextInput,
-    EnhanceTextOutput,
-    ImagePromptOutput,
-    complete_chat,
-    enhance_image_prompt,
-    enhance_text,
-    generate_json,
-)
-
-# Legacy prompt activities
-from app.temporal.activities.prompt import (
-    enhance_prompt,
-    generate_script,
-    generate_ugc_person,
-    generate_ugc_video_reaction,
-    generate_voiceover_script,
-)
-
-# Media rewriting
-from app.temporal.activities.rewrite import (
-    RewriteImagesInput,
-    RewriteImagesOutput,
-    RewriteVideoInput,
-    RewriteVideoOutput,
-    rewrite_images,
-    rewrite_video,
-)
-
-# Storage
-from app.temporal.activities.storage import upload_bytes_to_storage, upload_to_storage
-
-# Tool execution
-from app.temporal.activities.tools import (
-    ExecuteToolInput,
-    ExecuteToolOutput,
-    execute_tool,
-    list_available_tools,
-)
-
-# Video generation
-from app.temporal.activities.video import (
-    combine_audio_video,
-    generate_video,
-    generate_video_with_model,
-)
-
-# Voice generation
-from app.temporal.activities.voice import generate_voice, generate_voice_with_options
-
-# UGC schemas
-from app.temporal.schemas import (
-    UGCPersonInput,
-    UGCPersonOutput,
-    UGCVideoReactionInput,
-    UGCVideoReactionOutput,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # FFmpeg schemas from service (enums)
+    from app.core.services.ffmpeg.schemas import TextFont, TextPosition
+
+    # FFmpeg activities
+    from app.temporal.activities.ffmpeg import (
+        SlowDownVideoInput,
+        SlowDownVideoOutput,
+        TextOverlayActivityInput,
+        TextOverlayActivityOutput,
+        add_text_overlay,
+        combine_video_with_audio,
+        slow_down_video,
+    )
+
+    # Image generation
+    from app.temporal.activities.image import generate_image, generate_image_with_model
+
+    # LLM activities (preferred)
+    from app.temporal.activities.llm import (
+        EnhanceTextInput,
+        EnhanceTextOutput,
+        ImagePromptOutput,
+        complete_chat,
+        enhance_image_prompt,
+        enhance_text,
+        generate_json,
+    )
+
+    # Legacy prompt activities
+    from app.temporal.activities.prompt import (
+        enhance_prompt,
+        generate_script,
+        generate_ugc_person,
+        generate_ugc_persons_batch,
+        generate_ugc_video_reaction,
+        generate_voiceover_script,
+    )
+
+    # Media rewriting
+    from app.temporal.activities.rewrite import (
+        RewriteImagesInput,
+        RewriteImagesOutput,
+        RewriteVideoInput,
+        RewriteVideoOutput,
+        rewrite_images,
+        rewrite_video,
+    )
+
+    # Storage
+    from app.temporal.activities.storage import upload_bytes_to_storage, upload_to_storage
+
+    # Tool execution
+    from app.temporal.activities.tools import (
+        ExecuteToolInput,
+        ExecuteToolOutput,
+        execute_tool,
+        list_available_tools,
+    )
+
+    # Video generation
+    from app.temporal.activities.video import (
+        combine_audio_video,
+        generate_video,
+        generate_video_with_model,
+    )
+
+    # Voice generation
+    from app.temporal.activities.voice import generate_voice, generate_voice_with_options
+
+    # UGC schemas
+    from app.temporal.schemas import (
+        UGCPersonInput,
+        UGCPersonOutput,
+        UGCVideoReactionInput,
+        UGCVideoReactionOutput,
+    )
 
 __all__ = [
     # LLM activities (LiteLLM with fallback) - PREFERRED
@@ -116,6 +122,7 @@ __all__ = [
     'generate_voiceover_script',
     # UGC person generation
     'generate_ugc_person',
+    'generate_ugc_persons_batch',
     'UGCPersonInput',
     'UGCPersonOutput',
     # UGC video reaction generation
@@ -158,3 +165,65 @@ __all__ = [
     'RewriteImagesInput',
     'RewriteImagesOutput',
 ]
+
+# PEP 562 lazy exports: each name is imported from its module on first access.
+_EXPORT_MODULES = {
+    'TextFont': 'app.core.services.ffmpeg.schemas',
+    'TextPosition': 'app.core.services.ffmpeg.schemas',
+    'SlowDownVideoInput': 'app.temporal.activities.ffmpeg',
+    'SlowDownVideoOutput': 'app.temporal.activities.ffmpeg',
+    'TextOverlayActivityInput': 'app.temporal.activities.ffmpeg',
+    'TextOverlayActivityOutput': 'app.temporal.activities.ffmpeg',
+    'add_text_overlay': 'app.temporal.activities.ffmpeg',
+    'combine_video_with_audio': 'app.temporal.activities.ffmpeg',
+    'slow_down_video': 'app.temporal.activities.ffmpeg',
+    'generate_image': 'app.temporal.activities.image',
+    'generate_image_with_model': 'app.temporal.activities.image',
+    'EnhanceTextInput': 'app.temporal.activities.llm',
+    'EnhanceTextOutput': 'app.temporal.activities.llm',
+    'ImagePromptOutput': 'app.temporal.activities.llm',
+    'complete_chat': 'app.temporal.activities.llm',
+    'enhance_image_prompt': 'app.temporal.activities.llm',
+    'enhance_text': 'app.temporal.activities.llm',
+    'generate_json': 'app.temporal.activities.llm',
+    'enhance_prompt': 'app.temporal.activities.prompt',
+    'generate_script': 'app.temporal.activities.prompt',
+    'generate_ugc_person': 'app.temporal.activities.prompt',
+    'generate_ugc_persons_batch': 'app.temporal.activities.prompt',
+    'generate_ugc_video_reaction': 'app.temporal.activities.prompt',
+    'generate_voiceover_script': 'app.temporal.activities.prompt',
+    'RewriteImagesInput': 'app.temporal.activities.rewrite',
+    'RewriteImagesOutput': 'app.temporal.activities.rewrite',
+    'RewriteVideoInput': 'app.temporal.activities.rewrite',
+    'RewriteVideoOutput': 'app.temporal.activities.rewrite',
+    'rewrite_images': 'app.temporal.activities.rewrite',
+    'rewrite_video': 'app.temporal.activities.rewrite',
+    'upload_bytes_to_storage': 'app.temporal.activities.storage',
+    'upload_to_storage': 'app.temporal.activities.storage',
+    'ExecuteToolInput': 'app.temporal.activities.tools',
+    'ExecuteToolOutput': 'app.temporal.activities.tools',
+    'execute_tool': 'app.temporal.activities.tools',
+    'list_available_tools': 'app.temporal.activities.tools',
+    'combine_audio_video': 'app.temporal.activities.video',
+    'generate_video': 'app.temporal.activities.video',
+    'generate_video_with_model': 'app.temporal.activities.video',
+    'generate_voice': 'app.temporal.activities.voice',
+    'generate_voice_with_options': 'app.temporal.activities.voice',
+    'UGCPersonInput': 'app.temporal.schemas',
+    'UGCPersonOutput': 'app.temporal.schemas',
+    'UGCVideoReactionInput': 'app.temporal.schemas',
+    'UGCVideoReactionOutput': 'app.temporal.schemas',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _EXPORT_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_path), name)
+    # Cache on the module so __getattr__ only runs once per name
+    globals()[name] = value
+    return value
@@ -10,41 +10,73 @@ Uses local FFmpeg via the FFmpeg service.
 """
 
 import asyncio
-import tempfile
-import uuid
-from datetime import datetime
-from pathlib import Path
+import secrets
+import time
+from types import MappingProxyType
 
-import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from temporalio import activity
 
 from app.core.services.ffmpeg import (
     CombineAudioInput,
+    HwAccel,
     SlowDownInput,
     TextFont,
     TextOverlayInput,
     TextPosition,
     get_ffmpeg_service,
 )
-from app.core.services.storage.schemas import UploadRequest
 from app.core.services.storage.service import get_storage
 
+# Per-day cached UTC date prefix, same fast path as the storage providers
+_date_prefix_cache: dict[int, str] = {}
+
+
+def _date_prefix() -> str:
+    """Get today's 'YYYY/MM/DD' UTC prefix, formatted at most once per day."""
+    day = int(time.time()) // 86400
+    prefix = _date_prefix_cache.get(day)
+    if prefix is None:
+        _date_prefix_cache.clear()
+        prefix = time.strftime('%Y/%m/%d', time.gmtime())
+        _date_prefix_cache[day] = prefix
+    return prefix
+
+
+# Extension lookup for activity output keys, built once at import time and
+# frozen so no caller can mutate the shared mapping
+_EXT_MAP = MappingProxyType(
+    {
+        'video/mp4': 'mp4',
+        'video/webm': 'webm',
+        'video/quicktime': 'mov',
+        'audio/mpeg': 'mp3',
+        'audio/wav': 'wav',
+    }
+)
+
 
 class SlowDownVideoInput(BaseModel):
     """Input for slow down video activity."""
 
+    # Built once per activity call and never mutated; frozen instances skip
+    # mutation bookkeeping in pydantic-core
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     video_url: str = Field(..., description='URL of video to slow down')
     speed_factor: float = Field(0.5, description='Speed factor (0.5 = half speed, 2x slower)')
     preserve_audio: bool = Field(False, description='Slow audio too or remove it')
+    hw_accel: HwAccel = Field(HwAccel.AUTO, description='Hardware encoder backend (auto-detected by default)')
     output_folder: str = Field('ffmpeg/slowmo', description='Storage folder for output')
 
 
 class SlowDownVideoOutput(BaseModel):
     """Output from slow down video activity."""
 
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     output_url: str = Field(..., description='URL of slowed video')
-    duration_seconds: float = Field(..., description='Processing time')
+    duration_seconds: float = Field(..., description='Duration of the output video in seconds')
 
 
 class TextOverlayActivityInput(BaseModel):
@@ -59,6 +91,8 @@ class TextOverlayActivityInput(BaseModel):
     - Lower font_scale_factor = bigger text
     """
 
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     video_url: str = Field(..., description='URL of video')
     text: str = Field(..., description='Text to overlay (can be long, will be wrapped)')
     position: TextPosition = Field(TextPosition.CENTER, description='Text position')
@@ -83,6 +117,9 @@ class TextOverlayActivityInput(BaseModel):
     line_spacing: int = Field(12, description='Spacing between wrapped lines')
     max_chars_per_line: int = Field(28, description='Max characters per line for wrapping')
 
+    # Encoding
+    hw_accel: HwAccel = Field(HwAccel.AUTO, description='Hardware encoder backend (auto-detected by default)')
+
     # Output
     output_folder: str = Field('ffmpeg/text', description='Storage folder for output')
 
@@ -90,46 +127,18 @@ class TextOverlayActivityInput(BaseModel):
 class TextOverlayActivityOutput(BaseModel):
     """Output from text overlay activity."""
 
-    output_url: str = Field(..., description='URL of video with text overlay')
-
+    model_config = ConfigDict(frozen=True, extra='ignore')
 
-async def _download_file(url: str, dest_path: str) -> None:
-    """Download a file from URL to local path."""
-    async with httpx.AsyncClient(timeout=300.0) as client:
-        response = await client.get(url, follow_redirects=True)
-        response.raise_for_status()
-        with open(dest_path, 'wb') as f:
-            f.write(response.content)
+    output_url: str = Field(..., description='URL of video with text overlay')
+    duration_seconds: float = Field(0.0, description='Duration of the output video in seconds')
 
 
-async def _upload_file(file_path: str, folder: str, content_type: str = 'video/mp4') -> str:
-    """Upload a local file to storage and return the URL."""
-    with open(file_path, 'rb') as f:
-        data = f.read()
-
-    # Determine extension from content type
-    ext_map = {
-        'video/mp4': 'mp4',
-        'video/webm': 'webm',
-        'video/quicktime': 'mov',
-        'audio/mpeg': 'mp3',
-        'audio/wav': 'wav',
-    }
-    extension = ext_map.get(content_type, 'mp4')
+def _output_key(folder: str, content_type: str = 'video/mp4') -> str:
+    """Generate a storage key for an activity output."""
+    extension = _EXT_MAP.get(content_type, 'mp4')
 
     # Generate key with date prefix for organization
-    date_prefix = datetime.utcnow().strftime('%Y/%m/%d')
-    key = f'{folder}/{date_prefix}/{uuid.uuid4().hex[:12]}.{extension}'
-
-    storage = get_storage()
-    result = await storage.upload(
-        UploadRequest(
-            data=data,
-            content_type=content_type,
-            key=key,
-        )
-    )
-    return result.url
+    return f'{folder}/{_date_prefix()}/{secrets.token_hex(6)}.{extension}'
 
 
 @activity.defn
@@ -148,40 +157,50 @@ async def slow_down_video(input: SlowDownVideoInput) -> SlowDownVideoOutput:
             speed_factor=0.5,
         ))
     """
-    activity.logger.info(f'Slowing down video by factor {input.speed_factor}')
-
-    # Create temp directory for processing
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        input_path = str(tmpdir_path / 'input.mp4')
-        output_path = str(tmpdir_path / 'output.mp4')
+    activity.logger.info('Slowing down video by factor %s', input.speed_factor)
 
-        # Download input video
-        activity.logger.info('Downloading input video...')
-        await _download_file(input.video_url, input_path)
+    # FFmpeg streams the input URL and its stdout feeds straight into a
+    # multipart upload - nothing touches disk on either side
+    ffmpeg = get_ffmpeg_service()
+    activity.logger.info('Running FFmpeg...')
 
-        # Use FFmpeg service
-        ffmpeg = get_ffmpeg_service()
-        activity.logger.info('Running FFmpeg...')
+    # Probe the source duration while the encode and upload run; the slowed
+    # output lasts input_duration / speed_factor
+    duration_task = asyncio.create_task(ffmpeg.get_duration(input.video_url))
 
-        result = await ffmpeg.slow_down(
+    try:
+        stream = await ffmpeg.slow_down_stream(
             SlowDownInput(
-                input_path=input_path,
-                output_path=output_path,
+                input_path=input.video_url,
+                output_path='pipe:1',
                 speed_factor=input.speed_factor,
                 preserve_audio=input.preserve_audio,
+                hw_accel=input.hw_accel,
             )
         )
 
-        activity.logger.debug(f'FFmpeg command: {" ".join(result.command)}')
-
-        # Upload result
-        activity.logger.info('Uploading result...')
-        output_url = await _upload_file(output_path, input.output_folder)
+        storage = get_storage()
+        result = await storage.upload_stream(
+            key=_output_key(input.output_folder),
+            content_type='video/mp4',
+            stream=stream,
+        )
+    except BaseException:
+        # The probe must not outlive the activity: settle it so a failed
+        # encode/upload can't leak the ffprobe subprocess or leave an
+        # unretrieved task exception behind
+        duration_task.cancel()
+        await asyncio.gather(duration_task, return_exceptions=True)
+        raise
+
+    try:
+        duration_seconds = (await duration_task) / input.speed_factor
+    except (OSError, RuntimeError):
+        duration_seconds = 0.0
 
     return SlowDownVideoOutput(
-        output_url=output_url,
-        duration_seconds=0.0,  # Could probe the output file for duration
+        output_url=result.url,
+        duration_seconds=duration_seconds,
     )
 
 
@@ -204,23 +223,19 @@ async def add_text_overlay(input: TextOverlayActivityInput) -> TextOverlayActivi
             font_size=56,
         ))
     """
-    activity.logger.info(f'Adding text overlay: "{input.text[:50]}..."')
+    activity.logger.info('Adding text overlay: "%.50s..."', input.text)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        input_path = str(tmpdir_path / 'input.mp4')
-        output_path = str(tmpdir_path / 'output.mp4')
+    ffmpeg = get_ffmpeg_service()
 
-        # Download input video
-        await _download_file(input.video_url, input_path)
+    # Overlaying text does not change the duration, so the source probe
+    # answers for the output; it runs while the encode and upload proceed
+    duration_task = asyncio.create_task(ffmpeg.get_duration(input.video_url))
 
-        # Use FFmpeg service
-        ffmpeg = get_ffmpeg_service()
-
-        result = await ffmpeg.add_text_overlay(
+    try:
+        stream = await ffmpeg.add_text_overlay_stream(
             TextOverlayInput(
-                input_path=input_path,
-                output_path=output_path,
+                input_path=input.video_url,
+                output_path='pipe:1',
                 text=input.text,
                 position=input.position,
                 font=input.font,
@@ -235,15 +250,28 @@ async def add_text_overlay(input: TextOverlayActivityInput) -> TextOverlayActivi
                 end_time=input.end_time,
                 line_spacing=input.line_spacing,
                 max_chars_per_line=input.max_chars_per_line,
+                hw_accel=input.hw_accel,
             )
         )
 
-        activity.logger.debug(f'FFmpeg command: {" ".join(result.command)}')
+        storage = get_storage()
+        result = await storage.upload_stream(
+            key=_output_key(input.output_folder),
+            content_type='video/mp4',
+            stream=stream,
+        )
+    except BaseException:
+        # Settle the probe task on failure, mirroring slow_down_video
+        duration_task.cancel()
+        await asyncio.gather(duration_task, return_exceptions=True)
+        raise
 
-        # Upload result
-        output_url = await _upload_file(output_path, input.output_folder)
+    try:
+        duration_seconds = await duration_task
+    except (OSError, RuntimeError):
+        duration_seconds = 0.0
 
-    return TextOverlayActivityOutput(output_url=output_url)
+    return TextOverlayActivityOutput(output_url=result.url, duration_seconds=duration_seconds)
 
 
 @activity.defn
@@ -261,32 +289,21 @@ async def combine_video_with_audio(video_url: str, audio_url: str) -> str:
     """
     activity.logger.info('Combining video with audio')
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        video_path = str(tmpdir_path / 'video.mp4')
-        audio_path = str(tmpdir_path / 'audio.mp3')
-        output_path = str(tmpdir_path / 'output.mp4')
-
-        # Download files
-        await asyncio.gather(
-            _download_file(video_url, video_path),
-            _download_file(audio_url, audio_path),
-        )
-
-        # Use FFmpeg service
-        ffmpeg = get_ffmpeg_service()
+    ffmpeg = get_ffmpeg_service()
 
-        result = await ffmpeg.combine_audio(
-            CombineAudioInput(
-                video_path=video_path,
-                audio_path=audio_path,
-                output_path=output_path,
-            )
+    stream = await ffmpeg.combine_audio_stream(
+        CombineAudioInput(
+            video_path=video_url,
+            audio_path=audio_url,
+            output_path='pipe:1',
         )
+    )
 
-        activity.logger.debug(f'FFmpeg command: {" ".join(result.command)}')
-
-        # Upload result
-        output_url = await _upload_file(output_path, 'ffmpeg/combined')
+    storage = get_storage()
+    result = await storage.upload_stream(
+        key=_output_key('ffmpeg/combined'),
+        content_type='video/mp4',
+        stream=stream,
+    )
 
-    return output_url
+    return result.url
@@ -8,11 +8,9 @@ from typing import Any
 
 from temporalio import activity
 
-# Import to ensure all models are registered
-import app.core.ai_models  # noqa: F401
 from app.core.ai_models.base import ModelCategory, Provider
-from app.core.ai_models.registry import model_registry
-from app.core.providers.replicate import ReplicateClient
+from app.core.ai_models.registry import ensure_models_registered, model_registry
+from app.core.providers.replicate import get_replicate_client
 from app.temporal.schemas import ImageGenerationInput, ImageGenerationOutput
 
 
@@ -27,7 +25,10 @@ async def generate_image(input: ImageGenerationInput) -> ImageGenerationOutput:
     Raises:
         ValueError: If the model is not found in the registry
     """
-    activity.logger.info(f'Generating image with model: {input.model}')
+    activity.logger.info('Generating image with model: %s', input.model)
+
+    # Ensure models are registered
+    ensure_models_registered()
 
     model_def = model_registry.get(input.model)
     if not model_def:
@@ -38,7 +39,7 @@ async def generate_image(input: ImageGenerationInput) -> ImageGenerationOutput:
     input_data: dict[str, Any] = {'prompt': input.prompt}
 
     # Map common fields based on what the model supports
-    input_schema = model_def.input_class.model_fields
+    input_schema = model_def.input_field_names()
 
     if 'aspect_ratio' in input_schema and input.aspect_ratio:
         input_data['aspect_ratio'] = input.aspect_ratio
@@ -49,18 +50,19 @@ async def generate_image(input: ImageGenerationInput) -> ImageGenerationOutput:
     # Validate and create typed input
     typed_input = model_def.validate_input(input_data)
 
-    activity.logger.info(f'Using registered model: {model_def.name}')
+    activity.logger.info('Using registered model: %s', model_def.name)
 
     # Get the provider config (prefer Replicate)
-    if model_def.supports_provider(Provider.REPLICATE):
-        provider_config = model_def.get_provider_config(Provider.REPLICATE)
+    provider_config = model_def.replicate_config
+    if provider_config is not None:
         replicate_input = typed_input.to_replicate()
 
-        client = ReplicateClient()
+        client = get_replicate_client()
         prediction = await client.run(
             model=provider_config.get_full_model_string(),
             input=replicate_input,
             wait=True,
+            on_poll=activity.heartbeat,
         )
 
         return ImageGenerationOutput(
@@ -108,32 +110,35 @@ async def generate_image_with_model(
             },
         )
     """
+    # Ensure models are registered
+    ensure_models_registered()
+
     model_def = model_registry.get(model_id)
     if not model_def:
         available = [m.id for m in model_registry.list_by_category(ModelCategory.IMAGE)]
         raise ValueError(f"Model '{model_id}' not found in registry. Available image models: {available}")
 
-    activity.logger.info(f'Generating with {model_def.name} via {provider}')
+    activity.logger.info('Generating with %s via %s', model_def.name, provider)
 
     # Validate and create typed input
     typed_input = model_def.validate_input(model_input)
 
     # Get provider
     provider_enum = Provider(provider)
-    if not model_def.supports_provider(provider_enum):
+    provider_config = model_def.provider_configs.get(provider_enum)
+    if provider_config is None:
         available_providers = [p.value for p in model_def.providers]
         raise ValueError(
             f"Model '{model_id}' does not support provider '{provider}'. Available providers: {available_providers}"
         )
 
-    provider_config = model_def.get_provider_config(provider_enum)
-
     if provider_enum == Provider.REPLICATE:
-        client = ReplicateClient()
+        client = get_replicate_client()
         prediction = await client.run(
             model=provider_config.get_full_model_string(),
             input=typed_input.to_replicate(),
             wait=True,
+            on_poll=activity.heartbeat,
         )
 
         return ImageGenerationOutput(
@@ -8,15 +8,48 @@ These activities provide flexible LLM capabilities for workflows:
 All activities use LiteLLM with automatic fallback from primary to secondary model.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from temporalio import activity
 
+from app.core.cache import SingleFlight, TTLCache
 from app.core.providers.litellm import (
     CompletionRequest,
     CompletionResponse,
-    LiteLLMClient,
+    get_litellm_client,
 )
 
+# Recent enhance_text responses. Temporal retries and fan-out workflows
+# re-issue identical inputs within minutes; replaying a fresh response skips
+# the LLM round-trip entirely. Above this temperature the caller explicitly
+# asked for sampling variety, so the cache is bypassed in both directions.
+_CACHE_MAX_TEMPERATURE = 0.7
+_enhance_text_cache: TTLCache['EnhanceTextOutput'] = TTLCache()
+
+# Coalesce identical requests that overlap in flight: when parallel branches
+# issue the same enhancement before the first response lands in the cache,
+# only the first caller hits the provider and the rest share its future
+_enhance_text_flight: SingleFlight['EnhanceTextOutput'] = SingleFlight()
+_image_prompt_flight: SingleFlight['ImagePromptOutput'] = SingleFlight()
+
+# Static prompt scaffolding, built once at import time and kept byte-identical
+# across calls so provider-side prompt prefix caching can reuse it. Everything
+# that varies per call goes at the END of the trailing user message.
+
+_ENHANCE_TEXT_SYSTEM_PROMPT = (
+    'You are an expert at text enhancement and transformation. '
+    'The user message contains an "## Instructions" section followed by an '
+    '"## Original Text" section. '
+    "Follow the user's instructions precisely. "
+    'Output ONLY the enhanced text, no explanations or preamble.'
+)
+
+_IMAGE_PROMPT_SYSTEM_PROMPT = """You are an expert at creating image generation prompts.
+Given a style and concept, output a JSON object with:
+- enhanced_prompt: A detailed, vivid prompt (50-150 words)
+- negative_prompt: What to avoid in the image
+
+Output ONLY valid JSON, no markdown."""
+
 # =============================================================================
 # Activity-specific schemas (minimal, reuse provider schemas where possible)
 # =============================================================================
@@ -25,6 +58,10 @@ from app.core.providers.litellm import (
 class EnhanceTextInput(BaseModel):
     """Input for text enhancement."""
 
+    # Built once per activity call and never mutated; frozen instances skip
+    # mutation bookkeeping in pydantic-core
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     text: str = Field(..., description='Original text to enhance')
     instructions: str = Field(..., description='Instructions for how to enhance the text')
     temperature: float = Field(0.7, ge=0.0, le=2.0, description='Creativity level')
@@ -34,6 +71,8 @@ class EnhanceTextInput(BaseModel):
 class EnhanceTextOutput(BaseModel):
     """Output from text enhancement."""
 
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     enhanced_text: str = Field(..., description='The enhanced text')
     model_used: str = Field(..., description='Model that generated the response')
     fallback_used: bool = Field(False, description='Whether fallback model was used')
@@ -42,12 +81,27 @@ class EnhanceTextOutput(BaseModel):
 class ImagePromptOutput(BaseModel):
     """Output from image prompt enhancement."""
 
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     enhanced_prompt: str = Field(..., description='Enhanced image generation prompt')
     negative_prompt: str = Field('', description='What to avoid in the image')
     model_used: str = Field(..., description='Model that generated the response')
     fallback_used: bool = Field(False, description='Whether fallback model was used')
 
 
+class ImagePromptSchema(BaseModel):
+    """Response schema enforced on the model via strict Structured Outputs.
+
+    extra='forbid' emits additionalProperties=false, which strict mode
+    requires; every field must be required, so no defaults here.
+    """
+
+    model_config = ConfigDict(extra='forbid')
+
+    enhanced_prompt: str = Field(..., description='A detailed, vivid prompt (50-150 words)')
+    negative_prompt: str = Field(..., description='What to avoid in the image')
+
+
 # =============================================================================
 # Activities
 # =============================================================================
@@ -68,36 +122,53 @@ async def enhance_text(input: EnhanceTextInput) -> EnhanceTextOutput:
             instructions='Transform into a detailed image generation prompt',
         ))
     """
-    activity.logger.info(f'Enhancing text: "{input.text[:50]}..."')
-
-    client = LiteLLMClient()
-
-    system_prompt = (
-        'You are an expert at text enhancement and transformation. '
-        "Follow the user's instructions precisely. "
-        'Output ONLY the enhanced text, no explanations or preamble.'
-    )
-
-    user_prompt = f"""## Original Text
-{input.text}
-
-## Instructions
-{input.instructions}
-
-## Enhanced Text"""
+    activity.logger.info('Enhancing text: "%.50s..."', input.text)
+
+    cache_key = (input.text.strip(), input.instructions.strip(), input.temperature, input.max_tokens)
+    if input.temperature <= _CACHE_MAX_TEMPERATURE:
+        cached = _enhance_text_cache.get(cache_key)
+        if cached is not None:
+            activity.logger.info('Returning cached enhancement')
+            return cached
+        # Dedup only below the cache threshold: above it the caller asked for
+        # sampling variety, so concurrent calls should stay independent
+        return await _enhance_text_flight.run(cache_key, lambda: _enhance_text_upstream(input, cache_key))
+    return await _enhance_text_upstream(input, cache_key)
+
+
+async def _enhance_text_upstream(
+    input: EnhanceTextInput,
+    cache_key: tuple[str, str, float, int],
+) -> EnhanceTextOutput:
+    """Perform the actual enhancement call and populate the cache."""
+    client = get_litellm_client()
+
+    # Instructions lead and the variable text trails: workflows tend to reuse
+    # the same instructions across many texts, so the shared prefix (system
+    # prompt + instructions) stays cacheable. strip() canonicalizes incidental
+    # whitespace so equivalent inputs hash to the same prefix.
+    user_prompt = f"""## Instructions
+{input.instructions.strip()}
+
+## Original Text
+{input.text.strip()}"""
 
     response = await client.complete_text(
         prompt=user_prompt,
-        system_prompt=system_prompt,
+        system_prompt=_ENHANCE_TEXT_SYSTEM_PROMPT,
         temperature=input.temperature,
         max_tokens=input.max_tokens,
     )
 
-    return EnhanceTextOutput(
+    output = EnhanceTextOutput(
         enhanced_text=response.content.strip(),
         model_used=response.model,
         fallback_used=response.fallback_used,
     )
+    if input.temperature <= _CACHE_MAX_TEMPERATURE:
+        # Frozen model, safe to hand the same instance to every cache hit
+        _enhance_text_cache.put(cache_key, output)
+    return output
 
 
 @activity.defn
@@ -126,9 +197,14 @@ async def generate_json(request: CompletionRequest) -> CompletionResponse:
         max_tokens=request.max_tokens,
         json_mode=True,
         timeout=request.timeout,
+        batch_mode=request.batch_mode,
     )
 
-    client = LiteLLMClient()
+    client = get_litellm_client()
+    if request_with_json.batch_mode:
+        # Half-price Batch API; heartbeat each poll so the long wait
+        # doesn't trip the activity timeout
+        return await client.complete_batch(request_with_json, on_poll=activity.heartbeat)
     return await client.complete(request=request_with_json)
 
 
@@ -147,9 +223,13 @@ async def complete_chat(request: CompletionRequest) -> CompletionResponse:
             temperature=0.5,
         ))
     """
-    activity.logger.info(f'Completing chat with {len(request.messages)} messages')
+    activity.logger.info('Completing chat with %d messages', len(request.messages))
 
-    client = LiteLLMClient()
+    client = get_litellm_client()
+    if request.batch_mode:
+        # Half-price Batch API; heartbeat each poll so the long wait
+        # doesn't trip the activity timeout
+        return await client.complete_batch(request, on_poll=activity.heartbeat)
     return await client.complete(request=request)
 
 
@@ -165,39 +245,34 @@ async def enhance_image_prompt(concept: str, style: str = 'photorealistic') -> I
         # result.negative_prompt = 'blurry, watermark, text...'
         # result.aspect_ratio = '16:9'
     """
-    activity.logger.info(f'Enhancing image prompt for: {concept[:50]}...')
+    activity.logger.info('Enhancing image prompt for: %.50s...', concept)
 
-    client = LiteLLMClient()
+    key = (concept.strip(), style.strip())
+    return await _image_prompt_flight.run(key, lambda: _enhance_image_prompt_upstream(*key))
 
-    system_prompt = """You are an expert at creating image generation prompts.
-Given a concept and style, output a JSON object with:
-- enhanced_prompt: A detailed, vivid prompt (50-150 words)
-- negative_prompt: What to avoid in the image
 
-Output ONLY valid JSON, no markdown."""
+async def _enhance_image_prompt_upstream(concept: str, style: str) -> ImagePromptOutput:
+    """Perform the actual image prompt enhancement call."""
+    client = get_litellm_client()
 
-    prompt = f'Concept: {concept}\nStyle: {style}'
+    # Style comes from a small fixed vocabulary while concepts are free-form,
+    # so style-first keeps the cacheable prefix as long as possible
+    prompt = f'Style: {style}\nConcept: {concept}'
 
     response = await client.complete_text(
         prompt=prompt,
-        system_prompt=system_prompt,
+        system_prompt=_IMAGE_PROMPT_SYSTEM_PROMPT,
         temperature=0.7,
-        json_mode=True,
+        response_schema=ImagePromptSchema,
     )
 
-    # Parse the response
-    if response.parsed and isinstance(response.parsed, dict):
-        return ImagePromptOutput(
-            enhanced_prompt=response.parsed.get('enhanced_prompt', concept),
-            negative_prompt=response.parsed.get('negative_prompt', ''),
-            model_used=response.model,
-            fallback_used=response.fallback_used,
-        )
+    # Strict mode guarantees the schema, so one validation replaces the old
+    # defensive .get() fallbacks that silently returned the raw concept
+    result = ImagePromptSchema.model_validate(response.parsed)
 
-    # Fallback if parsing failed
     return ImagePromptOutput(
-        enhanced_prompt=concept,
-        negative_prompt='',
+        enhanced_prompt=result.enhanced_prompt,
+        negative_prompt=result.negative_prompt,
         model_used=response.model,
         fallback_used=response.fallback_used,
     )
@@ -8,10 +8,12 @@ These activities handle text generation tasks like:
 - Any structured text generation
 """
 
-import json
+import asyncio
 
+import orjson
 from temporalio import activity
 
+from app.core.cache import SingleFlight, TTLCache
 from app.core.services.prompt.schemas import PromptTemplates
 from app.core.services.prompt.service import get_prompt_service
 from app.temporal.schemas import (
@@ -25,6 +27,21 @@ from app.temporal.schemas import (
     UGCVideoReactionOutput,
 )
 
+# Personas are independent LLM calls; the batch activity overlaps them up
+# to this many in flight, staying under provider rate limits
+_MAX_CONCURRENT_GENERATIONS = 8
+
+# Recent (concept, style) enhancements. Any recent enhancement of the same
+# concept is as good as a fresh one, and Temporal retries plus per-variant
+# fan-out re-enhance identical concepts within minutes - hits skip the LLM
+# round-trip entirely.
+_enhancement_cache: TTLCache[PromptEnhancementOutput] = TTLCache()
+
+# Coalesces identical (concept, style) requests that overlap in flight, e.g.
+# parallel workflow branches enhancing the same concept before the first
+# response lands in the cache - only the first caller hits the provider
+_enhancement_flight: SingleFlight[PromptEnhancementOutput] = SingleFlight()
+
 
 @activity.defn
 async def enhance_prompt(input: PromptEnhancementInput) -> PromptEnhancementOutput:
@@ -32,27 +49,40 @@ async def enhance_prompt(input: PromptEnhancementInput) -> PromptEnhancementOutp
 
     Uses the existing PromptService with the IMAGE_PROMPT_ENHANCER template.
     """
-    activity.logger.info(f'Enhancing prompt for concept: {input.concept[:50]}...')
+    activity.logger.info('Enhancing prompt for concept: %.50s...', input.concept)
+
+    cache_key = (input.concept, input.style)
+    cached = _enhancement_cache.get(cache_key)
+    if cached is not None:
+        activity.logger.info('Returning cached enhancement')
+        return cached
+
+    return await _enhancement_flight.run(cache_key, lambda: _enhance_prompt_upstream(input, cache_key))
 
+
+async def _enhance_prompt_upstream(
+    input: PromptEnhancementInput,
+    cache_key: tuple[str, str],
+) -> PromptEnhancementOutput:
+    """Perform the actual enhancement call and populate the cache."""
     service = get_prompt_service()
 
-    try:
-        result = await service.generate_structured(
-            template=PromptTemplates.IMAGE_PROMPT_ENHANCER,
-            variables={
-                'concept': input.concept,
-                'style': input.style,
-            },
-        )
-
-        return PromptEnhancementOutput(
-            enhanced_prompt=result.get('enhanced_prompt', input.concept),
-            negative_prompt=result.get('negative_prompt', ''),
-            suggested_aspect_ratio=result.get('suggested_aspect_ratio', '1:1'),
-            style_tags=result.get('style_tags', []),
-        )
-    finally:
-        await service.close()
+    result = await service.generate_structured(
+        template=PromptTemplates.IMAGE_PROMPT_ENHANCER,
+        variables={
+            'concept': input.concept,
+            'style': input.style,
+        },
+    )
+
+    output = PromptEnhancementOutput(
+        enhanced_prompt=result.get('enhanced_prompt', input.concept),
+        negative_prompt=result.get('negative_prompt', ''),
+        suggested_aspect_ratio=result.get('suggested_aspect_ratio', '1:1'),
+        style_tags=result.get('style_tags', []),
+    )
+    _enhancement_cache.put(cache_key, output)
+    return output
 
 
 @activity.defn
@@ -61,33 +91,30 @@ async def generate_script(input: ScriptGenerationInput) -> ScriptGenerationOutpu
 
     Uses the existing PromptService with the VIDEO_SCRIPT_GENERATOR template.
     """
-    activity.logger.info(f'Generating script for topic: {input.topic[:50]}...')
+    activity.logger.info('Generating script for topic: %.50s...', input.topic)
 
     service = get_prompt_service()
 
-    try:
-        result = await service.generate_structured(
-            template=PromptTemplates.VIDEO_SCRIPT_GENERATOR,
-            variables={
-                'topic': input.topic,
-                'duration_seconds': input.duration_seconds,
-                'style': input.style,
-                'mood': input.mood or input.style,
-            },
-        )
-
-        # Extract scene descriptions from the structured response
-        scenes = result.get('scenes', [])
-        scene_descriptions = [scene.get('prompt', '') for scene in scenes]
-
-        return ScriptGenerationOutput(
-            title=result.get('title', f'Video about {input.topic}'),
-            voiceover_script=result.get('voiceover_script', ''),
-            scene_descriptions=scene_descriptions,
-            music_suggestion=result.get('music_suggestion'),
-        )
-    finally:
-        await service.close()
+    result = await service.generate_structured(
+        template=PromptTemplates.VIDEO_SCRIPT_GENERATOR,
+        variables={
+            'topic': input.topic,
+            'duration_seconds': input.duration_seconds,
+            'style': input.style,
+            'mood': input.mood or input.style,
+        },
+    )
+
+    # Extract scene descriptions from the structured response
+    scenes = result.get('scenes', [])
+    scene_descriptions = [scene.get('prompt', '') for scene in scenes]
+
+    return ScriptGenerationOutput(
+        title=result.get('title', f'Video about {input.topic}'),
+        voiceover_script=result.get('voiceover_script', ''),
+        scene_descriptions=scene_descriptions,
+        music_suggestion=result.get('music_suggestion'),
+    )
 
 
 @activity.defn
@@ -101,24 +128,19 @@ async def generate_voiceover_script(
 
     Uses the VOICEOVER_SCRIPT_GENERATOR template.
     """
-    activity.logger.info(f'Generating voiceover script for: {topic[:50]}...')
+    activity.logger.info('Generating voiceover script for: %.50s...', topic)
 
     service = get_prompt_service()
 
-    try:
-        result = await service.generate_structured(
-            template=PromptTemplates.VOICEOVER_SCRIPT_GENERATOR,
-            variables={
-                'topic': topic,
-                'duration_seconds': duration_seconds,
-                'tone': tone,
-                'audience': audience,
-            },
-        )
-
-        return result
-    finally:
-        await service.close()
+    return await service.generate_structured(
+        template=PromptTemplates.VOICEOVER_SCRIPT_GENERATOR,
+        variables={
+            'topic': topic,
+            'duration_seconds': duration_seconds,
+            'tone': tone,
+            'audience': audience,
+        },
+    )
 
 
 @activity.defn
@@ -131,37 +153,85 @@ async def generate_ugc_person(input: UGCPersonInput) -> UGCPersonOutput:
     Uses the UGC_PERSON_GENERATOR template.
     """
     activity.logger.info(
-        f'Generating UGC person prompt: {input.gender}, {input.age_range}, '
-        f'{input.ethnicity}, {input.hair_color}, {input.emotion}'
+        'Generating UGC person prompt: %s, %s, %s, %s, %s',
+        input.gender,
+        input.age_range,
+        input.ethnicity,
+        input.hair_color,
+        input.emotion,
     )
 
+    return await _generate_person(input)
+
+
+async def _generate_person(input: UGCPersonInput) -> UGCPersonOutput:
+    """Run one UGC person generation through the prompt service."""
     service = get_prompt_service()
 
-    try:
-        result = await service.generate_structured(
-            template=PromptTemplates.UGC_PERSON_GENERATOR,
-            variables={
-                'gender': input.gender,
-                'age_range': input.age_range,
-                'emotion': input.emotion,
-                'style': input.style,
-                'setting': input.background,  # Map background to setting for template
-                'hair_color': input.hair_color,
-                'ethnicity': input.ethnicity,
-                'clothing': input.clothing,
-                'context': input.context or 'casual social media content',
-            },
-        )
-
-        # Convert the structured JSON to a flattened text prompt for image models
-        text_prompt = _json_to_text_prompt(result)
-
-        return UGCPersonOutput(
-            json_prompt=result,
-            text_prompt=text_prompt,
-        )
-    finally:
-        await service.close()
+    result = await service.generate_structured(
+        template=PromptTemplates.UGC_PERSON_GENERATOR,
+        variables={
+            'gender': input.gender,
+            'age_range': input.age_range,
+            'emotion': input.emotion,
+            'style': input.style,
+            'setting': input.background,  # Map background to setting for template
+            'hair_color': input.hair_color,
+            'ethnicity': input.ethnicity,
+            'clothing': input.clothing,
+            'context': input.context or 'casual social media content',
+        },
+    )
+
+    # Convert the structured JSON to a flattened text prompt for image models
+    text_prompt = _json_to_text_prompt(result)
+
+    return UGCPersonOutput(
+        json_prompt=result,
+        text_prompt=text_prompt,
+    )
+
+
+def _fallback_person_output(input: UGCPersonInput) -> UGCPersonOutput:
+    """Build a plain-text persona prompt from the input when the LLM call fails."""
+    text_prompt = (
+        f'{input.age_range} {input.ethnicity} {input.gender} with {input.hair_color} hair, '
+        f'{input.emotion} expression, wearing {input.clothing}, {input.background}, '
+        f'{input.style} style, {input.context or "casual social media content"}'
+    )
+    return UGCPersonOutput(json_prompt={}, text_prompt=text_prompt)
+
+
+@activity.defn
+async def generate_ugc_persons_batch(inputs: list[UGCPersonInput]) -> list[UGCPersonOutput]:
+    """Generate several UGC person prompts concurrently.
+
+    Workflows that fan out ad variations need N personas at once; each one is
+    an independent I/O-bound LLM call, so running them in a loop pays N
+    round-trips back to back. This issues them concurrently under a semaphore
+    and preserves input order in the result.
+
+    A failed generation falls back to a plain text prompt built from its own
+    input, so one provider hiccup doesn't fail the whole batch.
+    """
+    activity.logger.info('Generating %d UGC person prompts', len(inputs))
+
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_GENERATIONS)
+
+    async def _bounded(input: UGCPersonInput) -> UGCPersonOutput:
+        async with semaphore:
+            return await _generate_person(input)
+
+    results = await asyncio.gather(*(_bounded(input) for input in inputs), return_exceptions=True)
+
+    outputs: list[UGCPersonOutput] = []
+    for input, result in zip(inputs, results, strict=True):
+        if isinstance(result, BaseException):
+            activity.logger.warning('UGC person generation failed: %s, using fallback prompt', result)
+            outputs.append(_fallback_person_output(input))
+        else:
+            outputs.append(result)
+    return outputs
 
 
 def _json_to_text_prompt(json_prompt: dict) -> str:
@@ -171,8 +241,9 @@ def _json_to_text_prompt(json_prompt: dict) -> str:
     so we just stringify it with some formatting.
     """
     # For models like Nano Banana, the JSON structure itself works well as a prompt
-    # We return a compact JSON string that can be used directly
-    return json.dumps(json_prompt, separators=(',', ':'))
+    # We return a compact JSON string that can be used directly; sorted keys
+    # keep identical personas byte-identical for downstream prompt caches
+    return orjson.dumps(json_prompt, option=orjson.OPT_SORT_KEYS).decode()
 
 
 @activity.defn
@@ -184,34 +255,31 @@ async def generate_ugc_video_reaction(input: UGCVideoReactionInput) -> UGCVideoR
 
     Uses the UGC_VIDEO_REACTION_GENERATOR template.
     """
-    activity.logger.info(f'Generating video reaction prompt: {input.emotion}, duration={input.duration}s')
+    activity.logger.info('Generating video reaction prompt: %s, duration=%ss', input.emotion, input.duration)
 
     service = get_prompt_service()
 
-    try:
-        result = await service.generate_structured(
-            template=PromptTemplates.UGC_VIDEO_REACTION_GENERATOR,
-            variables={
-                'emotion': input.emotion,
-                'context': input.context or 'something surprising',
-                'duration': input.duration,
-            },
-        )
-
-        # Extract movements and final_prompt
-        movements = result.get('movements', [])
-        video_prompt = result.get('final_prompt', '')
-
-        # Fallback if no final_prompt
-        if not video_prompt and movements:
-            video_prompt = _movements_to_prompt(movements, input.emotion)
-
-        return UGCVideoReactionOutput(
-            movements=movements,
-            video_prompt=video_prompt,
-        )
-    finally:
-        await service.close()
+    result = await service.generate_structured(
+        template=PromptTemplates.UGC_VIDEO_REACTION_GENERATOR,
+        variables={
+            'emotion': input.emotion,
+            'context': input.context or 'something surprising',
+            'duration': input.duration,
+        },
+    )
+
+    # Extract movements and final_prompt
+    movements = result.get('movements', [])
+    video_prompt = result.get('final_prompt', '')
+
+    # Fallback if no final_prompt
+    if not video_prompt and movements:
+        video_prompt = _movements_to_prompt(movements, input.emotion)
+
+    return UGCVideoReactionOutput(
+        movements=movements,
+        video_prompt=video_prompt,
+    )
 
 
 def _movements_to_prompt(movements: list[str], emotion: str) -> str:
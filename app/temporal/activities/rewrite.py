@@ -7,14 +7,13 @@ detection and AI content filters on social platforms.
 from pydantic import BaseModel, Field
 from temporalio import activity
 
+from app.core.tools.gptmarket import image_rewrite, video_rewrite
 from app.core.tools.gptmarket.image_rewrite import (
-    GptMarketImageRewrite,
     GptMarketImageRewriteInput,
     GptMarketImageRewriteOutput,
     ImageRewriteItem,
 )
 from app.core.tools.gptmarket.video_rewrite import (
-    GptMarketVideoRewrite,
     GptMarketVideoRewriteInput,
     GptMarketVideoRewriteOutput,
 )
@@ -72,7 +71,7 @@ async def rewrite_video(input: RewriteVideoInput) -> RewriteVideoOutput:
     Returns:
         RewriteVideoOutput with rewritten URL
     """
-    activity.logger.info(f'Rewriting video: {input.video_url} (device: {input.device})')
+    activity.logger.debug('Rewriting video: %s (device: %s)', input.video_url, input.device)
 
     tool_input = GptMarketVideoRewriteInput(
         video_url=input.video_url,
@@ -80,10 +79,10 @@ async def rewrite_video(input: RewriteVideoInput) -> RewriteVideoOutput:
         device=input.device,
     )
 
-    result = await GptMarketVideoRewrite.execute(tool_input)
+    result = await video_rewrite.get_tool().execute(tool_input)
     assert isinstance(result, GptMarketVideoRewriteOutput)
 
-    activity.logger.info(f'Video rewrite complete: {input.video_url} -> {result.rewritten_url}')
+    activity.logger.debug('Video rewrite complete: %s -> %s', input.video_url, result.rewritten_url)
 
     return RewriteVideoOutput(
         original_url=input.video_url,
@@ -103,19 +102,19 @@ async def rewrite_images(input: RewriteImagesInput) -> RewriteImagesOutput:
     Returns:
         RewriteImagesOutput with rewritten URLs
     """
-    activity.logger.info(f'Rewriting {len(input.image_urls)} images (device: {input.device})')
+    activity.logger.debug('Rewriting %d images (device: %s)', len(input.image_urls), input.device)
 
     tool_input = GptMarketImageRewriteInput(
         images=[ImageRewriteItem(image_url=url) for url in input.image_urls],
         device=input.device,
     )
 
-    result = await GptMarketImageRewrite.execute(tool_input)
+    result = await image_rewrite.get_tool().execute(tool_input)
     assert isinstance(result, GptMarketImageRewriteOutput)
 
     rewritten_urls = [img.rewritten_url for img in result.images]
 
-    activity.logger.info(f'Image rewrite complete: {len(rewritten_urls)} images processed')
+    activity.logger.debug('Image rewrite complete: %d images processed', len(rewritten_urls))
 
     return RewriteImagesOutput(
         original_urls=input.image_urls,
@@ -9,7 +9,14 @@ from pathlib import Path
 from temporalio import activity
 
 from app.core.services.sora_extraction.service import get_sora_service
-from app.temporal.schemas import SoraExtractionInput, SoraExtractionOutput
+from app.core.services.storage.service import get_storage
+from app.temporal.activities.storage import generate_key
+from app.temporal.schemas import SoraExtractionInput, SoraExtractionOutput, StorageUploadOutput
+
+
+def _heartbeat_progress(downloaded: int, total: int) -> None:
+    """Report download progress as an activity heartbeat."""
+    activity.heartbeat(downloaded, total)
 
 
 @activity.defn
@@ -32,21 +39,22 @@ async def extract_sora_video(input_data: SoraExtractionInput) -> SoraExtractionO
         aiohttp.ClientError: If HTTP requests fail
         IOError: If file operations fail
     """
-    activity.logger.info(f'Extracting video from Sora share link: {input_data.share_url}')
+    activity.logger.info('Extracting video from Sora share link: %s', input_data.share_url)
 
     service = get_sora_service()
 
     try:
-        # Extract and download the video
-        output_path = await service.extract_and_download(
+        # Extract and download the video; the downloader reports the byte
+        # count from its streaming loop, so no follow-up stat() is needed.
+        # Heartbeating per chunk keeps large downloads inside the activity
+        # timeout.
+        output_path, file_size = await service.extract_and_download(
             sora_share_url=input_data.share_url,
             temp_dir=Path(input_data.temp_dir) if input_data.temp_dir else None,
+            progress_callback=_heartbeat_progress,
         )
 
-        activity.logger.info(f'Successfully extracted video to: {output_path}')
-
-        # Get file metadata
-        file_size = output_path.stat().st_size
+        activity.logger.info('Successfully extracted video to: %s', output_path)
 
         return SoraExtractionOutput(
             local_path=str(output_path),
@@ -54,7 +62,44 @@ async def extract_sora_video(input_data: SoraExtractionInput) -> SoraExtractionO
         )
 
     except Exception as e:
-        activity.logger.error(f'Failed to extract video from Sora: {str(e)}')
+        activity.logger.error('Failed to extract video from Sora: %s', e)
+        raise
+
+
+@activity.defn
+async def extract_sora_video_and_upload(
+    input_data: SoraExtractionInput,
+    storage_folder: str = 'sora',
+) -> StorageUploadOutput:
+    """Extract MP4 from a Sora share link and stream it straight to storage.
+
+    For workflows whose next step is an upload anyway, this skips the local
+    disk entirely: once the browser has resolved the CDN URL, the download
+    streams chunk by chunk into a multipart upload, so wall-clock is one
+    transit instead of download-to-disk followed by read-and-upload.
+
+    Args:
+        input_data: SoraExtractionInput with share_url (temp_dir is unused)
+        storage_folder: Storage folder for the uploaded video
+
+    Returns:
+        StorageUploadOutput with the stored video's URL and key
+    """
+    activity.logger.info('Extracting and uploading video from Sora share link: %s', input_data.share_url)
+
+    service = get_sora_service()
+
+    try:
+        mp4_url = await service.extract_mp4_url(input_data.share_url)
+
+        storage = get_storage()
+        result = await storage.upload_from_url(mp4_url, key=generate_key(storage_folder, 'mp4'))
+
+        activity.logger.info('Successfully uploaded Sora video to: %s', result.key)
+        return StorageUploadOutput(url=result.url, key=result.key)
+
+    except Exception as e:
+        activity.logger.error('Failed to extract and upload video from Sora: %s', e)
         raise
 
 
@@ -72,23 +117,22 @@ async def extract_sora_video_to_path(
     Returns:
         SoraExtractionOutput with file path and metadata
     """
-    activity.logger.info(f'Extracting Sora video to {output_path}')
+    activity.logger.info('Extracting Sora video to %s', output_path)
 
     service = get_sora_service()
 
     try:
-        result_path = await service.extract_and_download(
+        result_path, file_size = await service.extract_and_download(
             sora_share_url=share_url,
             output_path=Path(output_path),
+            progress_callback=_heartbeat_progress,
         )
 
-        file_size = result_path.stat().st_size
-
         return SoraExtractionOutput(
             local_path=str(result_path),
             file_size_bytes=file_size,
         )
 
     except Exception as e:
-        activity.logger.error(f'Failed to extract video from Sora: {str(e)}')
+        activity.logger.error('Failed to extract video from Sora: %s', e)
         raise
@@ -3,28 +3,42 @@
 Supports both S3 and R2 with auto-detection based on config.
 """
 
-import uuid
-from datetime import datetime
-from urllib.parse import urlparse
+import secrets
+import time
+from collections.abc import AsyncIterator
+from types import MappingProxyType
 
-import httpx
 from temporalio import activity
 
+from app.core.http import get_shared_async_client
 from app.core.services.storage.schemas import UploadRequest
 from app.core.services.storage.service import get_storage
 from app.temporal.schemas import StorageUploadInput, StorageUploadOutput
 
+# Per-day cached UTC date prefix, same fast path as the storage providers
+_date_prefix_cache: dict[int, str] = {}
+
+
+def _date_prefix() -> str:
+    """Get today's 'YYYY/MM/DD' UTC prefix, formatted at most once per day."""
+    day = int(time.time()) // 86400
+    prefix = _date_prefix_cache.get(day)
+    if prefix is None:
+        _date_prefix_cache.clear()
+        prefix = time.strftime('%Y/%m/%d', time.gmtime())
+        _date_prefix_cache[day] = prefix
+    return prefix
+
 
 def generate_key(folder: str, extension: str) -> str:
     """Generate a unique storage key."""
-    date_prefix = datetime.utcnow().strftime('%Y/%m/%d')
-    unique_id = uuid.uuid4().hex[:12]
-    return f'{folder}/{date_prefix}/{unique_id}.{extension}'
+    return f'{folder}/{_date_prefix()}/{secrets.token_hex(6)}.{extension}'
 
 
-def get_extension_from_content_type(content_type: str) -> str:
-    """Get file extension from content type."""
-    mapping = {
+# Extension lookup tables, built once at import time and frozen so no caller
+# can mutate the shared mappings; both run on every upload
+_CT_TO_EXT = MappingProxyType(
+    {
         'image/png': 'png',
         'image/jpeg': 'jpg',
         'image/webp': 'webp',
@@ -36,19 +50,26 @@ def get_extension_from_content_type(content_type: str) -> str:
         'audio/wav': 'wav',
         'audio/ogg': 'ogg',
     }
+)
+
+_URL_EXTENSIONS = frozenset({'mp4', 'webm', 'mov', 'png', 'jpg', 'jpeg', 'webp', 'gif', 'mp3', 'wav', 'ogg'})
+
+
+def get_extension_from_content_type(content_type: str) -> str:
+    """Get file extension from content type."""
     # Handle content types with parameters like 'video/mp4; charset=utf-8'
-    base_type = content_type.split(';')[0].strip().lower()
-    return mapping.get(base_type, 'bin')
+    return _CT_TO_EXT.get(content_type.split(';', 1)[0].strip().lower(), 'bin')
 
 
 def get_extension_from_url(url: str) -> str | None:
     """Try to get extension from URL path."""
-    parsed = urlparse(url)
-    path = parsed.path
-    if '.' in path:
-        ext = path.rsplit('.', 1)[-1].lower()
-        if ext in ('mp4', 'webm', 'mov', 'png', 'jpg', 'jpeg', 'webp', 'gif', 'mp3', 'wav', 'ogg'):
-            return ext
+    # Strip query/fragment without paying for a full urlparse; a bogus
+    # candidate (no dot, or a dot before a path separator) never matches
+    # the allow-list below
+    path = url.partition('?')[0].partition('#')[0]
+    ext = path.rpartition('.')[2].lower()
+    if ext in _URL_EXTENSIONS:
+        return ext
     return None
 
 
@@ -61,40 +82,40 @@ async def upload_to_storage(input: StorageUploadInput) -> StorageUploadOutput:
     2. File extension in the URL path
     3. Falls back to 'bin' if unknown
     """
-    activity.logger.info(f'Uploading from URL: {input.url[:50]}...')
+    activity.logger.debug('Uploading from URL: %.50s...', input.url)
 
     # First, try to get extension from URL
     url_extension = get_extension_from_url(input.url)
 
-    # Download the file and get content type
-    async with httpx.AsyncClient(timeout=300.0) as client:
-        response = await client.get(input.url, follow_redirects=True)
+    storage = get_storage()
+
+    # Stream the download straight into a multipart upload: response chunks
+    # are forwarded as they arrive, so peak memory stays at chunk size rather
+    # than the whole file
+    client = get_shared_async_client()
+    async with client.stream('GET', input.url) as response:
         response.raise_for_status()
-        data = response.content
         content_type = response.headers.get('content-type', '')
 
-    # Determine extension: prefer content-type, then URL, then default
-    if content_type:
-        extension = get_extension_from_content_type(content_type)
-        if extension == 'bin' and url_extension:
+        # Determine extension: prefer content-type, then URL, then default
+        if content_type:
+            extension = get_extension_from_content_type(content_type)
+            if extension == 'bin' and url_extension:
+                extension = url_extension
+        elif url_extension:
             extension = url_extension
-    elif url_extension:
-        extension = url_extension
-    else:
-        extension = 'bin'
+        else:
+            extension = 'bin'
 
-    key = generate_key(input.folder, extension)
+        key = generate_key(input.folder, extension)
 
-    storage = get_storage()
-    result = await storage.upload(
-        UploadRequest(
-            data=data,
+        result = await storage.upload_stream(
             key=key,
             content_type=content_type or 'application/octet-stream',
+            stream=response.aiter_bytes(),
         )
-    )
 
-    activity.logger.info(f'Uploaded to: {result.key}')
+    activity.logger.debug('Uploaded to: %s', result.key)
 
     return StorageUploadOutput(url=result.url, key=result.key)
 
@@ -125,3 +146,33 @@ async def upload_bytes_to_storage(
     )
 
     return result.url
+
+
+async def upload_stream_to_storage(
+    stream: AsyncIterator[bytes],
+    content_type: str,
+    folder: str = 'uploads',
+    extension: str | None = None,
+) -> str:
+    """Upload an async byte stream to storage without buffering it in full.
+
+    Chunks flow straight into the provider's multipart upload as the
+    producer yields them, so peak memory stays at part size and the upload
+    overlaps with generation instead of waiting for it to finish.
+
+    This is a helper function called directly from other activities.
+    NOT a Temporal activity - use upload_to_storage for that.
+    """
+    if extension is None:
+        extension = get_extension_from_content_type(content_type)
+
+    key = generate_key(folder, extension)
+    storage = get_storage()
+
+    result = await storage.upload_stream(
+        key=key,
+        content_type=content_type,
+        stream=stream,
+    )
+
+    return result.url
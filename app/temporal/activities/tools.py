@@ -4,18 +4,33 @@ These activities allow workflows to execute any registered tool
 by ID with validated input parameters.
 """
 
+import asyncio
+import inspect
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from temporalio import activity
 
 from app.core.tools.registry import tool_registry
 from app.temporal.registry import ensure_tools_registered
 
 
+# Cached list_available_tools payload paired with the registry version it was
+# built from; the catalog is static after startup, so UI polls normally hit
+# the cache and skip rebuilding ~N dicts per call
+class _ToolsPayloadCache:
+    """Holder for the cached tool-list payload and its registry version."""
+
+    entry: tuple[int, list[dict[str, Any]]] | None = None
+
+
 class ExecuteToolInput(BaseModel):
     """Input for executing a tool."""
 
+    # Built once per activity call and never mutated; frozen instances skip
+    # mutation bookkeeping in pydantic-core
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     tool_id: str = Field(..., description='ID of the tool to execute')
     params: dict[str, Any] = Field(
         default_factory=dict,
@@ -26,6 +41,8 @@ class ExecuteToolInput(BaseModel):
 class ExecuteToolOutput(BaseModel):
     """Output from tool execution."""
 
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     tool_id: str = Field(..., description='ID of the tool that was executed')
     success: bool = Field(..., description='Whether execution was successful')
     output: dict[str, Any] = Field(
@@ -54,7 +71,7 @@ async def execute_tool(input: ExecuteToolInput) -> ExecuteToolOutput:
     Raises:
         ValueError: If tool is not found
     """
-    activity.logger.info(f'Executing tool: {input.tool_id}')
+    activity.logger.info('Executing tool: %s', input.tool_id)
 
     # Ensure tools are registered
     ensure_tools_registered()
@@ -62,14 +79,23 @@ async def execute_tool(input: ExecuteToolInput) -> ExecuteToolOutput:
     # Get the tool
     tool = tool_registry.get_or_raise(input.tool_id)
 
+    loop = asyncio.get_running_loop()
+
     try:
-        # Validate and parse input
-        tool_input = tool.validate_input(input.params)
+        # Validate and parse input. Pydantic validation of large nested params
+        # is synchronous CPU work, so it runs off the event loop to keep the
+        # worker scheduling other concurrent activities.
+        tool_input = await loop.run_in_executor(None, tool.validate_input, input.params)
 
-        # Execute the tool
-        result = await tool.execute(tool_input)
+        # Execute the tool (in the executor too if an implementation is sync)
+        if inspect.iscoroutinefunction(tool.execute):
+            result = await tool.execute(tool_input)
+        else:
+            # The guard above proves execute is sync here, but the interface
+            # annotates it as a coroutine function, so mypy can't narrow it
+            result = await loop.run_in_executor(None, tool.execute, tool_input)  # type: ignore[arg-type]
 
-        activity.logger.info(f'Tool {input.tool_id} completed: success={result.success}')
+        activity.logger.info('Tool %s completed: success=%s', input.tool_id, result.success)
 
         return ExecuteToolOutput(
             tool_id=input.tool_id,
@@ -79,7 +105,7 @@ async def execute_tool(input: ExecuteToolInput) -> ExecuteToolOutput:
         )
 
     except Exception as e:
-        activity.logger.error(f'Tool {input.tool_id} failed: {e}')
+        activity.logger.error('Tool %s failed: %s', input.tool_id, e)
         return ExecuteToolOutput(
             tool_id=input.tool_id,
             success=False,
@@ -97,7 +123,12 @@ async def list_available_tools() -> list[dict[str, Any]]:
     """
     ensure_tools_registered()
 
-    return [
+    version = tool_registry.version
+    cached = _ToolsPayloadCache.entry
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    payload = [
         {
             'id': tool.id,
             'name': tool.name,
@@ -107,3 +138,5 @@ async def list_available_tools() -> list[dict[str, Any]]:
         }
         for tool in tool_registry.list_all()
     ]
+    _ToolsPayloadCache.entry = (version, payload)
+    return payload
@@ -11,8 +11,8 @@ from typing import Any
 from temporalio import activity
 
 from app.core.ai_models.base import ModelCategory, Provider
-from app.core.ai_models.registry import model_registry
-from app.core.providers.replicate import ReplicateClient
+from app.core.ai_models.registry import ensure_models_registered, model_registry
+from app.core.providers.replicate import get_replicate_client
 from app.temporal.schemas import VideoGenerationInput, VideoGenerationOutput
 
 
@@ -26,7 +26,10 @@ async def generate_video(input: VideoGenerationInput) -> VideoGenerationOutput:
     Raises:
         ValueError: If the model is not found in the registry
     """
-    activity.logger.info(f'Generating video with model: {input.model}')
+    activity.logger.info('Generating video with model: %s', input.model)
+
+    # Ensure models are registered
+    ensure_models_registered()
 
     model_def = model_registry.get(input.model)
     if not model_def:
@@ -41,17 +44,19 @@ async def generate_video(input: VideoGenerationInput) -> VideoGenerationOutput:
 
     typed_input = model_def.validate_input(input_data)
 
-    activity.logger.info(f'Using registered video model: {model_def.name}')
+    activity.logger.info('Using registered video model: %s', model_def.name)
 
     if model_def.supports_provider(Provider.REPLICATE):
         provider_config = model_def.get_provider_config(Provider.REPLICATE)
 
-        client = ReplicateClient()
+        client = get_replicate_client()
         prediction = await client.run(
             model=provider_config.get_full_model_string(),
             input=typed_input.to_replicate(),
             wait=True,
-            poll_interval=5.0,  # Video takes longer
+            poll_interval=1.0,
+            poll_interval_max=15.0,  # Video takes longer; polls back off toward this
+            on_poll=activity.heartbeat,
         )
 
         metrics = prediction.metrics or {}
@@ -77,12 +82,15 @@ async def generate_video_with_model(
         model_input: Dict matching the model's input schema
         provider: Provider to use
     """
+    # Ensure models are registered
+    ensure_models_registered()
+
     model_def = model_registry.get(model_id)
     if not model_def:
         available = [m.id for m in model_registry.list_by_category(ModelCategory.VIDEO)]
         raise ValueError(f"Model '{model_id}' not found in registry. Available video models: {available}")
 
-    activity.logger.info(f'Generating video with {model_def.name} via {provider}')
+    activity.logger.info('Generating video with %s via %s', model_def.name, provider)
 
     typed_input = model_def.validate_input(model_input)
     provider_enum = Provider(provider)
@@ -96,12 +104,14 @@ async def generate_video_with_model(
     provider_config = model_def.get_provider_config(provider_enum)
 
     if provider_enum == Provider.REPLICATE:
-        client = ReplicateClient()
+        client = get_replicate_client()
         prediction = await client.run(
             model=provider_config.get_full_model_string(),
             input=typed_input.to_replicate(),
             wait=True,
-            poll_interval=5.0,
+            poll_interval=1.0,
+            poll_interval_max=15.0,
+            on_poll=activity.heartbeat,
         )
 
         metrics = prediction.metrics or {}
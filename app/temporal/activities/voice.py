@@ -7,9 +7,13 @@ from temporalio import activity
 
 from app.core.services.voice.schemas import VoiceGenerationRequest, VoiceModel, VoiceProvider
 from app.core.services.voice.service import get_voice_service
-from app.temporal.activities.storage import upload_bytes_to_storage
+from app.temporal.activities.storage import upload_stream_to_storage
 from app.temporal.schemas import VoiceGenerationInput, VoiceGenerationOutput
 
+# Duration estimate: ~150 words per minute at ~5 chars per word, folded to
+# seconds-per-character so the estimate is one multiply
+_SEC_PER_CHAR = 60.0 / (5 * 150)
+
 
 @activity.defn
 async def generate_voice(input: VoiceGenerationInput) -> VoiceGenerationOutput:
@@ -17,49 +21,37 @@ async def generate_voice(input: VoiceGenerationInput) -> VoiceGenerationOutput:
 
     Uses the existing VoiceService for generation and uploads to S3.
     """
-    activity.logger.info(f'Generating voice with voice_id: {input.voice_id}')
+    activity.logger.info('Generating voice with voice_id: %s', input.voice_id)
 
+    # Shared per-provider service; its HTTP pool lives until worker shutdown
     service = get_voice_service(VoiceProvider.ELEVENLABS)
 
-    try:
-        voice = VoiceModel(
-            provider=VoiceProvider.ELEVENLABS,
-            model_id=input.model_id,
-            voice_id=input.voice_id,
-        )
-
-        request = VoiceGenerationRequest(
-            text=input.text,
-            voice=voice,
-        )
-
-        # Note: The current ElevenLabs service returns bytes in output_data
-        # We need to stream and upload to S3
-        # For now, use the streaming approach
-
-        audio_chunks: list[bytes] = []
-        async for chunk in service.generate_stream(request):
-            audio_chunks.append(chunk)
+    voice = VoiceModel(
+        provider=VoiceProvider.ELEVENLABS,
+        model_id=input.model_id,
+        voice_id=input.voice_id,
+    )
 
-        audio_bytes = b''.join(audio_chunks)
+    request = VoiceGenerationRequest(
+        text=input.text,
+        voice=voice,
+    )
 
-        # Upload to S3
-        output_url = await upload_bytes_to_storage(
-            data=audio_bytes,
-            content_type='audio/mpeg',
-            folder='voice',
-            extension='mp3',
-        )
+    # TTS chunks flow straight into the multipart upload as they arrive:
+    # no full-audio buffer, and upload overlaps with generation
+    output_url = await upload_stream_to_storage(
+        stream=service.generate_stream(request),
+        content_type='audio/mpeg',
+        folder='voice',
+        extension='mp3',
+    )
 
-        # Estimate duration (rough: ~150 words per minute, ~5 chars per word)
-        estimated_duration = len(input.text) / 5 / 150 * 60
+    estimated_duration = len(input.text) * _SEC_PER_CHAR
 
-        return VoiceGenerationOutput(
-            output_url=output_url,
-            duration_seconds=estimated_duration,
-        )
-    finally:
-        await service.close()
+    return VoiceGenerationOutput(
+        output_url=output_url,
+        duration_seconds=estimated_duration,
+    )
 
 
 @activity.defn
@@ -81,46 +73,39 @@ async def generate_voice_with_options(
         stability: Voice stability (0-1)
         similarity_boost: Similarity boost (0-1)
     """
-    activity.logger.info(f'Generating voice with {provider}')
+    activity.logger.info('Generating voice with %s', provider)
 
     provider_enum = VoiceProvider(provider)
     service = get_voice_service(provider_enum)
 
-    try:
-        voice = VoiceModel(
-            provider=provider_enum,
-            model_id=model_id,
-            voice_id=voice_id,
-        )
-
-        request = VoiceGenerationRequest(
-            text=text,
-            voice=voice,
-        )
-
-        # Update settings if supported
-        if hasattr(request, 'settings') and request.settings:
-            request.settings.stability = stability
-            request.settings.similarity_boost = similarity_boost
-
-        audio_chunks: list[bytes] = []
-        async for chunk in service.generate_stream(request):
-            audio_chunks.append(chunk)
-
-        audio_bytes = b''.join(audio_chunks)
-
-        output_url = await upload_bytes_to_storage(
-            data=audio_bytes,
-            content_type='audio/mpeg',
-            folder='voice',
-            extension='mp3',
-        )
-
-        estimated_duration = len(text) / 5 / 150 * 60
-
-        return VoiceGenerationOutput(
-            output_url=output_url,
-            duration_seconds=estimated_duration,
-        )
-    finally:
-        await service.close()
+    voice = VoiceModel(
+        provider=provider_enum,
+        model_id=model_id,
+        voice_id=voice_id,
+    )
+
+    request = VoiceGenerationRequest(
+        text=text,
+        voice=voice,
+    )
+
+    # Update settings if supported
+    if hasattr(request, 'settings') and request.settings:
+        request.settings.stability = stability
+        request.settings.similarity_boost = similarity_boost
+
+    # TTS chunks flow straight into the multipart upload as they arrive:
+    # no full-audio buffer, and upload overlaps with generation
+    output_url = await upload_stream_to_storage(
+        stream=service.generate_stream(request),
+        content_type='audio/mpeg',
+        folder='voice',
+        extension='mp3',
+    )
+
+    estimated_duration = len(text) * _SEC_PER_CHAR
+
+    return VoiceGenerationOutput(
+        output_url=output_url,
+        duration_seconds=estimated_duration,
+    )
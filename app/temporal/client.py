@@ -28,8 +28,9 @@ Authentication:
     )
 """
 
+import asyncio
 import logging
-import uuid
+import secrets
 from typing import Any, TypeVar
 
 from temporalio.client import Client, WorkflowHandle
@@ -48,27 +49,46 @@ class _ClientHolder:
     instance: Client | None = None
 
 
+_connect_lock = asyncio.Lock()
+
+
 async def get_temporal_client() -> Client:
     """Get or create the Temporal client.
 
-    Uses a singleton pattern to reuse connections.
+    Double-checked locking keeps concurrent cold-start callers from each
+    running Client.connect and leaking duplicate TLS connections; the
+    fast path after initialization is a single attribute read.
     """
     if _ClientHolder.instance is None:
-        logger.info('Connecting to Temporal at %s...', app_config.TEMPORAL_HOST)
+        async with _connect_lock:
+            if _ClientHolder.instance is None:
+                logger.info('Connecting to Temporal at %s...', app_config.TEMPORAL_HOST)
+
+                try:
+                    _ClientHolder.instance = await Client.connect(
+                        app_config.TEMPORAL_HOST,
+                        namespace=app_config.TEMPORAL_NAMESPACE,
+                        data_converter=pydantic_data_converter,
+                    )
+
+                    logger.info(
+                        'Connected to Temporal successfully (namespace: %s)',
+                        app_config.TEMPORAL_NAMESPACE,
+                    )
+                except Exception:
+                    logger.exception('Failed to connect to Temporal at %s', app_config.TEMPORAL_HOST)
+                    raise
+
+    return _ClientHolder.instance
 
-        try:
-            _ClientHolder.instance = await Client.connect(
-                app_config.TEMPORAL_HOST,
-                namespace=app_config.TEMPORAL_NAMESPACE,
-                data_converter=pydantic_data_converter,
-            )
 
-            logger.info('Connected to Temporal successfully (namespace: %s)', app_config.TEMPORAL_NAMESPACE)
-        except Exception:
-            logger.exception('Failed to connect to Temporal at %s', app_config.TEMPORAL_HOST)
-            raise
+async def warmup_temporal_client() -> None:
+    """Establish the Temporal connection ahead of the first real request.
 
-    return _ClientHolder.instance
+    Call from the API server's startup hook (e.g. FastAPI lifespan) so the
+    first workflow start doesn't pay connect + namespace handshake latency.
+    """
+    await get_temporal_client()
 
 
 async def start_workflow(
@@ -98,7 +118,7 @@ async def start_workflow(
     """
     client = await get_temporal_client()
 
-    workflow_id = id or f'workflow-{uuid.uuid4().hex[:12]}'
+    workflow_id = id or f'workflow-{secrets.token_hex(6)}'
     queue = task_queue or app_config.TEMPORAL_TASK_QUEUE
 
     handle = await client.start_workflow(
@@ -111,6 +131,49 @@ async def start_workflow(
     return handle
 
 
+# Bound for concurrent workflow-start gRPC calls in a batch; keeps a large
+# batch from saturating the Temporal frontend while still pipelining
+# requests on the single multiplexed HTTP/2 connection
+_MAX_CONCURRENT_STARTS = 32
+
+
+async def start_workflows_batch(
+    items: list[tuple[Any, Any] | tuple[Any, Any, str | None]],
+    *,
+    task_queue: str | None = None,
+) -> list[WorkflowHandle]:
+    """Start many workflows concurrently and return their handles in order.
+
+    Starting N workflows in an awaited loop pays N sequential gRPC round
+    trips; gathering them lets the multiplexed connection carry the starts
+    in flight together, bounded by a semaphore.
+
+    Args:
+        items: (workflow, arg) or (workflow, arg, id) tuples; id may be None
+            to auto-generate
+        task_queue: Optional task queue applied to every start
+
+    Returns:
+        WorkflowHandles in the same order as items
+
+    Example:
+        handles = await start_workflows_batch([
+            (MyWorkflow.run, MyInput(name='a')),
+            (MyWorkflow.run, MyInput(name='b'), 'my-explicit-id'),
+        ])
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_STARTS)
+
+    async def _start(item: tuple[Any, ...]) -> WorkflowHandle:
+        workflow, arg, *rest = item
+        async with semaphore:
+            return await start_workflow(workflow, arg, id=rest[0] if rest else None, task_queue=task_queue)
+
+    # Connect once up front so the batch doesn't race the first connection
+    await get_temporal_client()
+    return list(await asyncio.gather(*(_start(item) for item in items)))
+
+
 async def execute_workflow(
     workflow: Any,
     arg: Any,
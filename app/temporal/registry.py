@@ -5,20 +5,44 @@ All workflows, activities, and tools are automatically discovered - no manual re
 """
 
 import importlib
-import inspect
 import logging
 import pkgutil
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# One C-level pass inserts '_' before every interior uppercase letter;
+# replaces the per-character Python loop previously used for snake_casing
+_CAMEL_RE = re.compile(r'(?<!^)(?=[A-Z])')
 
+# Discovery imports run in a small thread pool: the import machinery holds
+# per-module locks, but file I/O and bytecode compilation overlap, so
+# startup pays roughly max-of-imports instead of sum-of-imports
+_IMPORT_WORKERS = 8
+
+
+def _import_parallel(module_names: list[str]) -> dict[str, Any | BaseException]:
+    """Import modules concurrently, mapping each name to its module or error."""
+    if not module_names:
+        return {}
+    with ThreadPoolExecutor(max_workers=_IMPORT_WORKERS) as executor:
+        futures = {name: executor.submit(importlib.import_module, name) for name in module_names}
+    return {name: future.exception() or future.result() for name, future in futures.items()}
+
+
+@cache
 def discover_workflows(package_name: str = 'app.temporal.workflows') -> list[type]:
     """Discover all @workflow.defn decorated classes in a package.
 
     Recursively scans subpackages (e.g., generations/).
     Classes with `__temporal_workflow_definition` attribute are discovered.
+
+    Results are cached per package: discovery is idempotent and repeat
+    calls would otherwise redo the full import + member scan.
     """
     workflows: list[type] = []
 
@@ -45,14 +69,18 @@ def discover_workflows(package_name: str = 'app.temporal.workflows') -> list[typ
             logger.exception(f'Failed to import workflow module {full_module_name}')
             continue
 
-        for _name, obj in inspect.getmembers(module, inspect.isclass):
-            if hasattr(obj, '__temporal_workflow_definition'):
+        # Iterate the module dict directly: getmembers sorts and predicates
+        # every attribute (including the re-exported stdlib names), while the
+        # decorated classes are the only ones carrying the marker attribute
+        for obj in vars(module).values():
+            if getattr(obj, '__temporal_workflow_definition', None) is not None:
                 workflows.append(obj)
                 logger.debug(f'Discovered workflow: {obj.__name__}')
 
     return workflows
 
 
+@cache
 def discover_activities(package_name: str = 'app.temporal.activities') -> list[Any]:
     """Discover all @activity.defn decorated functions in a package.
 
@@ -60,6 +88,7 @@ def discover_activities(package_name: str = 'app.temporal.activities') -> list[A
     `__temporal_activity_definition` attribute.
 
     Import errors are logged AND printed to stderr for visibility.
+    Results are cached per package (discovery is idempotent).
     """
     activities: list[Any] = []
 
@@ -74,29 +103,31 @@ def discover_activities(package_name: str = 'app.temporal.activities') -> list[A
     modules_found: list[str] = []
     modules_failed: list[str] = []
 
-    for _, module_name, is_pkg in pkgutil.iter_modules(package.__path__):
-        if module_name.startswith('_'):
-            continue
+    # Subpackages are skipped: activities are flat
+    module_names = [
+        module_name
+        for _, module_name, is_pkg in pkgutil.iter_modules(package.__path__)
+        if not module_name.startswith('_') and not is_pkg
+    ]
 
-        # Skip subpackages for activities (they're flat)
-        if is_pkg:
-            continue
+    imported = _import_parallel([f'{package_name}.{name}' for name in module_names])
 
+    for module_name in module_names:
         full_module_name = f'{package_name}.{module_name}'
+        module = imported[full_module_name]
 
-        try:
-            module = importlib.import_module(full_module_name)
-            modules_found.append(module_name)
-        except Exception:
+        if isinstance(module, BaseException):
             modules_failed.append(module_name)
             msg = f'Failed to import activity module {full_module_name}'
-            logger.exception(msg)
+            logger.error(msg, exc_info=module)
             print(f'ERROR: {msg}', file=sys.stderr)
             continue
 
-        # Find all activity-decorated functions
-        for name, obj in inspect.getmembers(module, inspect.isfunction):
-            if hasattr(obj, '__temporal_activity_definition'):
+        modules_found.append(module_name)
+
+        # Find all activity-decorated functions (direct dict scan, see above)
+        for name, obj in vars(module).items():
+            if getattr(obj, '__temporal_activity_definition', None) is not None:
                 activities.append(obj)
                 logger.debug(f'Discovered activity: {name} from {module_name}')
 
@@ -108,6 +139,7 @@ def discover_activities(package_name: str = 'app.temporal.activities') -> list[A
     return activities
 
 
+@cache
 def discover_generation_workflows() -> dict[str, type]:
     """Discover all generation workflows and return as a name -> class mapping.
 
@@ -129,22 +161,21 @@ def discover_generation_workflows() -> dict[str, type]:
         name = name.removesuffix('Workflow')  # Remove 'Workflow' suffix
 
         # Convert CamelCase to snake_case
-        key = ''
-        for i, char in enumerate(name):
-            if char.isupper() and i > 0:
-                key += '_'
-            key += char.lower()
+        key = _CAMEL_RE.sub('_', name).lower()
 
         result[key] = workflow_class
 
     return result
 
 
+@cache
 def discover_tools(base_package: str = 'app.core.tools') -> list[str]:
     """Discover and register all tools by scanning subdirectories dynamically.
 
     Scans all subpackages of app/core/tools/ for tool files.
     Each tool file should call `tool_registry.register()` at module level.
+    Cached per base package: re-running discovery would re-import every
+    tool module and rescan the registry for no new information.
 
     Args:
         base_package: Base package path to scan
@@ -170,6 +201,10 @@ def discover_tools(base_package: str = 'app.core.tools') -> list[str]:
     if not hasattr(base, '__path__'):
         return []
 
+    # Gather every tool module name first, then import the whole set in one
+    # parallel pass
+    tool_module_names: list[str] = []
+
     # Dynamically find all subpackages (categories)
     for _, category_name, is_category_pkg in pkgutil.iter_modules(base.__path__):
         # Only scan subpackages, skip modules like base.py, registry.py
@@ -193,17 +228,17 @@ def discover_tools(base_package: str = 'app.core.tools') -> list[str]:
             if module_name.startswith('_') or module_name == 'common' or is_pkg:
                 continue
 
-            full_module_name = f'{category_package}.{module_name}'
-
-            try:
-                importlib.import_module(full_module_name)
-                modules_loaded += 1
-                logger.debug(f'Loaded tool module: {full_module_name}')
-            except Exception:
-                modules_failed.append(full_module_name)
-                msg = f'Failed to import tool module {full_module_name}'
-                logger.exception(msg)
-                print(f'ERROR: {msg}', file=sys.stderr)
+            tool_module_names.append(f'{category_package}.{module_name}')
+
+    for full_module_name, module in _import_parallel(tool_module_names).items():
+        if isinstance(module, BaseException):
+            modules_failed.append(full_module_name)
+            msg = f'Failed to import tool module {full_module_name}'
+            logger.error(msg, exc_info=module)
+            print(f'ERROR: {msg}', file=sys.stderr)
+        else:
+            modules_loaded += 1
+            logger.debug(f'Loaded tool module: {full_module_name}')
 
     # Determine which tools were added
     tools_after = set(tool_registry.list_ids())
@@ -6,6 +6,8 @@ Usage:
 
 import asyncio
 import logging
+import logging.handlers
+import queue
 import signal
 import sys
 from typing import Any
@@ -24,6 +26,25 @@ logging.basicConfig(
 logger = logging.getLogger('temporal.worker')
 
 
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """Move log I/O off the event loop onto a background thread.
+
+    Replaces the root logger's handlers with a QueueHandler; a QueueListener
+    thread drains the queue into the original handlers. Emitting a record then
+    costs one queue put instead of a blocking stream write, so bursts of
+    activity logging can't stall concurrently running activities.
+
+    Returns:
+        The started listener (call .stop() on shutdown to flush)
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    listener = logging.handlers.QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
 def _register_ai_models() -> None:
     """Discover and register all AI models.
 
@@ -37,7 +58,7 @@ def _register_ai_models() -> None:
     # Log per-category breakdown
     for category, model_ids in registered.items():
         if model_ids:
-            logger.info(f'Registered {category} models: {model_ids}')
+            logger.info('Registered %s models: %s', category, model_ids)
 
 
 async def run_worker() -> None:
@@ -51,9 +72,9 @@ async def run_worker() -> None:
     tools = discover_tools()
 
     activity_names = [a.__name__ for a in activities]
-    logger.info(f'Discovered workflows: {[w.__name__ for w in workflows]}')
-    logger.info(f'Discovered activities: {activity_names}')
-    logger.info(f'Discovered tools: {tools}')
+    logger.info('Discovered workflows: %s', [w.__name__ for w in workflows])
+    logger.info('Discovered activities: %s', activity_names)
+    logger.info('Discovered tools: %s', tools)
 
     if not workflows:
         logger.warning('No workflows discovered!')
@@ -61,7 +82,7 @@ async def run_worker() -> None:
     if not activities:
         logger.warning('No activities discovered!')
 
-    logger.info(f'Connecting to Temporal at {app_config.TEMPORAL_HOST}...')
+    logger.info('Connecting to Temporal at %s...', app_config.TEMPORAL_HOST)
 
     # Log auth status
     if app_config.WORKFLOW_SECRET_ENABLED:
@@ -77,7 +98,7 @@ async def run_worker() -> None:
         data_converter=pydantic_data_converter,
     )
 
-    logger.info(f'Connected! Task queue: {app_config.TEMPORAL_TASK_QUEUE}')
+    logger.info('Connected! Task queue: %s', app_config.TEMPORAL_TASK_QUEUE)
 
     worker = Worker(
         client,
@@ -97,16 +118,37 @@ async def run_worker() -> None:
 
     logger.info('Starting worker...')
 
-    async with worker:
-        logger.info(f'Worker started! Registered {len(activities)} activities: {activity_names}')
-        await shutdown_event.wait()
+    # Pre-warm the Sora browser so the first extraction doesn't pay Chromium startup
+    from app.core.services.sora_extraction.service import get_sora_service
+
+    sora_service = get_sora_service()
+    sora_service.warmup()
+
+    try:
+        async with worker:
+            logger.info('Worker started! Registered %d activities: %s', len(activities), activity_names)
+            await shutdown_event.wait()
+    finally:
+        from app.core.http import close_shared_async_client
+        from app.core.services.prompt.service import close_prompt_services
+        from app.core.services.storage import close_storage
+        from app.core.services.voice.service import close_voice_services
+
+        await sora_service.close()
+        await close_prompt_services()
+        await close_voice_services()
+        await close_storage()
+        await close_shared_async_client()
 
 
 def main() -> None:
+    listener = _start_log_listener()
     try:
         asyncio.run(run_worker())
     except KeyboardInterrupt:
         sys.exit(0)
+    finally:
+        listener.stop()
 
 
 if __name__ == '__main__':
@@ -47,11 +47,11 @@ async def main():
             print("⏳ Downloading video...")
 
             if output_path:
-                path = await downloader.download(mp4_url, output_path)
+                path, size_bytes = await downloader.download(mp4_url, output_path)
             else:
-                path = await downloader.download_to_temp(mp4_url)
+                path, size_bytes = await downloader.download_to_temp(mp4_url)
 
-            size_mb = path.stat().st_size / (1024*1024)
+            size_mb = size_bytes / (1024*1024)
             print(f'\n✅ Download complete!')
             print(f'   Path: {path}')
             print(f'   Size: {size_mb:.2f} MB\n')
@@ -71,12 +71,12 @@ async def main():
         try:
             print("⏳ Launching browser & extracting video...")
 
-            result_path = await service.extract_and_download(
+            result_path, size_bytes = await service.extract_and_download(
                 sora_share_url=sora_url,
                 output_path=output_path,
             )
 
-            size_mb = result_path.stat().st_size / (1024*1024)
+            size_mb = size_bytes / (1024*1024)
             print(f'\n✅ Download complete!')
             print(f'   Path: {result_path}')
             print(f'   Size: {size_mb:.2f} MB\n')
@@ -161,12 +161,12 @@ async def main():
 
     async with SoraExtractionService(headless=False) as service:
         try:
-            result_path = await service.extract_and_download(
+            result_path, size_bytes = await service.extract_and_download(
                 sora_share_url=sora_url,
                 output_path=output_path,
             )
 
-            size_mb = result_path.stat().st_size / (1024*1024)
+            size_mb = size_bytes / (1024*1024)
             print(f'\n{"="*60}')
             print(f'DOWNLOAD COMPLETE (WATERMARKED)')
             print(f'{"="*60}')
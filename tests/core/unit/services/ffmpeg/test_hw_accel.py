@@ -0,0 +1,61 @@
+"""Tests for hardware encoder detection."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.services.ffmpeg import HwAccel
+from app.core.services.ffmpeg.service import _detect_hw_accel, _HwAccelCache
+
+
+def _fake_process(returncode: int, stdout: bytes = b'') -> AsyncMock:
+    process = AsyncMock()
+    process.communicate.return_value = (stdout, b'')
+    process.wait.return_value = returncode
+    return process
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache():
+    _HwAccelCache.resolved = None
+    yield
+    _HwAccelCache.resolved = None
+
+
+class TestDetectHwAccel:
+    """Tests for _detect_hw_accel probe validation."""
+
+    @pytest.mark.asyncio
+    async def test_selects_candidate_when_probe_encode_succeeds(self):
+        """A listed backend is selected only after its probe encode passes."""
+        calls = [
+            _fake_process(0, stdout=b'Hardware acceleration methods:\ncuda\nqsv\n'),
+            _fake_process(0),  # cuda probe encode succeeds
+        ]
+        with patch('asyncio.create_subprocess_exec', side_effect=calls):
+            assert await _detect_hw_accel() is HwAccel.CUDA
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_probe_encode_fails(self):
+        """A compiled-in but unusable backend (no GPU) is never selected."""
+        calls = [
+            _fake_process(0, stdout=b'Hardware acceleration methods:\ncuda\n'),
+            _fake_process(1),  # cuda probe encode fails (e.g. Cannot load libcuda)
+        ]
+        with patch('asyncio.create_subprocess_exec', side_effect=calls):
+            assert await _detect_hw_accel() is HwAccel.NONE
+
+    @pytest.mark.asyncio
+    async def test_missing_ffmpeg_falls_back_to_software(self):
+        """An unavailable ffmpeg binary resolves to software encoding."""
+        with patch('asyncio.create_subprocess_exec', side_effect=OSError):
+            assert await _detect_hw_accel() is HwAccel.NONE
+
+    @pytest.mark.asyncio
+    async def test_result_is_cached(self):
+        """Detection runs its subprocesses once; later calls hit the cache."""
+        calls = [_fake_process(0, stdout=b'')]
+        with patch('asyncio.create_subprocess_exec', side_effect=calls) as mock_exec:
+            assert await _detect_hw_accel() is HwAccel.NONE
+            assert await _detect_hw_accel() is HwAccel.NONE
+        assert mock_exec.call_count == 1
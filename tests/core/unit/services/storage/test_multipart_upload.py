@@ -0,0 +1,148 @@
+"""Tests for streaming multipart upload plumbing (S3 provider).
+
+The R2 provider uses an identical _rechunk/_multipart_upload implementation.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from botocore.exceptions import ClientError
+
+from app.core.services.storage.providers.s3.service import S3StorageService, _rechunk
+
+PART_SIZE = 5
+
+
+async def _iter_chunks(chunks: list[bytes]):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _collect(stream) -> list[bytes]:
+    return [chunk async for chunk in stream]
+
+
+class TestRechunk:
+    """Tests for re-batching arbitrary chunks into full-size parts."""
+
+    @pytest.mark.asyncio
+    async def test_small_chunks_are_coalesced(self):
+        """Tiny source chunks are merged into part-size pieces."""
+        chunks = await _collect(_rechunk(_iter_chunks([b'ab', b'cd', b'ef', b'gh']), PART_SIZE))
+        assert chunks == [b'abcde', b'fgh']
+
+    @pytest.mark.asyncio
+    async def test_large_chunks_are_split(self):
+        """An oversized source chunk is split into part-size pieces."""
+        chunks = await _collect(_rechunk(_iter_chunks([b'abcdefghijkl']), PART_SIZE))
+        assert chunks == [b'abcde', b'fghij', b'kl']
+
+    @pytest.mark.asyncio
+    async def test_empty_source(self):
+        """An empty source yields no parts."""
+        assert await _collect(_rechunk(_iter_chunks([]), PART_SIZE)) == []
+
+
+class _FakeS3:
+    """Minimal S3 client capturing multipart calls; select parts can fail."""
+
+    def __init__(self, fail_parts: set[int] | None = None):
+        self.uploaded_parts: list[int] = []
+        self.completed_parts: list[dict] | None = None
+        self.aborted = False
+        self._fail_parts = fail_parts or set()
+
+    async def create_multipart_upload(self, **kwargs):
+        return {'UploadId': 'upload-1'}
+
+    async def upload_part(self, *, PartNumber, Body, **kwargs):  # noqa: N803
+        if PartNumber in self._fail_parts:
+            # Non-retryable code so _with_retries propagates immediately
+            raise ClientError({'Error': {'Code': 'AccessDenied'}}, 'UploadPart')
+        self.uploaded_parts.append(PartNumber)
+        return {'ETag': f'etag-{PartNumber}'}
+
+    async def complete_multipart_upload(self, *, MultipartUpload, **kwargs):  # noqa: N803
+        self.completed_parts = MultipartUpload['Parts']
+
+    async def abort_multipart_upload(self, **kwargs):
+        self.aborted = True
+
+
+def _service(max_concurrency: int = 2) -> S3StorageService:
+    # _multipart_upload only touches max_concurrency on self; skip __init__
+    # so no credentials are needed
+    return SimpleNamespace(max_concurrency=max_concurrency)  # type: ignore[return-value]
+
+
+async def _yielding_source(chunks: list[bytes], consumed: list[bytes]):
+    for chunk in chunks:
+        # Let in-flight part tasks run between chunks, like a real
+        # network/pipe source would
+        await asyncio.sleep(0)
+        consumed.append(chunk)
+        yield chunk
+
+
+class TestMultipartUpload:
+    """Tests for the concurrent multipart upload loop."""
+
+    @pytest.mark.asyncio
+    async def test_uploads_all_parts_and_completes(self):
+        """All parts are uploaded, ordered, and the upload is completed."""
+        s3 = _FakeS3()
+        consumed: list[bytes] = []
+        total = await S3StorageService._multipart_upload(
+            _service(),
+            s3,
+            'key',
+            _yielding_source([b'aaaaa', b'bbbbb', b'cc'], consumed),
+            {'Bucket': 'bucket', 'Key': 'key', 'ContentType': 'video/mp4'},
+        )
+
+        assert total == 12
+        assert sorted(s3.uploaded_parts) == [1, 2, 3]
+        assert [p['PartNumber'] for p in s3.completed_parts] == [1, 2, 3]
+        assert not s3.aborted
+
+    @pytest.mark.asyncio
+    async def test_part_failure_aborts_and_stops_consuming(self):
+        """A failed part aborts the upload without draining the source."""
+        s3 = _FakeS3(fail_parts={1})
+        consumed: list[bytes] = []
+        source = _yielding_source([b'x' * PART_SIZE] * 50, consumed)
+
+        with pytest.raises(ClientError):
+            await S3StorageService._multipart_upload(
+                _service(),
+                s3,
+                'key',
+                source,
+                {'Bucket': 'bucket', 'Key': 'key', 'ContentType': 'video/mp4'},
+            )
+
+        assert s3.aborted
+        assert s3.completed_parts is None
+        # The producer noticed the failure instead of consuming all 50 parts
+        assert len(consumed) < 50
+
+    @pytest.mark.asyncio
+    async def test_part_failure_settles_sibling_tasks(self):
+        """Sibling part tasks are awaited before the abort, not orphaned."""
+        s3 = _FakeS3(fail_parts={2})
+        consumed: list[bytes] = []
+
+        with pytest.raises(ClientError):
+            await S3StorageService._multipart_upload(
+                _service(max_concurrency=4),
+                s3,
+                'key',
+                _yielding_source([b'x' * PART_SIZE] * 8, consumed),
+                {'Bucket': 'bucket', 'Key': 'key', 'ContentType': 'video/mp4'},
+            )
+
+        # Nothing left running on the loop besides this test
+        pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        assert pending == []
+        assert s3.aborted
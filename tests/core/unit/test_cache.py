@@ -0,0 +1,165 @@
+"""Tests for the shared TTL + LRU cache and single-flight coalescing."""
+
+import asyncio
+import itertools
+
+import pytest
+
+from app.core.cache import SingleFlight, TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock; advance via clock['now'] += seconds."""
+    state = {'now': 1000.0}
+    monkeypatch.setattr('app.core.cache.time.monotonic', lambda: state['now'])
+    return state
+
+
+class TestTTLCache:
+    """Tests for TTL expiry and LRU eviction."""
+
+    def test_get_missing_key_returns_none(self):
+        cache: TTLCache[str] = TTLCache()
+        assert cache.get('absent') is None
+
+    def test_put_then_get_returns_value(self):
+        cache: TTLCache[str] = TTLCache()
+        cache.put('key', 'value')
+        assert cache.get('key') == 'value'
+
+    def test_entry_expires_after_ttl(self, clock):
+        cache: TTLCache[str] = TTLCache(ttl_seconds=60.0)
+        cache.put('key', 'value')
+        clock['now'] += 59.0
+        assert cache.get('key') == 'value'
+        clock['now'] += 2.0
+        assert cache.get('key') is None
+
+    def test_put_refreshes_entry_timestamp(self, clock):
+        cache: TTLCache[str] = TTLCache(ttl_seconds=60.0)
+        cache.put('key', 'old')
+        clock['now'] += 50.0
+        cache.put('key', 'new')
+        clock['now'] += 50.0
+        assert cache.get('key') == 'new'
+
+    def test_eviction_drops_least_recently_used(self):
+        cache: TTLCache[int] = TTLCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('c', 3)
+        assert cache.get('a') is None
+        assert cache.get('b') == 2
+        assert cache.get('c') == 3
+
+    def test_get_refreshes_recency(self):
+        cache: TTLCache[int] = TTLCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+
+    def test_size_stays_bounded(self):
+        cache: TTLCache[int] = TTLCache(max_entries=8)
+        for i in itertools.islice(itertools.count(), 100):
+            cache.put(i, i)
+        assert sum(1 for i in range(100) if cache.get(i) is not None) == 8
+
+
+class TestSingleFlight:
+    """Tests for coalescing concurrent identical calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self):
+        """Callers arriving while a key is in flight share one execution."""
+        flight: SingleFlight[str] = SingleFlight()
+        calls = 0
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def upstream() -> str:
+            nonlocal calls
+            calls += 1
+            started.set()
+            await release.wait()
+            return 'result'
+
+        first = asyncio.ensure_future(flight.run('key', upstream))
+        await started.wait()
+        second = asyncio.ensure_future(flight.run('key', upstream))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(first, second) == ['result', 'result']
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_different_keys_do_not_coalesce(self):
+        flight: SingleFlight[str] = SingleFlight()
+
+        async def upstream(value: str) -> str:
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(
+            flight.run('a', lambda: upstream('one')),
+            flight.run('b', lambda: upstream('two')),
+        )
+        assert results == ['one', 'two']
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_to_all_waiters(self):
+        """The leader's exception is raised in every coalesced waiter."""
+        flight: SingleFlight[str] = SingleFlight()
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def upstream() -> str:
+            started.set()
+            await release.wait()
+            raise RuntimeError('upstream failed')
+
+        first = asyncio.ensure_future(flight.run('key', upstream))
+        await started.wait()
+        second = asyncio.ensure_future(flight.run('key', upstream))
+        await asyncio.sleep(0)
+        release.set()
+
+        with pytest.raises(RuntimeError, match='upstream failed'):
+            await first
+        with pytest.raises(RuntimeError, match='upstream failed'):
+            await second
+
+    @pytest.mark.asyncio
+    async def test_key_cleared_after_completion(self):
+        """A new call after completion runs upstream again."""
+        flight: SingleFlight[int] = SingleFlight()
+        calls = 0
+
+        async def upstream() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.run('key', upstream) == 1
+        assert await flight.run('key', upstream) == 2
+        assert flight._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_key_cleared_after_failure(self):
+        """A failed call does not wedge the key; the next call retries."""
+        flight: SingleFlight[str] = SingleFlight()
+
+        async def failing() -> str:
+            raise RuntimeError('boom')
+
+        async def succeeding() -> str:
+            return 'ok'
+
+        with pytest.raises(RuntimeError, match='boom'):
+            await flight.run('key', failing)
+        assert flight._inflight == {}
+        assert await flight.run('key', succeeding) == 'ok'
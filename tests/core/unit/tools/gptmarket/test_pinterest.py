@@ -0,0 +1,151 @@
+"""Tests for the GPTMarket Pinterest scraper's streaming JSON parse."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.core.configs import app_config
+from app.core.tools.gptmarket.pinterest import (
+    GptMarketPinterestScraperInput,
+    _AsyncByteReader,
+    get_tool,
+)
+
+
+async def _iter_chunks(data: bytes, chunk_size: int):
+    for offset in range(0, len(data), chunk_size):
+        yield data[offset : offset + chunk_size]
+
+
+class TestAsyncByteReader:
+    """Tests for the ijson async file-like adapter."""
+
+    @pytest.mark.asyncio
+    async def test_read_all(self):
+        """A negative size returns whole chunks until exhaustion."""
+        reader = _AsyncByteReader(_iter_chunks(b'hello world', 4))
+        collected = b''
+        while chunk := await reader.read():
+            collected += chunk
+        assert collected == b'hello world'
+
+    @pytest.mark.asyncio
+    async def test_read_respects_size(self):
+        """read(n) never returns more than n bytes and buffers the rest."""
+        reader = _AsyncByteReader(_iter_chunks(b'abcdefgh', 5))
+        collected = b''
+        while chunk := await reader.read(3):
+            assert len(chunk) <= 3
+            collected += chunk
+        assert collected == b'abcdefgh'
+
+    @pytest.mark.asyncio
+    async def test_read_at_eof_returns_empty(self):
+        """Reads past the end keep returning b''."""
+        reader = _AsyncByteReader(_iter_chunks(b'x', 1))
+        assert await reader.read() == b'x'
+        assert await reader.read() == b''
+        assert await reader.read() == b''
+
+
+class _FakeStreamResponse:
+    """Streaming httpx response stand-in yielding the body in small chunks."""
+
+    def __init__(self, body: bytes, status_code: int = 200):
+        self._body = body
+        self.status_code = status_code
+
+    async def aiter_bytes(self):
+        async for chunk in _iter_chunks(self._body, 7):
+            yield chunk
+
+    async def aread(self) -> bytes:
+        return self._body
+
+
+class _FakeStreamContext:
+    def __init__(self, response: _FakeStreamResponse):
+        self._response = response
+
+    async def __aenter__(self) -> _FakeStreamResponse:
+        return self._response
+
+    async def __aexit__(self, *args) -> None:
+        return None
+
+
+class _FakeClient:
+    def __init__(self, response: _FakeStreamResponse):
+        self._response = response
+
+    def stream(self, *args, **kwargs) -> _FakeStreamContext:
+        return _FakeStreamContext(self._response)
+
+
+def _scrape_body() -> bytes:
+    return json.dumps(
+        {
+            'data': {
+                'metadata': {'total_pins': 3, 'search_query': 'cats'},
+                'data': {
+                    'pins': [
+                        {
+                            'id': 'pin-1',
+                            'title': 'Portrait pin',
+                            'image_url': 'https://example.com/1.jpg',
+                            'aspect_ratio': '9:16',
+                            'image_width': 900,
+                            'image_height': 1600,
+                        },
+                        # Filtered out: wrong aspect ratio
+                        {
+                            'id': 'pin-2',
+                            'image_url': 'https://example.com/2.jpg',
+                            'aspect_ratio': '16:9',
+                        },
+                        # Filtered out: missing image_url
+                        {
+                            'id': 'pin-3',
+                            'aspect_ratio': '9:16',
+                        },
+                    ]
+                },
+            }
+        }
+    ).encode()
+
+
+class TestPinterestScraperExecute:
+    """Tests for the streaming parse path in execute()."""
+
+    @pytest.mark.asyncio
+    async def test_execute_parses_streamed_pins(self):
+        """Pins and metadata are parsed from a chunked response body."""
+        fake_client = _FakeClient(_FakeStreamResponse(_scrape_body()))
+
+        with (
+            patch.object(app_config, 'GPTMARKET_API_KEY', 'test-key'),
+            patch('app.core.http.get_shared_async_client', return_value=fake_client),
+        ):
+            result = await get_tool().execute(GptMarketPinterestScraperInput(search_query='cats'))
+
+        assert result.success
+        assert [pin.id for pin in result.pins] == ['pin-1']
+        assert result.pins[0].image_url == 'https://example.com/1.jpg'
+        assert result.total == 3
+        assert result.query == 'cats'
+
+    @pytest.mark.asyncio
+    async def test_execute_api_error(self):
+        """Non-2xx responses surface as a failure output, not an exception."""
+        fake_client = _FakeClient(_FakeStreamResponse(b'{"error": "nope"}', status_code=500))
+
+        with (
+            patch.object(app_config, 'GPTMARKET_API_KEY', 'test-key'),
+            patch('app.core.http.get_shared_async_client', return_value=fake_client),
+        ):
+            result = await get_tool().execute(GptMarketPinterestScraperInput(search_query='cats'))
+
+        assert not result.success
+        assert 'API error: 500' in result.error
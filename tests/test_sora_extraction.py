@@ -105,12 +105,13 @@ class TestVideoDownloader:
             mock_get.return_value.__aenter__.return_value = mock_response
 
             downloader = VideoDownloader()
-            path = await downloader.download_to_temp(
+            path, size_bytes = await downloader.download_to_temp(
                 "https://video-cdn.openai.com/test.mp4"
             )
 
             assert path.exists()
             assert path.suffix == ".mp4"
+            assert size_bytes == len(b'test_chunk')
             # Clean up
             path.unlink(missing_ok=True)
             path.parent.rmdir()
@@ -129,15 +130,16 @@ class TestSoraExtractionService:
         ) as mock_download:
             mock_get_url.return_value = "https://video-cdn.openai.com/test.mp4"
             output_path = Path("/tmp/test_video.mp4")
-            mock_download.return_value = output_path
+            mock_download.return_value = (output_path, 1024)
 
             service = SoraExtractionService()
-            result = await service.extract_and_download(
+            result, size_bytes = await service.extract_and_download(
                 "https://sora.chatgpt.com/share/test",
                 output_path=output_path,
             )
 
             assert result == output_path
+            assert size_bytes == 1024
             mock_download.assert_called_once()
 
     @pytest.mark.asyncio